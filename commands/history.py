@@ -0,0 +1,242 @@
+"""
+Game history.
+The moves of a game from its starting position, stored 16 bits per move,
+plus an archive file of many games with an index for random access.
+"""
+
+from __future__ import annotations
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator
+from commands.move import Move
+from commands.move_executer import MoveExecuter
+from commands.san import move_to_san
+from engine.board import KNIGHT
+from engine.game_state import STARTING_FEN, GameState
+
+# 16-bit move code: to (6 bits), from (6 bits), kind (4 bits). Kinds 0-3 are
+# the MoveFlag values; 4-7 are promotions to knight, bishop, rook, queen.
+_PROMOTION_KIND: int = 4
+
+
+def encode_move(move: Move) -> int:
+    """Pack a move into 16 bits."""
+    kind: int = (
+        move.flag if move.promotion is None else _PROMOTION_KIND + move.promotion - 1
+    )
+    return move.to_square | move.from_square << 6 | kind << 12
+
+
+def decode_move(code: int) -> Move:
+    """Rebuild a move from its 16-bit code."""
+    kind: int = code >> 12
+    if kind >= _PROMOTION_KIND:
+        return Move((code >> 6) & 63, code & 63, kind - _PROMOTION_KIND + KNIGHT)
+    return Move((code >> 6) & 63, code & 63, None, kind)
+
+
+def _little_endian(codes: array) -> array:
+    """Codes are stored little-endian on disk."""
+    if sys.byteorder == "big":
+        codes = array("H", codes)
+        codes.byteswap()
+    return codes
+
+
+class History:
+    """Moves played from a starting position (which is kept unchanged)."""
+
+    __slots__ = ("start", "codes")
+
+    def __init__(
+        self, start: GameState | None = None, moves: Iterable[Move] = ()
+    ) -> None:
+        self.start: GameState = start.copy() if start else GameState.initial()
+        self.codes: array = array("H", map(encode_move, moves))
+
+    @property
+    def moves(self) -> list[Move]:
+        """The moves as a new list."""
+        return [decode_move(code) for code in self.codes]
+
+    def append(self, move: Move) -> None:
+        self.codes.append(encode_move(move))
+
+    def pop(self) -> Move:
+        """Remove and return the last move."""
+        if not self.codes:
+            raise IndexError("No move to take back")
+        return decode_move(self.codes.pop())
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, ply: int) -> Move:
+        return decode_move(self.codes[ply])
+
+    def __iter__(self) -> Iterator[Move]:
+        return map(decode_move, self.codes)
+
+    def replay(self) -> Iterator[tuple[GameState, Move]]:
+        """
+        Yield (position before the move, move) pairs. The position is one
+        state updated in place, so copy it to keep it past the next step.
+        """
+        executer = MoveExecuter(self.start.copy())
+        for move in self:
+            yield executer.state, move
+            executer.make(move)
+
+    def final_state(self) -> GameState:
+        """The position after the last move."""
+        executer = MoveExecuter(self.start.copy())
+        for move in self:
+            executer.make(move)
+        return executer.state
+
+    def san(self) -> list[str]:
+        """The moves in Standard Algebraic Notation."""
+        return [move_to_san(state, move) for state, move in self.replay()]
+
+    def to_bytes(self) -> bytes:
+        """
+        Binary record: FEN length (u16, 0 for the standard start), FEN,
+        move count (u32), then one little-endian u16 per move.
+        """
+        fen: bytes = b""
+        if self.start != GameState.initial():
+            fen = self.start.to_fen().encode("ascii")
+        return (
+            struct.pack("<H", len(fen))
+            + fen
+            + struct.pack("<I", len(self.codes))
+            + _little_endian(self.codes).tobytes()
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> History:
+        (fen_length,) = struct.unpack_from("<H", data, 0)
+        fen: str = bytes(data[2 : 2 + fen_length]).decode("ascii") or STARTING_FEN
+        (count,) = struct.unpack_from("<I", data, 2 + fen_length)
+        start: int = 6 + fen_length
+        history = cls(GameState.from_fen(fen, cached=True))
+        history.codes.frombytes(bytes(data[start : start + 2 * count]))
+        history.codes = _little_endian(history.codes)
+        return history
+
+
+# Archive layout: header, game records back to back, then the index
+# (one u64 offset per game) and a footer with the game count and index offset
+_ARCHIVE_MAGIC: bytes = b"C2HA"
+_ARCHIVE_VERSION: int = 1
+_HEADER = struct.Struct("<4sH")
+_FOOTER = struct.Struct("<QQ")
+
+
+class ArchiveWriter:
+    """Appends game histories to a new archive file."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._file: BinaryIO = open(path, "wb")
+        self._file.write(_HEADER.pack(_ARCHIVE_MAGIC, _ARCHIVE_VERSION))
+        self._offsets: array = array("Q")
+
+    def add(self, history: History) -> int:
+        """Write a game and return its index."""
+        self._offsets.append(self._file.tell())
+        self._file.write(history.to_bytes())
+        return len(self._offsets) - 1
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        index_offset: int = self._file.tell()
+        offsets: array = self._offsets
+        if sys.byteorder == "big":
+            offsets = array("Q", offsets)
+            offsets.byteswap()
+        self._file.write(offsets.tobytes())
+        self._file.write(_FOOTER.pack(len(self._offsets), index_offset))
+        self._file.close()
+
+    def __enter__(self) -> ArchiveWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class ArchiveReader:
+    """
+    Random access to an archive through a memory map: a game or a single
+    ply is found from the index without decoding anything before it.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        error: str = f"Not a version {_ARCHIVE_VERSION} history archive"
+        with open(path, "rb") as file:
+            # Also keeps mmap from failing on an empty file
+            if os.fstat(file.fileno()).st_size < _HEADER.size + _FOOTER.size:
+                raise ValueError(error)
+            self._map: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version = _HEADER.unpack_from(self._map, 0)
+        self._count, index_offset = _FOOTER.unpack_from(
+            self._map, len(self._map) - _FOOTER.size
+        )
+        index_end: int = index_offset + 8 * self._count + _FOOTER.size
+        if (
+            magic != _ARCHIVE_MAGIC
+            or version != _ARCHIVE_VERSION
+            or index_offset < _HEADER.size
+            or index_end != len(self._map)  # Truncated or trailing data
+        ):
+            self._map.close()
+            raise ValueError(error)
+        self._index_offset: int = index_offset
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _offset(self, game: int) -> int:
+        if not -self._count <= game < self._count:
+            raise IndexError(f"Game {game} out of range")
+        (offset,) = struct.unpack_from(
+            "<Q", self._map, self._index_offset + 8 * (game % self._count)
+        )
+        return offset
+
+    def __getitem__(self, game: int) -> History:
+        return History.from_bytes(memoryview(self._map)[self._offset(game) :])
+
+    def __iter__(self) -> Iterator[History]:
+        for game in range(self._count):
+            yield self[game]
+
+    def ply_count(self, game: int) -> int:
+        offset: int = self._offset(game)
+        (fen_length,) = struct.unpack_from("<H", self._map, offset)
+        (count,) = struct.unpack_from("<I", self._map, offset + 2 + fen_length)
+        return count
+
+    def move_at(self, game: int, ply: int) -> Move:
+        """Read one move of one game."""
+        offset: int = self._offset(game)
+        (fen_length,) = struct.unpack_from("<H", self._map, offset)
+        (count,) = struct.unpack_from("<I", self._map, offset + 2 + fen_length)
+        if not 0 <= ply < count:
+            raise IndexError(f"Ply {ply} out of range")
+        (code,) = struct.unpack_from("<H", self._map, offset + 6 + fen_length + 2 * ply)
+        return decode_move(code)
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> ArchiveReader:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
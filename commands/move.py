@@ -0,0 +1,76 @@
+"""
+Chess moves.
+Compact, immutable from/to square pairs with promotion and special-move flags.
+"""
+
+from __future__ import annotations
+from typing import NamedTuple
+from core.coordinate import Coordinate
+from engine.board import BISHOP, KNIGHT, PIECE_TYPES, QUEEN, ROOK
+
+
+class MoveFlag:
+    """Special-move markers so applying a move needs no extra board lookups."""
+
+    NORMAL = 0
+    DOUBLE_PUSH = 1
+    EN_PASSANT = 2
+    CASTLE = 3
+
+
+PROMOTION_PIECES: tuple[int, ...] = (QUEEN, ROOK, BISHOP, KNIGHT)
+
+
+class Move(NamedTuple):
+    """A move between two square indices (a1=0, h8=63)."""
+
+    from_square: int
+    to_square: int
+    promotion: int | None = None  # Engine piece index to promote to
+    flag: int = MoveFlag.NORMAL
+
+    @property
+    def packed(self) -> int:
+        """
+        The move as one int: to (6 bits), from (6 bits), promotion (3 bits,
+        piece index + 1, 0 = none) and flag (2 bits).
+        """
+        promotion: int = 0 if self.promotion is None else self.promotion + 1
+        return (
+            self.to_square | self.from_square << 6 | promotion << 12 | self.flag << 15
+        )
+
+    @classmethod
+    def unpack(cls, packed: int) -> Move:
+        """Rebuild a move from its packed int."""
+        promotion: int = (packed >> 12) & 7
+        return cls(
+            (packed >> 6) & 63,
+            packed & 63,
+            promotion - 1 if promotion else None,
+            (packed >> 15) & 3,
+        )
+
+    @property
+    def from_coord(self) -> Coordinate:
+        return Coordinate.from_index(self.from_square)
+
+    @property
+    def to_coord(self) -> Coordinate:
+        return Coordinate.from_index(self.to_square)
+
+    @property
+    def uci(self) -> str:
+        """Long algebraic notation used by UCI, like 'e2e4' or 'e7e8q'."""
+        from_coord = self.from_coord
+        to_coord = self.to_coord
+        text: str = f"{from_coord.file}{from_coord.rank}{to_coord.file}{to_coord.rank}"
+        if self.promotion is not None:
+            text += PIECE_TYPES[self.promotion].value
+        return text
+
+    def __str__(self) -> str:
+        return self.uci
+
+    def __repr__(self) -> str:
+        return f"Move('{self.uci}')"
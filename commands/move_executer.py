@@ -0,0 +1,222 @@
+"""
+Applying and reverting moves.
+Moves are made in place on the game state; an undo stack restores it.
+"""
+
+from __future__ import annotations
+from typing import NamedTuple
+from commands.move import Move, MoveFlag
+from engine.board import BLACK, PAWN, ROOK, WHITE, Board
+from engine.game_state import (
+    CASTLING_KEPT_AFTER_TOUCHING,
+    UNKNOWN_ATTACK_MAPS,
+    CastlingRights,
+    GameState,
+)
+from engine.pst import ENDGAME_VALUES, MIDGAME_VALUES, PHASE_WEIGHTS
+from engine.zobrist import (
+    BLACK_TO_MOVE_KEY,
+    CASTLING_KEYS,
+    PIECE_KEYS,
+    en_passant_key,
+)
+
+
+class UndoRecord(NamedTuple):
+    """What a move destroyed, so it can be put back exactly."""
+
+    move: Move
+    piece: int  # Engine index of the moving piece (before promotion)
+    captured: int | None  # Engine index of the captured piece
+    castling: int
+    en_passant: int | None
+    halfmove_clock: int
+    zobrist_key: int
+    midgame_score: int
+    endgame_score: int
+    phase: int
+    attack_maps: tuple[int | None, int | None]
+
+
+class MoveExecuter:
+    """Makes and unmakes legal moves on one GameState without copying it."""
+
+    __slots__ = ("state", "undo_stack")
+
+    def __init__(self, state: GameState) -> None:
+        self.state: GameState = state
+        self.undo_stack: list[UndoRecord] = []
+
+    def make(self, move: Move) -> None:
+        """Apply a legal move to the state."""
+        state: GameState = self.state
+        board: Board = state.board
+        us: int = state.side_to_move
+        them: int = us ^ 1
+        from_square, to_square, promotion, flag = move
+
+        moving = board.piece_at(from_square)
+        if moving is None or moving[0] != us:
+            raise ValueError(f"No piece of the side to move on {move.from_coord}")
+        piece: int = moving[1]
+        our_keys: tuple[tuple[int, ...], ...] = PIECE_KEYS[us]
+        our_midgame: tuple[tuple[int, ...], ...] = MIDGAME_VALUES[us]
+        our_endgame: tuple[tuple[int, ...], ...] = ENDGAME_VALUES[us]
+        midgame: int = state.midgame_score
+        endgame: int = state.endgame_score
+        phase: int = state.phase
+
+        # Take out the old side, castling and en passant contributions
+        key: int = (
+            state.zobrist_key
+            ^ BLACK_TO_MOVE_KEY
+            ^ CASTLING_KEYS[state.castling]
+            ^ en_passant_key(board, state.en_passant, us)
+        )
+
+        # Remove whatever gets captured
+        captured: int | None = None
+        if flag == MoveFlag.EN_PASSANT:
+            captured = PAWN
+            captured_square: int = to_square - 8 if us == WHITE else to_square + 8
+            board.remove(them, PAWN, captured_square)
+            key ^= PIECE_KEYS[them][PAWN][captured_square]
+            midgame -= MIDGAME_VALUES[them][PAWN][captured_square]
+            endgame -= ENDGAME_VALUES[them][PAWN][captured_square]
+        else:
+            target = board.piece_at(to_square)
+            if target is not None:
+                captured = target[1]
+                board.remove(them, captured, to_square)
+                key ^= PIECE_KEYS[them][captured][to_square]
+                midgame -= MIDGAME_VALUES[them][captured][to_square]
+                endgame -= ENDGAME_VALUES[them][captured][to_square]
+                phase -= PHASE_WEIGHTS[captured]
+
+        self.undo_stack.append(
+            UndoRecord(
+                move,
+                piece,
+                captured,
+                state.castling,
+                state.en_passant,
+                state.halfmove_clock,
+                state.zobrist_key,
+                state.midgame_score,
+                state.endgame_score,
+                state.phase,
+                state.attack_maps,
+            )
+        )
+
+        # Move the piece (and the rook when castling)
+        if promotion is None:
+            board.move(us, piece, from_square, to_square)
+            key ^= our_keys[piece][from_square] ^ our_keys[piece][to_square]
+            midgame += our_midgame[piece][to_square] - our_midgame[piece][from_square]
+            endgame += our_endgame[piece][to_square] - our_endgame[piece][from_square]
+        else:
+            board.remove(us, PAWN, from_square)
+            board.put(us, promotion, to_square)
+            key ^= our_keys[PAWN][from_square] ^ our_keys[promotion][to_square]
+            midgame += (
+                our_midgame[promotion][to_square] - our_midgame[PAWN][from_square]
+            )
+            endgame += (
+                our_endgame[promotion][to_square] - our_endgame[PAWN][from_square]
+            )
+            phase += PHASE_WEIGHTS[promotion]
+        if flag == MoveFlag.CASTLE:
+            rook_from, rook_to = CastlingRights.ROOK_MOVES[to_square]
+            board.move(us, ROOK, rook_from, rook_to)
+            key ^= our_keys[ROOK][rook_from] ^ our_keys[ROOK][rook_to]
+            midgame += our_midgame[ROOK][rook_to] - our_midgame[ROOK][rook_from]
+            endgame += our_endgame[ROOK][rook_to] - our_endgame[ROOK][rook_from]
+
+        # Update the rest of the state
+        state.castling &= (
+            CASTLING_KEPT_AFTER_TOUCHING[from_square]
+            & CASTLING_KEPT_AFTER_TOUCHING[to_square]
+        )
+        state.en_passant = (
+            (from_square + to_square) // 2 if flag == MoveFlag.DOUBLE_PUSH else None
+        )
+        if piece == PAWN or captured is not None:
+            state.halfmove_clock = 0
+        else:
+            state.halfmove_clock += 1
+        if us == BLACK:
+            state.fullmove_number += 1
+        state.side_to_move = them
+        state.attack_maps = UNKNOWN_ATTACK_MAPS
+        state.midgame_score = midgame
+        state.endgame_score = endgame
+        state.phase = phase
+
+        # Add the new castling and en passant contributions
+        state.zobrist_key = (
+            key
+            ^ CASTLING_KEYS[state.castling]
+            ^ en_passant_key(board, state.en_passant, them)
+        )
+
+    def unmake(self) -> Move:
+        """Revert the last made move and return it."""
+        if not self.undo_stack:
+            raise IndexError("No move to unmake")
+
+        (
+            move,
+            piece,
+            captured,
+            castling,
+            en_passant,
+            halfmove_clock,
+            zobrist_key,
+            midgame_score,
+            endgame_score,
+            phase,
+            attack_maps,
+        ) = self.undo_stack.pop()
+        state: GameState = self.state
+        board: Board = state.board
+        them: int = state.side_to_move
+        us: int = them ^ 1
+        from_square, to_square, promotion, flag = move
+
+        if flag == MoveFlag.CASTLE:
+            rook_from, rook_to = CastlingRights.ROOK_MOVES[to_square]
+            board.move(us, ROOK, rook_to, rook_from)
+        if promotion is None:
+            board.move(us, piece, to_square, from_square)
+        else:
+            board.remove(us, promotion, to_square)
+            board.put(us, PAWN, from_square)
+
+        if captured is not None:
+            if flag == MoveFlag.EN_PASSANT:
+                board.put(them, PAWN, to_square - 8 if us == WHITE else to_square + 8)
+            else:
+                board.put(them, captured, to_square)
+
+        state.castling = castling
+        state.en_passant = en_passant
+        state.halfmove_clock = halfmove_clock
+        state.zobrist_key = zobrist_key
+        state.midgame_score = midgame_score
+        state.endgame_score = endgame_score
+        state.phase = phase
+        state.attack_maps = attack_maps
+        if us == BLACK:
+            state.fullmove_number -= 1
+        state.side_to_move = us
+        return move
+
+    @property
+    def ply(self) -> int:
+        """Number of moves currently made."""
+        return len(self.undo_stack)
+
+    @property
+    def last_move(self) -> Move | None:
+        return self.undo_stack[-1].move if self.undo_stack else None
@@ -0,0 +1,214 @@
+"""
+Portable Game Notation.
+Streams games out of PGN files of any size and writes them back.
+"""
+
+from __future__ import annotations
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, TextIO
+from commands.history import History
+from commands.move_executer import MoveExecuter
+from commands.san import move_to_san, parse_san
+from engine.board import WHITE
+from engine.game_state import GameState
+from engine.move_generator import generate_legal_moves
+
+RESULTS: tuple[str, ...] = ("1-0", "0-1", "1/2-1/2", "*")
+SEVEN_TAG_ROSTER: tuple[tuple[str, str], ...] = (
+    ("Event", "?"),
+    ("Site", "?"),
+    ("Date", "????.??.??"),
+    ("Round", "?"),
+    ("White", "?"),
+    ("Black", "?"),
+    ("Result", "*"),
+)
+LINE_LENGTH: int = 80
+
+# Read buffer for PGN files; large dumps are read in blocks of this size
+_BUFFER_SIZE: int = 1 << 20
+
+_TAG_PATTERN = re.compile(r'^\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]')
+_TOKEN_PATTERN = re.compile(
+    r"""
+    \{[^}]*\}?          # Comment
+    | ;[^\n]*           # Rest-of-line comment
+    | \$\d+             # Numeric annotation glyph
+    | [()]              # Variation start or end
+    | 1-0 | 0-1 | 1/2-1/2 | \*
+    | [O0]-[O0](?:-[O0])?[+#]?  # Castling, also written with zeros
+    | \d+\.*            # Move number
+    | [^\s{}();$.]+     # SAN (validated when parsed)
+    """,
+    re.VERBOSE,
+)
+
+
+@dataclass
+class PgnGame:
+    """A game read from PGN."""
+
+    headers: dict[str, str] = field(default_factory=dict)
+    history: History = field(default_factory=History)
+    result: str = "*"
+    error: str | None = None  # Why reading moves stopped early, if it did
+
+    def to_pgn(self) -> str:
+        return game_to_pgn(self.history, self.headers, self.result)
+
+
+def iter_game_texts(file: TextIO) -> Iterator[str]:
+    """
+    Split a PGN stream into the raw text of each game, one game at a time.
+    A tag line after movetext starts the next game.
+    """
+    lines: list[str] = []
+    in_movetext: bool = False
+    in_comment: bool = False
+
+    for line in file:
+        stripped: str = line.strip()
+        if stripped.startswith("%"):
+            continue  # Escaped line
+        if not in_comment and stripped.startswith("["):
+            if in_movetext:
+                yield "".join(lines)
+                lines = []
+                in_movetext = False
+        elif stripped:
+            in_movetext = True
+            last_open: int = stripped.rfind("{")
+            last_close: int = stripped.rfind("}")
+            if last_open != last_close:
+                in_comment = last_open > last_close
+        lines.append(line)
+
+    if any(line.strip() for line in lines):
+        yield "".join(lines)
+
+
+def _unescape(value: str) -> str:
+    return value.replace('\\"', '"').replace("\\\\", "\\")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def parse_game(text: str) -> PgnGame:
+    """
+    Parse one game's PGN text. SAN is matched against the legal moves;
+    an illegal or unreadable move stops the game there and sets error.
+    """
+    game = PgnGame()
+    movetext: list[str] = []
+    for line in text.splitlines():
+        match = _TAG_PATTERN.match(line.strip()) if not movetext else None
+        if match is not None:
+            game.headers[match.group(1)] = _unescape(match.group(2))
+        elif line.strip():
+            movetext.append(line)
+    game.result = game.headers.get("Result", "*")
+
+    if "FEN" in game.headers:
+        try:
+            game.history = History(GameState.from_fen(game.headers["FEN"]))
+        except ValueError as error:
+            game.error = str(error)
+            return game
+
+    executer = MoveExecuter(game.history.start.copy())
+    variation_depth: int = 0
+    for token in _TOKEN_PATTERN.findall("\n".join(movetext)):
+        first: str = token[0]
+        if first == "(":
+            variation_depth += 1
+        elif first == ")":
+            variation_depth = max(variation_depth - 1, 0)
+        elif variation_depth or first in "{;$":
+            continue  # Comments, annotations and alternative lines
+        elif token in RESULTS:
+            game.result = token
+            break
+        elif token[-1] == "." or token.isdigit():
+            continue  # Move number
+        else:
+            try:
+                move = parse_san(
+                    executer.state, token, generate_legal_moves(executer.state)
+                )
+            except ValueError as error:
+                ply: int = len(game.history)
+                game.error = f"Move {ply // 2 + 1}: {error}"
+                break
+            executer.make(move)
+            game.history.append(move)
+    return game
+
+
+def read_games(source: str | Path | TextIO) -> Iterator[PgnGame]:
+    """Read games lazily from a PGN file path or an open text stream."""
+    if isinstance(source, (str, Path)):
+        with open(
+            source, encoding="utf-8-sig", errors="replace", buffering=_BUFFER_SIZE
+        ) as file:
+            for text in iter_game_texts(file):
+                yield parse_game(text)
+    else:
+        for text in iter_game_texts(source):
+            yield parse_game(text)
+
+
+def _wrap(tokens: Iterable[str]) -> str:
+    lines: list[str] = []
+    line: str = ""
+    for token in tokens:
+        if line and len(line) + 1 + len(token) > LINE_LENGTH:
+            lines.append(line)
+            line = token
+        else:
+            line = f"{line} {token}" if line else token
+    lines.append(line)
+    return "\n".join(lines)
+
+
+def game_to_pgn(
+    history: History,
+    headers: dict[str, str] | None = None,
+    result: str | None = None,
+) -> str:
+    """Write a game as PGN: the Seven Tag Roster, other tags, then movetext."""
+    tags: dict[str, str] = {name: default for name, default in SEVEN_TAG_ROSTER}
+    tags.update(headers or {})
+    if result is not None:
+        tags["Result"] = result
+    if history.start != GameState.initial():
+        tags["SetUp"] = "1"
+        tags["FEN"] = history.start.to_fen()
+
+    tokens: list[str] = []
+    for state, move in history.replay():
+        if state.side_to_move == WHITE:
+            tokens.append(f"{state.fullmove_number}.")
+        elif not tokens:
+            tokens.append(f"{state.fullmove_number}...")
+        tokens.append(move_to_san(state, move))
+    tokens.append(tags["Result"])
+
+    tag_lines: list[str] = [
+        f'[{name} "{_escape(value)}"]' for name, value in tags.items()
+    ]
+    return "\n".join(tag_lines) + "\n\n" + _wrap(tokens) + "\n"
+
+
+def write_games(games: Iterable[PgnGame], file: TextIO) -> int:
+    """Write games separated by blank lines; returns how many were written."""
+    count: int = 0
+    for game in games:
+        if count:
+            file.write("\n")
+        file.write(game.to_pgn())
+        count += 1
+    return count
@@ -0,0 +1,124 @@
+"""
+Standard Algebraic Notation.
+Converts between SAN strings like 'Nbd7' or 'exd8=Q+' and legal moves.
+"""
+
+from __future__ import annotations
+import re
+from commands.move import Move, MoveFlag
+from commands.move_executer import MoveExecuter
+from engine.board import PAWN, Board
+from engine.game_state import SQUARE_INDEX, SQUARE_NAMES, GameState
+from engine.move_generator import generate_legal_moves, in_check
+
+# SAN letters by engine piece index (pawns have none)
+PIECE_LETTERS: str = "PNBRQK"
+
+_SAN_PATTERN = re.compile(
+    r"^([NBRQK])?([a-h])?([1-8])?(x)?([a-h][1-8])(?:=?([NBRQ]))?$"
+)
+_CASTLING_SAN: dict[str, int] = {"O-O": 6, "O-O-O": 2}  # King target file
+
+
+def move_to_san(
+    state: GameState, move: Move, legal_moves: list[Move] | None = None
+) -> str:
+    """Write a legal move in SAN, including check and mate suffixes."""
+    if legal_moves is None:
+        legal_moves = generate_legal_moves(state)
+    board: Board = state.board
+    found = board.piece_at(move.from_square)
+    if found is None:
+        raise ValueError(f"No piece on {move.from_coord}")
+    piece: int = found[1]
+
+    if move.flag == MoveFlag.CASTLE:
+        san: str = "O-O" if move.to_square % 8 == 6 else "O-O-O"
+    else:
+        capture: bool = move.flag == MoveFlag.EN_PASSANT or bool(
+            board.occupied & (1 << move.to_square)
+        )
+        if piece == PAWN:
+            san = (SQUARE_NAMES[move.from_square][0] + "x") if capture else ""
+        else:
+            san = PIECE_LETTERS[piece] + _disambiguation(board, move, legal_moves)
+            if capture:
+                san += "x"
+        san += SQUARE_NAMES[move.to_square]
+        if move.promotion is not None:
+            san += "=" + PIECE_LETTERS[move.promotion]
+
+    executer = MoveExecuter(state)
+    executer.make(move)
+    try:
+        if in_check(state):
+            san += "+" if generate_legal_moves(state) else "#"
+    finally:
+        executer.unmake()
+    return san
+
+
+def _disambiguation(board: Board, move: Move, legal_moves: list[Move]) -> str:
+    """File, rank or square needed to tell a piece move from its twins."""
+    piece = board.piece_at(move.from_square)
+    rivals: list[int] = [
+        other.from_square
+        for other in legal_moves
+        if other.to_square == move.to_square
+        and other.from_square != move.from_square
+        and board.piece_at(other.from_square) == piece
+    ]
+    if not rivals:
+        return ""
+    name: str = SQUARE_NAMES[move.from_square]
+    if all(square % 8 != move.from_square % 8 for square in rivals):
+        return name[0]
+    if all(square // 8 != move.from_square // 8 for square in rivals):
+        return name[1]
+    return name
+
+
+def parse_san(
+    state: GameState, san: str, legal_moves: list[Move] | None = None
+) -> Move:
+    """Find the legal move a SAN string describes; raise ValueError if none."""
+    if legal_moves is None:
+        legal_moves = generate_legal_moves(state)
+    text: str = san.rstrip("+#!?")
+
+    castle_text: str = text.replace("0", "O")
+    if castle_text in _CASTLING_SAN:
+        target_file: int = _CASTLING_SAN[castle_text]
+        for move in legal_moves:
+            if move.flag == MoveFlag.CASTLE and move.to_square % 8 == target_file:
+                return move
+        raise ValueError(f"Illegal castling: {san}")
+
+    match = _SAN_PATTERN.match(text)
+    if match is None:
+        raise ValueError(f"Invalid SAN: {san}")
+    letter, from_file, from_rank, _, target, promotion_letter = match.groups()
+    piece: int = PIECE_LETTERS.index(letter) if letter else PAWN
+    to_square: int = SQUARE_INDEX[target]
+    promotion: int | None = (
+        PIECE_LETTERS.index(promotion_letter) if promotion_letter else None
+    )
+    board: Board = state.board
+
+    candidates: list[Move] = []
+    for move in legal_moves:
+        if move.to_square != to_square or move.promotion != promotion:
+            continue
+        name: str = SQUARE_NAMES[move.from_square]
+        if from_file and name[0] != from_file or from_rank and name[1] != from_rank:
+            continue
+        found = board.piece_at(move.from_square)
+        if found is None or found[1] != piece or move.flag == MoveFlag.CASTLE:
+            continue
+        candidates.append(move)
+
+    if len(candidates) == 1:
+        return candidates[0]
+    if not candidates:
+        raise ValueError(f"Illegal move: {san}")
+    raise ValueError(f"Ambiguous move: {san}")
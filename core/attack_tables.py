@@ -0,0 +1,63 @@
+"""
+Precomputed movement tables.
+Rays and jump targets for every square, built once at import time.
+"""
+
+from __future__ import annotations
+from core.color import Color
+from core.coordinate import Coordinate
+from core.direction import Direction, Directions
+
+
+def _build_ray(direction: Direction, coord: Coordinate) -> tuple[Coordinate, ...]:
+    """Walk a direction from a coordinate to the board edge."""
+    return tuple(direction.ray_from(coord))
+
+
+def _build_jumps(
+    directions: list[Direction], coord: Coordinate
+) -> tuple[Coordinate, ...]:
+    """Collect on-board targets one step away in each direction."""
+    targets: list[Coordinate] = []
+    for direction in directions:
+        target = direction.apply_to(coord)
+        if target is not None:
+            targets.append(target)
+    return tuple(targets)
+
+
+# RAYS[direction][square_index] -> coordinates ordered outward from the square
+RAYS: dict[Direction, tuple[tuple[Coordinate, ...], ...]] = {
+    direction: tuple(_build_ray(direction, coord) for coord in Coordinate.all())
+    for direction in Directions.ALL_EIGHT
+}
+
+# Per-square ray groups, so sliding pieces do a single lookup per call
+ORTHOGONAL_RAYS: tuple[tuple[tuple[Coordinate, ...], ...], ...] = tuple(
+    tuple(RAYS[direction][index] for direction in Directions.ORTHOGONAL)
+    for index in range(64)
+)
+DIAGONAL_RAYS: tuple[tuple[tuple[Coordinate, ...], ...], ...] = tuple(
+    tuple(RAYS[direction][index] for direction in Directions.DIAGONAL)
+    for index in range(64)
+)
+ALL_RAYS: tuple[tuple[tuple[Coordinate, ...], ...], ...] = tuple(
+    ORTHOGONAL_RAYS[index] + DIAGONAL_RAYS[index] for index in range(64)
+)
+
+# Jump targets per square index
+KNIGHT_TARGETS: tuple[tuple[Coordinate, ...], ...] = tuple(
+    _build_jumps(Directions.KNIGHT_MOVES, coord) for coord in Coordinate.all()
+)
+KING_TARGETS: tuple[tuple[Coordinate, ...], ...] = tuple(
+    _build_jumps(Directions.ALL_EIGHT, coord) for coord in Coordinate.all()
+)
+
+# Squares a pawn of each color attacks (diagonally forward)
+PAWN_TARGETS: dict[Color, tuple[tuple[Coordinate, ...], ...]] = {
+    color: tuple(
+        _build_jumps([Direction(-1, color.value), Direction(1, color.value)], coord)
+        for coord in Coordinate.all()
+    )
+    for color in Color
+}
@@ -0,0 +1,83 @@
+"""
+Bitboard helpers.
+A bitboard is a 64-bit int with bit N set for square index N (a1=0, h8=63).
+"""
+
+from __future__ import annotations
+from typing import Iterable, Iterator
+from core.color import Color
+from core.coordinate import Coordinate
+from core.attack_tables import KING_TARGETS, KNIGHT_TARGETS, PAWN_TARGETS, RAYS
+from core.direction import Directions
+
+EMPTY: int = 0
+FULL: int = (1 << 64) - 1
+
+# Single-bit masks per square index
+SQUARE_BITS: tuple[int, ...] = tuple(1 << index for index in range(64))
+
+FILE_MASKS: tuple[int, ...] = tuple(
+    sum(SQUARE_BITS[rank * 8 + file] for rank in range(8)) for file in range(8)
+)
+RANK_MASKS: tuple[int, ...] = tuple(
+    sum(SQUARE_BITS[rank * 8 + file] for file in range(8)) for rank in range(8)
+)
+
+
+def from_coordinates(coords: Iterable[Coordinate]) -> int:
+    """Build a bitboard from coordinates."""
+    bitboard: int = EMPTY
+    for coord in coords:
+        bitboard |= SQUARE_BITS[coord.index]
+    return bitboard
+
+
+def to_coordinates(bitboard: int) -> set[Coordinate]:
+    """Expand a bitboard into the set of coordinates it contains."""
+    return {Coordinate.from_index(index) for index in iter_squares(bitboard)}
+
+
+def iter_squares(bitboard: int) -> Iterator[int]:
+    """Yield the square indices of all set bits, lowest first."""
+    while bitboard:
+        lowest: int = bitboard & -bitboard
+        yield lowest.bit_length() - 1
+        bitboard ^= lowest
+
+
+def lowest_square(bitboard: int) -> int:
+    """Get the index of the lowest set bit (bitboard must be non-empty)."""
+    return (bitboard & -bitboard).bit_length() - 1
+
+
+def popcount(bitboard: int) -> int:
+    """Count set bits."""
+    return bitboard.bit_count()
+
+
+# Jump attacks per square index
+KNIGHT_ATTACKS: tuple[int, ...] = tuple(
+    from_coordinates(targets) for targets in KNIGHT_TARGETS
+)
+KING_ATTACKS: tuple[int, ...] = tuple(
+    from_coordinates(targets) for targets in KING_TARGETS
+)
+PAWN_ATTACKS: dict[Color, tuple[int, ...]] = {
+    color: tuple(from_coordinates(targets) for targets in PAWN_TARGETS[color])
+    for color in Color
+}
+
+
+def _build_between() -> tuple[tuple[int, ...], ...]:
+    """BETWEEN[a][b]: squares strictly between two aligned squares, else 0."""
+    between: list[list[int]] = [[0] * 64 for _ in range(64)]
+    for square in range(64):
+        for direction in Directions.ALL_EIGHT:
+            passed: int = 0
+            for target in RAYS[direction][square]:
+                between[square][target.index] = passed
+                passed |= SQUARE_BITS[target.index]
+    return tuple(tuple(row) for row in between)
+
+
+BETWEEN: tuple[tuple[int, ...], ...] = _build_between()
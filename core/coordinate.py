@@ -1,27 +1,54 @@
 """
 Chess board coordinates.
 Handles file-rank notation (a1, h8) and validation.
+
+All 64 coordinates are created once at import time and shared: constructing
+a coordinate returns the canonical instance, so equality is identity and
+dict/set lookups never fall back to a Python-level __eq__ or __hash__.
 """
 
 from __future__ import annotations
-from typing import Self
+from typing import ClassVar
 
 
 class Coordinate:
     """Represents a chess board coordinate like 'e4' or 'a1'."""
 
-    FILES: str = "abcdefgh"
-    RANKS: str = "12345678"
+    __slots__ = ("file", "rank", "file_index", "rank_index", "index")
+
+    FILES: ClassVar[str] = "abcdefgh"
+    RANKS: ClassVar[str] = "12345678"
+
+    # Canonical instances, filled in once the class is defined
+    _BY_INDEX: ClassVar[tuple[Coordinate, ...]]
+    _BY_NAME: ClassVar[dict[tuple[str, str], Coordinate]]
 
-    def __init__(self, file: str, rank: str) -> None:
-        if not self._is_valid(file, rank):
-            raise ValueError(f"Invalid coordinate: {file}{rank}")
+    file: str
+    rank: str
+    file_index: int  # a=0, h=7
+    rank_index: int  # 1=0, 8=7
+    index: int  # a1=0, b1=1, ..., h8=63
 
-        self.file: str = file
-        self.rank: str = rank
+    def __new__(cls, file: str, rank: str) -> Coordinate:
+        try:
+            return cls._BY_NAME[(file, rank)]
+        except (KeyError, TypeError):
+            raise ValueError(f"Invalid coordinate: {file}{rank}") from None
+
+    @classmethod
+    def _create(cls, file_index: int, rank_index: int) -> Coordinate:
+        """Build one canonical instance (only used to fill the table)."""
+        coord = object.__new__(cls)
+        set_attr = object.__setattr__
+        set_attr(coord, "file", cls.FILES[file_index])
+        set_attr(coord, "rank", cls.RANKS[rank_index])
+        set_attr(coord, "file_index", file_index)
+        set_attr(coord, "rank_index", rank_index)
+        set_attr(coord, "index", rank_index * 8 + file_index)
+        return coord
 
     @classmethod
-    def from_str(cls, coord_str: str) -> Self:
+    def from_str(cls, coord_str: str) -> Coordinate:
         """Create coordinate from string like 'e4'."""
         if len(coord_str) != 2:
             raise ValueError(f"Coordinate string must be 2 characters: {coord_str}")
@@ -29,24 +56,30 @@ class Coordinate:
         return cls(*coord_str)
 
     @classmethod
-    def _is_valid(cls, file: str, rank: str) -> bool:
-        """Check if file and rank are valid."""
-        return (
-            isinstance(file, str)
-            and isinstance(rank, str)
-            and file in cls.FILES
-            and rank in cls.RANKS
-        )
+    def from_index(cls, index: int) -> Coordinate:
+        """Get coordinate from its 0-63 square index (a1=0, h8=63)."""
+        if not 0 <= index <= 63:
+            raise ValueError(f"Square index must be in 0-63: {index}")
 
-    @property
-    def file_index(self) -> int:
-        """Get file as 0-7 index (a=0, h=7)."""
-        return self.FILES.index(self.file)
+        return cls._BY_INDEX[index]
 
-    @property
-    def rank_index(self) -> int:
-        """Get rank as 0-7 index (1=0, 8=7)."""
-        return self.RANKS.index(self.rank)
+    @classmethod
+    def from_indices(cls, file_index: int, rank_index: int) -> Coordinate | None:
+        """Get coordinate from 0-7 file and rank indices, None if off-board."""
+        if not (0 <= file_index <= 7) or not (0 <= rank_index <= 7):
+            return None
+
+        return cls._BY_INDEX[rank_index * 8 + file_index]
+
+    @classmethod
+    def all(cls) -> tuple[Coordinate, ...]:
+        """Get all 64 coordinates ordered by square index."""
+        return cls._BY_INDEX
+
+    @classmethod
+    def _is_valid(cls, file: str, rank: str) -> bool:
+        """Check if file and rank are valid."""
+        return (file, rank) in cls._BY_NAME
 
     @property
     def array_indices(self) -> tuple[int, int]:
@@ -55,16 +88,26 @@ class Coordinate:
         col = self.file_index
         return (row, col)
 
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("Coordinate is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Coordinate is immutable")
+
+    def __reduce__(self) -> tuple:
+        # Keep interning across pickle/copy (e.g. when sent to worker processes)
+        return (Coordinate.from_index, (self.index,))
+
     def __str__(self) -> str:
         return f"<{self.file}{self.rank}>"
 
     def __repr__(self) -> str:
         return f"Coordinate('{self}')"
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Coordinate):
-            return False
-        return self.file == other.file and self.rank == other.rank
 
-    def __hash__(self) -> int:
-        return hash((self.file, self.rank))
+Coordinate._BY_INDEX = tuple(
+    Coordinate._create(index % 8, index // 8) for index in range(64)
+)
+Coordinate._BY_NAME = {
+    (coord.file, coord.rank): coord for coord in Coordinate._BY_INDEX
+}
@@ -17,17 +17,10 @@ class Direction(NamedTuple):
 
     def apply_to(self, coord: Coordinate) -> Coordinate | None:
         """Apply this direction to a coordinate, return None if off-board."""
-        new_file_idx: int = coord.file_index + self.file_offset
-        new_rank_idx: int = coord.rank_index + self.rank_offset
-
-        # Check bounds
-        if not (0 <= new_file_idx <= 7) or not (0 <= new_rank_idx <= 7):
-            return None
-
-        new_file: str = Coordinate.FILES[new_file_idx]
-        new_rank: str = Coordinate.RANKS[new_rank_idx]
-
-        return Coordinate(new_file, new_rank)
+        return Coordinate.from_indices(
+            coord.file_index + self.file_offset,
+            coord.rank_index + self.rank_offset,
+        )
 
     def ray_from(self, coord: Coordinate) -> list[Coordinate]:
         """Generate all coordinates in this direction from starting coordinate."""
@@ -0,0 +1,284 @@
+"""
+Magic bitboard attacks for sliding pieces.
+Rook and bishop attacks become one masked, multiplied table lookup.
+
+The magic numbers below were produced by find_magic() with the default
+seed; run `python -m core.magic` to search for new ones. The filled
+attack tables are cached on disk so startup only pays for a file read.
+"""
+
+from __future__ import annotations
+import os
+import random
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import BinaryIO
+from core.attack_tables import RAYS
+from core.bitboard import FULL, SQUARE_BITS
+from core.direction import Direction, Directions
+
+CACHE_VERSION: int = 2
+DEFAULT_SEED: int = 2317
+
+# (mask, magic, shift, table) per square index
+MagicEntry = tuple[int, int, int, list[int]]
+
+# fmt: off
+ROOK_MAGICS: tuple[int, ...] = (
+    0x6080002018804004, 0x0040004020001000, 0x4200102042008008, 0x0680050800100180,
+    0x0100020500080010, 0x0300040009001802, 0x0480020011000e80, 0x0200084081120024,
+    0x0010800040002080, 0x1800400020005000, 0x8420808010002000, 0x4040800804801000,
+    0x04410010c5010800, 0x0010808084000200, 0x200a000804020001, 0x2014800280004b00,
+    0x428000c00040a000, 0x2810004000200040, 0x1401010020001040, 0x2010004008004400,
+    0x0000808008000400, 0x0020808004000200, 0x0131340008128110, 0x0004020024448c01,
+    0x8000400180096080, 0x0000200040100040, 0x80a8401100200105, 0x84801022000a0042,
+    0x1100040080080080, 0x0002008080040002, 0x4080080400020110, 0x0019800080004100,
+    0x0080002014400048, 0xb080200080804001, 0x2008401101002000, 0x8000100101000c20,
+    0x0001000801001004, 0x0000402008010410, 0x4002000402000801, 0x8020800040800100,
+    0x0040800040008020, 0x0006402010044004, 0x0030080400206002, 0x2008001000808008,
+    0x0000080004008080, 0x1c02000204008080, 0x4000013042040008, 0x0010010040820004,
+    0x0000502506008200, 0x0040200b80400680, 0x0440801228420200, 0x61020140200a1200,
+    0x0008000400088080, 0x0040800200040080, 0x0200080210010400, 0x0000008401004200,
+    0x1048800102b4c021, 0x1400102080410202, 0x004e200100c00891, 0x0080080410002101,
+    0x8862002010040902, 0x40a1000400020801, 0x0850024090081104, 0x0004082891004402,
+)
+BISHOP_MAGICS: tuple[int, ...] = (
+    0x4a40041102060011, 0x0084010812008100, 0x0041010111010104, 0x0408084100081412,
+    0x100d104164041040, 0x4040829040a00200, 0x041a011003500840, 0x0005002696084002,
+    0x0000080284040410, 0x0000150808090220, 0x0004080200620002, 0xaa40444104200003,
+    0x0099020210104028, 0x0e34c10402408000, 0x1090d08084202040, 0x0000010080900810,
+    0x2004040811100204, 0x0002002008110900, 0x0028061000802688, 0x0084004840400808,
+    0x8084004480a00000, 0x0002018648060801, 0x310c028582491004, 0x0802000101a0b402,
+    0x00b0900008225000, 0x2418c80424110801, 0x0043444010090600, 0x4805080014004010,
+    0x1249080501004000, 0x0000820004880420, 0x00020a000400c201, 0x0c02520040860120,
+    0x8121044000204800, 0x040821048810240e, 0x0000105000880080, 0x0114440100100901,
+    0x1a59020080680802, 0x0020380342008042, 0x0002540400010080, 0x0142e40380104200,
+    0x00061004a2014400, 0x0002024120002404, 0x0004a09410029206, 0x0480022091000801,
+    0x9000041102100402, 0x0090200080202100, 0x0228080080889410, 0x2002020208280209,
+    0x0400921002200104, 0x0400208804100012, 0x0000102402080000, 0x0800084420880400,
+    0x0040042020452000, 0x4040c0280845218f, 0x0148081000a60160, 0x0010440800604848,
+    0x0220404044104000, 0x000880420084a000, 0x600000030c010401, 0x0000008004420880,
+    0x0000200040050102, 0x2010201020010105, 0x0846082081044100, 0x0002202400820040,
+)
+# fmt: on
+
+
+def ray_attacks(square: int, occupied: int, directions: list[Direction]) -> int:
+    """Walk rays until blocked (the slow path magics are verified against)."""
+    attacks: int = 0
+    for direction in directions:
+        for target in RAYS[direction][square]:
+            attacks |= SQUARE_BITS[target.index]
+            if occupied & SQUARE_BITS[target.index]:
+                break
+    return attacks
+
+
+def relevant_mask(square: int, directions: list[Direction]) -> int:
+    """Squares whose occupancy can change the attacks (ray ends excluded)."""
+    mask: int = 0
+    for direction in directions:
+        for target in RAYS[direction][square][:-1]:
+            mask |= SQUARE_BITS[target.index]
+    return mask
+
+
+def _occupancy_subsets(mask: int) -> list[int]:
+    """Enumerate every subset of a mask (carry-rippler trick)."""
+    subsets: list[int] = []
+    subset: int = 0
+    while True:
+        subsets.append(subset)
+        subset = (subset - mask) & mask
+        if subset == 0:
+            return subsets
+
+
+def _fill_table(
+    square: int, magic: int, directions: list[Direction]
+) -> list[int] | None:
+    """Build the attack table for a magic, or None if two entries collide."""
+    mask: int = relevant_mask(square, directions)
+    shift: int = 64 - mask.bit_count()
+    table: list[int | None] = [None] * (1 << mask.bit_count())
+
+    for occupied in _occupancy_subsets(mask):
+        attacks: int = ray_attacks(square, occupied, directions)
+        index: int = ((occupied * magic) & FULL) >> shift
+        if table[index] is None:
+            table[index] = attacks
+        elif table[index] != attacks:
+            return None
+
+    # Unreachable slots are never looked up; store 0 to keep the list of ints
+    return [attacks or 0 for attacks in table]
+
+
+def find_magic(square: int, directions: list[Direction], rng: random.Random) -> int:
+    """Search for a magic number that maps every occupancy without collisions."""
+    mask: int = relevant_mask(square, directions)
+    bits: int = mask.bit_count()
+    shift: int = 64 - bits
+    occupancies: list[int] = _occupancy_subsets(mask)
+    attacks: list[int] = [
+        ray_attacks(square, occupied, directions) for occupied in occupancies
+    ]
+
+    while True:
+        # Sparse candidates work best
+        magic: int = rng.getrandbits(64) & rng.getrandbits(64) & rng.getrandbits(64)
+        if ((((mask * magic) & FULL) >> 56).bit_count()) < 6:
+            continue
+
+        table: list[int | None] = [None] * (1 << bits)
+        for occupied, expected in zip(occupancies, attacks):
+            index: int = ((occupied * magic) & FULL) >> shift
+            if table[index] is None:
+                table[index] = expected
+            elif table[index] != expected:
+                break
+        else:
+            return magic
+
+
+def generate_magics(seed: int = DEFAULT_SEED) -> tuple[list[int], list[int]]:
+    """Search rook and bishop magics for all squares (slow: tens of seconds)."""
+    rng = random.Random(seed)
+    rook = [find_magic(square, Directions.ORTHOGONAL, rng) for square in range(64)]
+    bishop = [find_magic(square, Directions.DIAGONAL, rng) for square in range(64)]
+    return rook, bishop
+
+
+def build_entries(
+    magics: tuple[int, ...] | list[int], directions: list[Direction]
+) -> list[MagicEntry]:
+    """Fill the attack tables for all squares."""
+    entries: list[MagicEntry] = []
+    for square, magic in enumerate(magics):
+        mask: int = relevant_mask(square, directions)
+        table = _fill_table(square, magic, directions)
+        if table is None:
+            raise ValueError(f"Magic {magic:#018x} collides on square {square}")
+        entries.append((mask, magic, 64 - mask.bit_count(), table))
+    return entries
+
+
+def default_cache_path() -> Path:
+    """Cache file location (override the directory with CHESS2_CACHE_DIR)."""
+    cache_dir = os.environ.get("CHESS2_CACHE_DIR")
+    base = Path(cache_dir) if cache_dir else Path.home() / ".cache" / "chess2"
+    return base / f"magic_tables_v{CACHE_VERSION}.bin"
+
+
+# Cache file: magic bytes, version, then the 128 magics and every table's
+# entries as little-endian uint64, rook squares first. Plain numbers only,
+# so a tampered file can at worst be rejected, never run.
+_CACHE_MAGIC: bytes = b"C2MG"
+_CACHE_HEADER = struct.Struct("<4sI")
+
+
+def _write_array(file: BinaryIO, values: array) -> None:
+    if sys.byteorder == "big":
+        values = array("Q", values)
+        values.byteswap()
+    values.tofile(file)
+
+
+def _read_array(file: BinaryIO, count: int) -> array:
+    values = array("Q")
+    values.fromfile(file, count)  # EOFError if the file is short
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _read_cache(cache_path: Path) -> tuple[list[MagicEntry], list[MagicEntry]] | None:
+    """Tables from the cache file, or None if it doesn't match these magics."""
+    magics: tuple[int, ...] = ROOK_MAGICS + BISHOP_MAGICS
+    with open(cache_path, "rb") as file:
+        header: tuple = _CACHE_HEADER.unpack(file.read(_CACHE_HEADER.size))
+        if header != (_CACHE_MAGIC, CACHE_VERSION):
+            return None
+        if tuple(_read_array(file, len(magics))) != magics:
+            return None
+        entries: list[list[MagicEntry]] = [[], []]
+        for kind, directions in enumerate((Directions.ORTHOGONAL, Directions.DIAGONAL)):
+            for square in range(64):
+                mask: int = relevant_mask(square, directions)
+                bits: int = mask.bit_count()
+                # Lists of ints index faster than arrays (no int boxing per lookup)
+                table: list[int] = _read_array(file, 1 << bits).tolist()
+                entries[kind].append(
+                    (mask, magics[kind * 64 + square], 64 - bits, table)
+                )
+        if file.read(1):
+            return None  # Trailing data: not a file this code wrote
+    return entries[0], entries[1]
+
+
+def _write_cache(
+    cache_path: Path, rook: list[MagicEntry], bishop: list[MagicEntry]
+) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(temp_path, "wb") as file:
+        file.write(_CACHE_HEADER.pack(_CACHE_MAGIC, CACHE_VERSION))
+        _write_array(file, array("Q", ROOK_MAGICS + BISHOP_MAGICS))
+        for _, _, _, table in rook + bishop:
+            _write_array(file, array("Q", table))
+    os.replace(temp_path, cache_path)
+
+
+def load_tables(cache_path: Path | None) -> tuple[list[MagicEntry], list[MagicEntry]]:
+    """Load rook and bishop tables from the cache, building and saving on a miss."""
+    if cache_path is not None:
+        try:
+            cached = _read_cache(cache_path)
+        except Exception:
+            cached = None  # Missing, truncated or corrupt: rebuild below
+        if cached is not None:
+            return cached
+
+    rook = build_entries(ROOK_MAGICS, Directions.ORTHOGONAL)
+    bishop = build_entries(BISHOP_MAGICS, Directions.DIAGONAL)
+
+    if cache_path is not None:
+        try:
+            _write_cache(cache_path, rook, bishop)
+        except OSError:
+            pass  # Read-only home etc.: just run without a cache
+
+    return rook, bishop
+
+
+ROOK_ENTRIES, BISHOP_ENTRIES = load_tables(default_cache_path())
+
+
+def rook_attacks(square: int, occupied: int) -> int:
+    """Rook attack bitboard from a square given board occupancy."""
+    mask, magic, shift, table = ROOK_ENTRIES[square]
+    return table[((occupied & mask) * magic & FULL) >> shift]
+
+
+def bishop_attacks(square: int, occupied: int) -> int:
+    """Bishop attack bitboard from a square given board occupancy."""
+    mask, magic, shift, table = BISHOP_ENTRIES[square]
+    return table[((occupied & mask) * magic & FULL) >> shift]
+
+
+def queen_attacks(square: int, occupied: int) -> int:
+    """Queen attack bitboard (rook and bishop attacks combined)."""
+    return rook_attacks(square, occupied) | bishop_attacks(square, occupied)
+
+
+if __name__ == "__main__":
+    rook_magics, bishop_magics = generate_magics()
+    for name, found in (("ROOK_MAGICS", rook_magics), ("BISHOP_MAGICS", bishop_magics)):
+        print(f"{name} = (")
+        for row in range(0, 64, 4):
+            print(
+                "    " + " ".join(f"{magic:#018x}," for magic in found[row : row + 4])
+            )
+        print(")")
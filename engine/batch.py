@@ -0,0 +1,157 @@
+"""
+Batch analysis of position files.
+Streams FEN/EPD lines through a process pool and writes one JSON result
+per position, in input order.
+"""
+
+from __future__ import annotations
+import json
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator, TextIO
+from engine.evaluation import evaluate
+from engine.game_state import GameState
+from engine.parallel import default_workers
+from engine.perft import perft
+from engine.search import Searcher, SearchLimits, SearchResult
+
+
+@dataclass
+class BatchOptions:
+    """What to compute for every position."""
+
+    perft_depth: int = 0  # 0 skips perft
+    search: SearchLimits | None = None  # None skips the search
+
+
+@dataclass
+class Position:
+    """One input line: a FEN and any ';D<depth> <nodes>' perft expectations."""
+
+    line: int
+    fen: str
+    expected: dict[int, int] = field(default_factory=dict)
+
+
+def parse_position_line(text: str) -> tuple[str, dict[int, int]]:
+    """
+    Split a FEN or EPD line into the FEN and its perft expectations.
+    Move counters are optional; other EPD operations are ignored.
+    """
+    position, *operations = (part.strip() for part in text.split(";"))
+    fields: list[str] = position.split()
+    if len(fields) < 4:
+        raise ValueError(f"Invalid FEN/EPD line: {text}")
+    fen_fields: list[str] = fields[:4]
+    if len(fields) >= 6 and fields[4].isdigit() and fields[5].isdigit():
+        fen_fields += fields[4:6]
+
+    expected: dict[int, int] = {}
+    for operation in operations:
+        label, _, value = operation.partition(" ")
+        if len(label) > 1 and label[0] == "D" and label[1:].isdigit():
+            expected[int(label[1:])] = int(value)
+    return " ".join(fen_fields), expected
+
+
+def read_positions(path: str | Path) -> Iterator[Position]:
+    """Yield positions from a FEN/EPD file one line at a time."""
+    with open(path, encoding="utf-8") as file:
+        for number, text in enumerate(file, start=1):
+            text = text.strip()
+            if not text or text.startswith("#"):
+                continue
+            try:
+                fen, expected = parse_position_line(text)
+            except ValueError:
+                # Reported as an error result rather than ending the batch
+                fen, expected = text, {}
+            yield Position(number, fen, expected)
+
+
+def analyse_position(position: Position, options: BatchOptions) -> dict[str, Any]:
+    """Compute the requested results for one position as a JSON-ready dict."""
+    result: dict[str, Any] = {"line": position.line, "fen": position.fen}
+    start: float = time.perf_counter()
+    try:
+        state: GameState = GameState.from_fen(position.fen)
+        result["eval"] = evaluate(state)
+        if options.perft_depth > 0:
+            nodes: int = perft(state, options.perft_depth)
+            result["perft"] = {"depth": options.perft_depth, "nodes": nodes}
+            if options.perft_depth in position.expected:
+                expected: int = position.expected[options.perft_depth]
+                result["perft"]["ok"] = nodes == expected
+
+        if options.search is not None:
+            found: SearchResult = Searcher().search(state, options.search)
+            result["best_move"] = found.best_move.uci if found.best_move else None
+            result["score"] = found.score
+            result["depth"] = found.depth
+            result["nodes"] = found.nodes
+            result["pv"] = [move.uci for move in found.pv]
+    except ValueError as error:
+        result["error"] = str(error)
+        return result
+    except Exception as error:
+        # One position failing must not take the rest of the batch with it
+        result["error"] = repr(error)
+        return result
+
+    result["seconds"] = round(time.perf_counter() - start, 6)
+    return result
+
+
+def _analyse_chunk(
+    positions: list[Position], options: BatchOptions
+) -> list[dict[str, Any]]:
+    """Worker task: analyse a chunk of positions."""
+    return [analyse_position(position, options) for position in positions]
+
+
+def analyse_positions(
+    positions: Iterable[Position],
+    options: BatchOptions,
+    workers: int | None = None,
+    chunk_size: int = 16,
+) -> Iterator[dict[str, Any]]:
+    """
+    Analyse positions in worker processes, yielding results in input order.
+    Only a bounded number of chunks (two per worker) are read ahead, so the
+    input is never held in memory all at once.
+    """
+    source: Iterator[Position] = iter(positions)
+    workers = workers or default_workers()
+    max_pending: int = 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque[Future[list[dict[str, Any]]]] = deque()
+        while True:
+            while len(pending) < max_pending:
+                chunk: list[Position] = list(islice(source, chunk_size))
+                if not chunk:
+                    break
+                pending.append(pool.submit(_analyse_chunk, chunk, options))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+
+def run_batch(
+    input_path: str | Path,
+    output: TextIO,
+    options: BatchOptions,
+    workers: int | None = None,
+    chunk_size: int = 16,
+) -> int:
+    """Write JSON Lines results for a position file; returns the count."""
+    count: int = 0
+    for result in analyse_positions(
+        read_positions(input_path), options, workers, chunk_size
+    ):
+        output.write(json.dumps(result) + "\n")
+        count += 1
+    return count
@@ -0,0 +1,107 @@
+"""
+Vectorized evaluation.
+Encodes many positions as NumPy arrays and scores them in one pass with
+the same tapered piece-square values as engine.evaluation.
+NumPy is optional; everything else in the engine works without it.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Sequence
+from core.color import Color
+from engine.board import COLORS, PIECE_TYPES, WHITE
+from engine.game_state import GameState
+from engine.pst import (
+    ENDGAME_VALUES,
+    MAX_PHASE,
+    MIDGAME_VALUES,
+    PHASE_WEIGHTS,
+)
+from pieces.piece import PieceType
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+# One plane per (color, piece type), in COLORS x PIECE_TYPES order
+PLANES: tuple[tuple[Color, PieceType], ...] = tuple(
+    (color, piece_type) for color in COLORS for piece_type in PIECE_TYPES
+)
+PLANE_COUNT: int = len(PLANES)
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Batch evaluation needs NumPy: pip install numpy")
+
+
+def plane_index(color: int, piece: int) -> int:
+    """Plane holding a color's pieces of one type (engine indices)."""
+    return color * len(PIECE_TYPES) + piece
+
+
+def encode_bitboards(states: Sequence[GameState]) -> NDArray:
+    """(N, 12) uint64 array of each position's piece bitboards."""
+    _require_numpy()
+    return np.array(
+        [[*state.board.pieces[0], *state.board.pieces[1]] for state in states],
+        dtype=np.uint64,
+    ).reshape(len(states), PLANE_COUNT)
+
+
+def encode_planes(states: Sequence[GameState]) -> NDArray:
+    """(N, 12, 64) uint8 array: 1 where a plane's piece stands on a square."""
+    bitboards: NDArray = encode_bitboards(states).astype("<u8")
+    bits: NDArray = np.unpackbits(bitboards.view(np.uint8), bitorder="little")
+    return bits.reshape(len(states), PLANE_COUNT, 64)
+
+
+def side_to_move(states: Sequence[GameState]) -> NDArray:
+    """(N,) int8 array of engine colors."""
+    _require_numpy()
+    return np.fromiter((state.side_to_move for state in states), np.int8, len(states))
+
+
+def _weights(values: tuple[tuple[tuple[int, ...], ...], ...]) -> NDArray:
+    """(12, 64) signed per-plane values, white positive."""
+    return np.array(
+        [
+            values[color][piece]
+            for color in range(len(COLORS))
+            for piece in range(len(PIECE_TYPES))
+        ],
+        dtype=np.int32,
+    )
+
+
+if np is not None:
+    _MIDGAME_WEIGHTS: NDArray = _weights(MIDGAME_VALUES)
+    _ENDGAME_WEIGHTS: NDArray = _weights(ENDGAME_VALUES)
+    _PHASE_WEIGHTS: NDArray = np.tile(np.array(PHASE_WEIGHTS, dtype=np.int32), 2)
+
+
+def evaluate_planes(planes: NDArray, colors: NDArray | None = None) -> NDArray:
+    """
+    Score encoded positions: from white's point of view, or from the side
+    to move's if colors (engine color per position) is given.
+    """
+    _require_numpy()
+    planes = planes.astype(np.int32)
+    midgame: NDArray = np.einsum("npq,pq->n", planes, _MIDGAME_WEIGHTS)
+    endgame: NDArray = np.einsum("npq,pq->n", planes, _ENDGAME_WEIGHTS)
+    phase: NDArray = np.minimum(planes.sum(axis=2) @ _PHASE_WEIGHTS, MAX_PHASE)
+    scores: NDArray = midgame * phase + endgame * (MAX_PHASE - phase)
+    if colors is not None:
+        scores = np.where(colors == WHITE, scores, -scores)
+    return scores // MAX_PHASE
+
+
+def evaluate_batch(states: Sequence[GameState]) -> NDArray:
+    """Scores for the side to move, matching engine.evaluation.evaluate."""
+    if not states:
+        _require_numpy()
+        return np.zeros(0, dtype=np.int32)
+    return evaluate_planes(encode_planes(states), side_to_move(states))
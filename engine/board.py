@@ -0,0 +1,273 @@
+"""
+Bitboard board representation.
+One 64-bit int per color and piece type, plus occupancy masks.
+"""
+
+from __future__ import annotations
+from typing import Sequence
+from core.bitboard import SQUARE_BITS, iter_squares, lowest_square
+from core.color import Color
+from core.coordinate import Coordinate
+from pieces.piece import Piece, PieceType
+from pieces.pawn import Pawn
+from pieces.knight import Knight
+from pieces.bishop import Bishop
+from pieces.rook import Rook
+from pieces.queen import Queen
+from pieces.king import King
+
+# Integer color and piece indices used by the engine internals
+WHITE, BLACK = 0, 1
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+
+COLORS: tuple[Color, Color] = (Color.WHITE, Color.BLACK)
+PIECE_TYPES: tuple[PieceType, ...] = (
+    PieceType.PAWN,
+    PieceType.KNIGHT,
+    PieceType.BISHOP,
+    PieceType.ROOK,
+    PieceType.QUEEN,
+    PieceType.KING,
+)
+COLOR_INDEX: dict[Color, int] = {color: index for index, color in enumerate(COLORS)}
+PIECE_INDEX: dict[PieceType, int] = {
+    piece_type: index for index, piece_type in enumerate(PIECE_TYPES)
+}
+PIECE_CLASSES: dict[PieceType, type[Piece]] = {
+    PieceType.PAWN: Pawn,
+    PieceType.KNIGHT: Knight,
+    PieceType.BISHOP: Bishop,
+    PieceType.ROOK: Rook,
+    PieceType.QUEEN: Queen,
+    PieceType.KING: King,
+}
+
+# FEN letters by engine indices, and the reverse lookup
+FEN_SYMBOLS: tuple[str, str] = ("PNBRQK", "pnbrqk")
+FEN_PIECES: dict[str, tuple[int, int]] = {
+    symbol: (color, piece)
+    for color, symbols in enumerate(FEN_SYMBOLS)
+    for piece, symbol in enumerate(symbols)
+}
+_FEN_DIGITS: str = "12345678"
+
+# Mailbox codes: 0 for an empty square, else 1 + color * 6 + piece
+EMPTY_SQUARE: int = 0
+MAILBOX_PIECES: tuple[tuple[int, int] | None, ...] = (None,) + tuple(
+    (color, piece) for color in (WHITE, BLACK) for piece in range(6)
+)
+
+
+def create_piece(color: int, piece: int, square: int) -> Piece:
+    """Build a Piece object from engine indices."""
+    piece_class = PIECE_CLASSES[PIECE_TYPES[piece]]
+    return piece_class(COLORS[color], Coordinate.from_index(square))
+
+
+class Board:
+    """
+    Piece placement stored as bitboards (the per-color, per-type piece sets)
+    plus a 64-byte mailbox for constant-time lookups by square.
+    """
+
+    __slots__ = ("pieces", "colors", "occupied", "squares")
+
+    def __init__(self) -> None:
+        # pieces[color][piece] -> bitboard of that color's pieces of that type
+        self.pieces: list[list[int]] = [[0] * 6, [0] * 6]
+        self.colors: list[int] = [0, 0]  # Occupancy per color
+        self.occupied: int = 0
+        self.squares: bytearray = bytearray(64)  # Mailbox codes by square
+
+    @classmethod
+    def starting_position(cls) -> Board:
+        """Build the standard initial setup."""
+        board = cls()
+        back_rank: tuple[int, ...] = (
+            ROOK,
+            KNIGHT,
+            BISHOP,
+            QUEEN,
+            KING,
+            BISHOP,
+            KNIGHT,
+            ROOK,
+        )
+        for file, piece in enumerate(back_rank):
+            board.put(WHITE, piece, file)
+            board.put(WHITE, PAWN, 8 + file)
+            board.put(BLACK, PAWN, 48 + file)
+            board.put(BLACK, piece, 56 + file)
+        return board
+
+    @classmethod
+    def from_bitboards(cls, white: Sequence[int], black: Sequence[int]) -> Board:
+        """Build a board from six piece bitboards per color."""
+        board = cls.__new__(cls)
+        board.pieces = [list(white), list(black)]
+        board.colors = [0, 0]
+        for color in (WHITE, BLACK):
+            for bitboard in board.pieces[color]:
+                board.colors[color] |= bitboard
+        board.occupied = board.colors[WHITE] | board.colors[BLACK]
+        board.squares = bytearray(64)
+        for color in (WHITE, BLACK):
+            for piece, bitboard in enumerate(board.pieces[color]):
+                for square in iter_squares(bitboard):
+                    board.squares[square] = 1 + color * 6 + piece
+        return board
+
+    @classmethod
+    def from_fen(cls, placement: str) -> Board:
+        """Parse the piece placement field of a FEN, e.g. 'rnbqkbnr/pppppppp/...'."""
+        rows: list[str] = placement.split("/")
+        if len(rows) != 8:
+            raise ValueError(f"FEN placement must have 8 ranks: {placement}")
+
+        pieces: list[list[int]] = [[0] * 6, [0] * 6]
+        for row_index, row in enumerate(rows):
+            square: int = (7 - row_index) * 8
+            end: int = square + 8
+            for symbol in row:
+                if symbol in _FEN_DIGITS:
+                    square += ord(symbol) - 48
+                    continue
+                if square >= end:
+                    raise ValueError(f"Too many squares in FEN rank: {row}")
+                try:
+                    color, piece = FEN_PIECES[symbol]
+                except KeyError:
+                    raise ValueError(f"Invalid FEN piece: {symbol}") from None
+                pieces[color][piece] |= 1 << square
+                square += 1
+            if square != end:
+                raise ValueError(f"FEN rank must cover 8 squares: {row}")
+        return cls.from_bitboards(pieces[WHITE], pieces[BLACK])
+
+    def to_fen(self) -> str:
+        """Serialize the piece placement field of a FEN."""
+        symbols: list[str] = [""] * 64
+        for color in (WHITE, BLACK):
+            for piece, symbol in enumerate(FEN_SYMBOLS[color]):
+                for square in iter_squares(self.pieces[color][piece]):
+                    symbols[square] = symbol
+
+        rows: list[str] = []
+        for rank_start in range(56, -1, -8):
+            row: str = ""
+            empty: int = 0
+            for symbol in symbols[rank_start : rank_start + 8]:
+                if symbol:
+                    if empty:
+                        row += _FEN_DIGITS[empty - 1]
+                        empty = 0
+                    row += symbol
+                else:
+                    empty += 1
+            if empty:
+                row += _FEN_DIGITS[empty - 1]
+            rows.append(row)
+        return "/".join(rows)
+
+    @classmethod
+    def from_board_state(cls, board_state: dict[Coordinate, Piece]) -> Board:
+        """Build a board from a coordinate -> piece mapping."""
+        board = cls()
+        for coord, piece in board_state.items():
+            board.put(
+                COLOR_INDEX[piece.color], PIECE_INDEX[piece.piece_type], coord.index
+            )
+        return board
+
+    def to_board_state(self) -> dict[Coordinate, Piece]:
+        """Build a coordinate -> piece mapping (new Piece objects)."""
+        board_state: dict[Coordinate, Piece] = {}
+        for color in (WHITE, BLACK):
+            for piece in range(6):
+                for square in iter_squares(self.pieces[color][piece]):
+                    board_state[Coordinate.from_index(square)] = create_piece(
+                        color, piece, square
+                    )
+        return board_state
+
+    def put(self, color: int, piece: int, square: int) -> None:
+        """Place a piece on an empty square."""
+        bit: int = SQUARE_BITS[square]
+        self.pieces[color][piece] |= bit
+        self.colors[color] |= bit
+        self.occupied |= bit
+        self.squares[square] = 1 + color * 6 + piece
+
+    def remove(self, color: int, piece: int, square: int) -> None:
+        """Remove a piece known to be on the square."""
+        bit: int = SQUARE_BITS[square]
+        self.pieces[color][piece] ^= bit
+        self.colors[color] ^= bit
+        self.occupied ^= bit
+        self.squares[square] = EMPTY_SQUARE
+
+    def move(self, color: int, piece: int, from_square: int, to_square: int) -> None:
+        """Move a piece to an empty square."""
+        bits: int = SQUARE_BITS[from_square] | SQUARE_BITS[to_square]
+        self.pieces[color][piece] ^= bits
+        self.colors[color] ^= bits
+        self.occupied ^= bits
+        self.squares[to_square] = self.squares[from_square]
+        self.squares[from_square] = EMPTY_SQUARE
+
+    def piece_at(self, square: int) -> tuple[int, int] | None:
+        """Get (color, piece) indices on a square, or None if empty."""
+        return MAILBOX_PIECES[self.squares[square]]
+
+    def piece_list(self, color: int) -> list[tuple[int, int]]:
+        """(square, piece) for each of a color's pieces, by square."""
+        squares: bytearray = self.squares
+        offset: int = 1 + color * 6
+        return [
+            (square, squares[square] - offset)
+            for square in iter_squares(self.colors[color])
+        ]
+
+    def get_piece(self, coord: Coordinate) -> Piece | None:
+        """Get the piece on a coordinate as a Piece object."""
+        found = self.piece_at(coord.index)
+        if found is None:
+            return None
+        return create_piece(found[0], found[1], coord.index)
+
+    def king_square(self, color: int) -> int:
+        """Get the square index of a color's king."""
+        return lowest_square(self.pieces[color][KING])
+
+    def copy(self) -> Board:
+        """Return an independent copy."""
+        board = Board.__new__(Board)
+        board.pieces = [self.pieces[WHITE][:], self.pieces[BLACK][:]]
+        board.colors = self.colors[:]
+        board.occupied = self.occupied
+        board.squares = self.squares[:]
+        return board
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Board):
+            return False
+        return self.pieces == other.pieces
+
+    __hash__ = None  # type: ignore[assignment]  # Mutable
+
+    def __str__(self) -> str:
+        rows: list[str] = []
+        for rank in range(7, -1, -1):
+            symbols: list[str] = []
+            for file in range(8):
+                found = self.piece_at(rank * 8 + file)
+                if found is None:
+                    symbols.append(".")
+                else:
+                    symbol: str = PIECE_TYPES[found[1]].value
+                    symbols.append(symbol.upper() if found[0] == WHITE else symbol)
+            rows.append(" ".join(symbols))
+        return "\n".join(rows)
+
+    def __repr__(self) -> str:
+        return f"Board(pieces={self.occupied.bit_count()})"
@@ -0,0 +1,126 @@
+"""
+Opening book.
+Looks positions up in Polyglot .bin books through a memory map, so a book
+of any size is binary-searched in place rather than loaded.
+"""
+
+from __future__ import annotations
+import mmap
+import random
+import struct
+from pathlib import Path
+from typing import Iterable, NamedTuple
+from commands.move import Move
+from engine.game_state import GameState
+from engine.move_generator import generate_legal_moves
+from engine.polyglot import polyglot_key, polyglot_move
+
+# Key, move, weight, learn: 16 big-endian bytes per entry, sorted by key
+_ENTRY = struct.Struct(">QHHI")
+
+
+class BookEntry(NamedTuple):
+    """A book move for one position."""
+
+    move: Move
+    weight: int
+    learn: int
+
+
+class OpeningBook:
+    """A Polyglot opening book, read through a memory map."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._map: mmap.mmap | None = None
+        with open(path, "rb") as file:
+            size: int = Path(path).stat().st_size
+            if size % _ENTRY.size:
+                raise ValueError(f"Not a Polyglot book: {path}")
+            if size:  # mmap can't map an empty file
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._count: int = size // _ENTRY.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _key_at(self, index: int) -> int:
+        (key,) = struct.unpack_from(">Q", self._map, index * _ENTRY.size)
+        return key
+
+    def _first_index(self, key: int) -> int:
+        """Index of the first entry with this key or a larger one."""
+        low: int = 0
+        high: int = self._count
+        while low < high:
+            middle: int = (low + high) // 2
+            if self._key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def entries(self, state: GameState) -> list[BookEntry]:
+        """Book moves for a position that are legal in it, in file order."""
+        key: int = polyglot_key(state)
+        index: int = self._first_index(key)
+        raw: list[tuple[int, int, int]] = []
+        while index < self._count:
+            entry_key, code, weight, learn = _ENTRY.unpack_from(
+                self._map, index * _ENTRY.size
+            )
+            if entry_key != key:
+                break
+            raw.append((code, weight, learn))
+            index += 1
+        if not raw:
+            return []
+
+        legal: dict[int, Move] = {
+            polyglot_move(move): move for move in generate_legal_moves(state)
+        }
+        return [
+            BookEntry(legal[code], weight, learn)
+            for code, weight, learn in raw
+            if code in legal
+        ]
+
+    def choose(self, state: GameState, rng: random.Random | None = None) -> Move | None:
+        """Pick a book move at random in proportion to its weight, if any."""
+        entries: list[BookEntry] = [
+            entry for entry in self.entries(state) if entry.weight
+        ]
+        if not entries:
+            return None
+        weights: list[int] = [entry.weight for entry in entries]
+        return (rng or random).choices(entries, weights)[0].move
+
+    def best_move(self, state: GameState) -> Move | None:
+        """The book move with the highest weight, if any."""
+        entries: list[BookEntry] = self.entries(state)
+        if not entries:
+            return None
+        return max(entries, key=lambda entry: entry.weight).move
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+
+    def __enter__(self) -> OpeningBook:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def write_book(path: str | Path, entries: Iterable[tuple[int, Move, int]]) -> int:
+    """
+    Write (Polyglot key, move, weight) entries as a sorted Polyglot book;
+    returns the number written.
+    """
+    records: list[tuple[int, int, int]] = sorted(
+        (key, polyglot_move(move), weight) for key, move, weight in entries
+    )
+    with open(path, "wb") as file:
+        for key, code, weight in records:
+            file.write(_ENTRY.pack(key, code, weight, 0))
+    return len(records)
@@ -0,0 +1,31 @@
+"""
+Static evaluation.
+Tapered material plus piece-square score, from the side to move's point of
+view, in centipawns.
+"""
+
+from __future__ import annotations
+from engine.board import WHITE
+from engine.game_state import GameState
+from engine.pst import MAX_PHASE, compute_scores
+
+
+def taper(midgame: int, endgame: int, phase: int) -> int:
+    """Blend middlegame and endgame scores by the game phase."""
+    phase = min(phase, MAX_PHASE)  # Promotions can push it past the maximum
+    return (midgame * phase + endgame * (MAX_PHASE - phase)) // MAX_PHASE
+
+
+def evaluate_white(state: GameState) -> int:
+    """Score the position from white's point of view, rescanning the board."""
+    return taper(*compute_scores(state.board))
+
+
+def evaluate(state: GameState) -> int:
+    """
+    Score the position for the side to move (positive = good for them).
+    Uses the sums MoveExecuter keeps up to date, so nothing is rescanned.
+    """
+    if state.side_to_move == WHITE:
+        return taper(state.midgame_score, state.endgame_score, state.phase)
+    return taper(-state.midgame_score, -state.endgame_score, state.phase)
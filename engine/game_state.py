@@ -0,0 +1,332 @@
+"""
+Full position state.
+Piece placement plus side to move, castling rights, en passant and clocks.
+"""
+
+from __future__ import annotations
+from functools import lru_cache
+from typing import NamedTuple
+from core.color import Color
+from core.coordinate import Coordinate
+from engine.board import BLACK, COLORS, KING, PAWN, ROOK, WHITE, Board
+from engine.pst import compute_scores
+from engine.zobrist import compute_key
+
+STARTING_FEN: str = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+# Parsed FENs kept by GameState.from_fen(fen, cached=True)
+FEN_CACHE_SIZE: int = 4096
+
+SQUARE_NAMES: tuple[str, ...] = tuple(
+    coord.file + coord.rank for coord in Coordinate.all()
+)
+SQUARE_INDEX: dict[str, int] = {name: index for index, name in enumerate(SQUARE_NAMES)}
+_SIDES: dict[str, int] = {"w": WHITE, "b": BLACK}
+
+# Pawns can never stand on the first or last rank
+_BACK_RANKS: int = 0xFF000000000000FF
+# Castling right -> (king square, rook square) it needs
+_CASTLING_HOMES: tuple[tuple[int, int, int], ...] = (
+    (1, 4, 7),  # White kingside
+    (2, 4, 0),  # White queenside
+    (4, 60, 63),  # Black kingside
+    (8, 60, 56),  # Black queenside
+)
+# Rank of the skipped square when the side to move may capture en passant
+_EN_PASSANT_RANKS: tuple[int, int] = (5, 2)
+
+# Attack maps of a position nothing has asked about yet
+UNKNOWN_ATTACK_MAPS: tuple[None, None] = (None, None)
+
+
+class CastlingRights:
+    """Castling right bits, combined into one int."""
+
+    NONE = 0
+    WHITE_KINGSIDE = 1
+    WHITE_QUEENSIDE = 2
+    BLACK_KINGSIDE = 4
+    BLACK_QUEENSIDE = 8
+    ALL = 15
+
+    # (kingside, queenside) bits per engine color index
+    BY_COLOR: tuple[tuple[int, int], tuple[int, int]] = (
+        (WHITE_KINGSIDE, WHITE_QUEENSIDE),
+        (BLACK_KINGSIDE, BLACK_QUEENSIDE),
+    )
+
+    FEN_LETTERS: tuple[tuple[str, int], ...] = (
+        ("K", WHITE_KINGSIDE),
+        ("Q", WHITE_QUEENSIDE),
+        ("k", BLACK_KINGSIDE),
+        ("q", BLACK_QUEENSIDE),
+    )
+
+    # King destination -> (rook from, rook to)
+    ROOK_MOVES: dict[int, tuple[int, int]] = {
+        6: (7, 5),
+        2: (0, 3),
+        62: (63, 61),
+        58: (56, 59),
+    }
+
+
+# Castling rights kept when a move starts or ends on a square; moving the
+# king or a rook (or capturing a rook) loses the matching rights
+CASTLING_KEPT_AFTER_TOUCHING: tuple[int, ...] = tuple(
+    CastlingRights.ALL
+    & ~{
+        0: CastlingRights.WHITE_QUEENSIDE,
+        4: CastlingRights.WHITE_KINGSIDE | CastlingRights.WHITE_QUEENSIDE,
+        7: CastlingRights.WHITE_KINGSIDE,
+        56: CastlingRights.BLACK_QUEENSIDE,
+        60: CastlingRights.BLACK_KINGSIDE | CastlingRights.BLACK_QUEENSIDE,
+        63: CastlingRights.BLACK_KINGSIDE,
+    }.get(square, CastlingRights.NONE)
+    for square in range(64)
+)
+
+
+class GameState:
+    """A chess position: board plus the state needed to generate moves."""
+
+    __slots__ = (
+        "board",
+        "side_to_move",
+        "castling",
+        "en_passant",
+        "halfmove_clock",
+        "fullmove_number",
+        "zobrist_key",
+        "midgame_score",
+        "endgame_score",
+        "phase",
+        "attack_maps",
+    )
+
+    def __init__(
+        self,
+        board: Board,
+        side_to_move: int = WHITE,
+        castling: int = CastlingRights.NONE,
+        en_passant: int | None = None,
+        halfmove_clock: int = 0,
+        fullmove_number: int = 1,
+    ) -> None:
+        self.board: Board = board
+        self.side_to_move: int = side_to_move  # Engine color index
+        self.castling: int = castling
+        self.en_passant: int | None = en_passant  # Square a pawn skipped over
+        self.halfmove_clock: int = halfmove_clock
+        self.fullmove_number: int = fullmove_number
+        # Kept up to date by MoveExecuter; recomputed only here
+        self.zobrist_key: int = compute_key(board, side_to_move, castling, en_passant)
+        # Piece-square sums from white's point of view and the game phase,
+        # kept up to date the same way (see engine.pst)
+        self.midgame_score: int
+        self.endgame_score: int
+        self.phase: int
+        self.midgame_score, self.endgame_score, self.phase = compute_scores(board)
+        # Attacked squares per color, filled in lazily by engine.rules
+        self.attack_maps: tuple[int | None, int | None] = UNKNOWN_ATTACK_MAPS
+
+    @classmethod
+    def initial(cls) -> GameState:
+        """The standard starting position."""
+        return cls(Board.starting_position(), WHITE, CastlingRights.ALL)
+
+    @classmethod
+    def from_fen(cls, fen: str, cached: bool = False) -> GameState:
+        """
+        Parse a position from Forsyth-Edwards Notation.
+        With cached=True, repeated FENs are copied from an LRU cache of
+        frozen positions instead of being parsed again.
+        """
+        if cached:
+            return frozen_from_fen(fen).thaw()
+
+        fields: list[str] = fen.split()
+        if len(fields) == 4:
+            fields += ["0", "1"]  # EPD-style FEN without clocks
+        if len(fields) != 6:
+            raise ValueError(f"FEN must have 6 fields: {fen}")
+        placement, side, castling, en_passant, halfmove, fullmove = fields
+
+        board: Board = Board.from_fen(placement)
+        if side not in _SIDES:
+            raise ValueError(f"Invalid side to move: {side}")
+        _check_placement(board, _SIDES[side], fen)
+
+        rights: int = CastlingRights.NONE
+        if castling != "-":
+            for letter, bit in CastlingRights.FEN_LETTERS:
+                if letter in castling:
+                    rights |= bit
+        # A right is meaningless once its king or rook has left home
+        white_pieces, black_pieces = board.pieces
+        for bit, king, rook in _CASTLING_HOMES:
+            pieces: list[int] = white_pieces if king == 4 else black_pieces
+            if not (pieces[KING] >> king & 1 and pieces[ROOK] >> rook & 1):
+                rights &= ~bit
+
+        en_passant_square: int | None = None
+        if en_passant != "-":
+            if en_passant not in SQUARE_INDEX:
+                raise ValueError(f"Invalid en passant square: {en_passant}")
+            en_passant_square = SQUARE_INDEX[en_passant]
+            if not _en_passant_possible(board, _SIDES[side], en_passant_square):
+                raise ValueError(f"Impossible en passant square: {en_passant}")
+
+        try:
+            return cls(
+                board,
+                _SIDES[side],
+                rights,
+                en_passant_square,
+                int(halfmove),
+                int(fullmove),
+            )
+        except ValueError:
+            raise ValueError(f"Invalid FEN move counters: {fen}") from None
+
+    def to_fen(self) -> str:
+        """Serialize the position as Forsyth-Edwards Notation."""
+        castling: str = "".join(
+            letter for letter, bit in CastlingRights.FEN_LETTERS if self.castling & bit
+        )
+        return " ".join(
+            (
+                self.board.to_fen(),
+                "w" if self.side_to_move == WHITE else "b",
+                castling or "-",
+                "-" if self.en_passant is None else SQUARE_NAMES[self.en_passant],
+                str(self.halfmove_clock),
+                str(self.fullmove_number),
+            )
+        )
+
+    def freeze(self) -> FrozenState:
+        """Take an immutable, hashable snapshot of the position."""
+        pieces: list[list[int]] = self.board.pieces
+        return FrozenState(
+            (*pieces[WHITE], *pieces[BLACK]),
+            self.side_to_move,
+            self.castling,
+            self.en_passant,
+            self.halfmove_clock,
+            self.fullmove_number,
+            self.zobrist_key,
+            self.midgame_score,
+            self.endgame_score,
+            self.phase,
+        )
+
+    @property
+    def turn(self) -> Color:
+        """Side to move as a Color."""
+        return COLORS[self.side_to_move]
+
+    @property
+    def en_passant_coord(self) -> Coordinate | None:
+        if self.en_passant is None:
+            return None
+        return Coordinate.from_index(self.en_passant)
+
+    def copy(self) -> GameState:
+        """Return an independent copy."""
+        return GameState(
+            self.board.copy(),
+            self.side_to_move,
+            self.castling,
+            self.en_passant,
+            self.halfmove_clock,
+            self.fullmove_number,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GameState):
+            return False
+        return (
+            self.board == other.board
+            and self.side_to_move == other.side_to_move
+            and self.castling == other.castling
+            and self.en_passant == other.en_passant
+            and self.halfmove_clock == other.halfmove_clock
+            and self.fullmove_number == other.fullmove_number
+        )
+
+    __hash__ = None  # type: ignore[assignment]  # Mutable
+
+    def __repr__(self) -> str:
+        side: str = "white" if self.side_to_move == WHITE else "black"
+        return f"GameState({side} to move)"
+
+
+class FrozenState(NamedTuple):
+    """Immutable snapshot of a GameState; safe to cache and share."""
+
+    pieces: tuple[int, ...]  # White's six bitboards, then black's
+    side_to_move: int
+    castling: int
+    en_passant: int | None
+    halfmove_clock: int
+    fullmove_number: int
+    zobrist_key: int
+    midgame_score: int
+    endgame_score: int
+    phase: int
+
+    def thaw(self) -> GameState:
+        """Build a mutable GameState (key and scores are reused, not recomputed)."""
+        state: GameState = GameState.__new__(GameState)
+        state.board = Board.from_bitboards(self.pieces[:6], self.pieces[6:])
+        state.side_to_move = self.side_to_move
+        state.castling = self.castling
+        state.en_passant = self.en_passant
+        state.halfmove_clock = self.halfmove_clock
+        state.fullmove_number = self.fullmove_number
+        state.zobrist_key = self.zobrist_key
+        state.midgame_score = self.midgame_score
+        state.endgame_score = self.endgame_score
+        state.phase = self.phase
+        state.attack_maps = UNKNOWN_ATTACK_MAPS
+        return state
+
+
+def _en_passant_possible(board: Board, side_to_move: int, square: int) -> bool:
+    """
+    Whether the opponent's last move can have been a double push over this
+    square: right rank, the pawn just beyond it, and both squares it crossed
+    empty. Move generation and MoveExecuter rely on it.
+    """
+    if square >> 3 != _EN_PASSANT_RANKS[side_to_move]:
+        return False
+    forward: int = -8 if side_to_move == WHITE else 8  # The pushing pawn's way
+    pawn: int = square + forward
+    start: int = square - forward
+    return bool(
+        board.pieces[side_to_move ^ 1][PAWN] >> pawn & 1
+        and not board.occupied >> square & 1
+        and not board.occupied >> start & 1
+    )
+
+
+def _check_placement(board: Board, side_to_move: int, fen: str) -> None:
+    """Reject placements no game can reach; move generation assumes them."""
+    for color, name in ((WHITE, "white"), (BLACK, "black")):
+        if board.pieces[color][KING].bit_count() != 1:
+            raise ValueError(f"FEN must have exactly one {name} king: {fen}")
+    if (board.pieces[WHITE][PAWN] | board.pieces[BLACK][PAWN]) & _BACK_RANKS:
+        raise ValueError(f"FEN has a pawn on the first or last rank: {fen}")
+    # engine.rules imports this module
+    from engine.rules import compute_attack_map
+
+    waiting: int = side_to_move ^ 1
+    if compute_attack_map(board, side_to_move) & board.pieces[waiting][KING]:
+        raise ValueError(f"Side not to move is in check: {fen}")
+
+
+@lru_cache(maxsize=FEN_CACHE_SIZE)
+def frozen_from_fen(fen: str) -> FrozenState:
+    """Parse a FEN into a frozen position, remembering recent results."""
+    return GameState.from_fen(fen).freeze()
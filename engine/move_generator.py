@@ -0,0 +1,297 @@
+"""
+Legal move generation.
+Finds checkers and pinned pieces once per position and only emits legal moves.
+"""
+
+from __future__ import annotations
+from core.bitboard import (
+    BETWEEN,
+    FULL,
+    KING_ATTACKS,
+    KNIGHT_ATTACKS,
+    PAWN_ATTACKS,
+    RANK_MASKS,
+    SQUARE_BITS,
+    iter_squares,
+)
+from core.color import Color
+from core.magic import bishop_attacks, queen_attacks, rook_attacks
+from commands.move import PROMOTION_PIECES, Move, MoveFlag
+from engine.board import (
+    BISHOP,
+    KING,
+    KNIGHT,
+    PAWN,
+    QUEEN,
+    ROOK,
+    WHITE,
+    Board,
+)
+from engine.game_state import CastlingRights, GameState
+from engine.rules import attack_map, is_check
+
+# Pawn attack bitboards indexed by engine color
+_PAWN_ATTACKS: tuple[tuple[int, ...], tuple[int, ...]] = (
+    PAWN_ATTACKS[Color.WHITE],
+    PAWN_ATTACKS[Color.BLACK],
+)
+
+# Castling: (right bit, king from, king to, squares that must be empty,
+# squares the king crosses that must not be attacked) per color
+_CASTLING: tuple[tuple[tuple[int, int, int, int, int], ...], ...] = (
+    (
+        (
+            CastlingRights.WHITE_KINGSIDE,
+            4,
+            6,
+            SQUARE_BITS[5] | SQUARE_BITS[6],
+            SQUARE_BITS[5] | SQUARE_BITS[6],
+        ),
+        (
+            CastlingRights.WHITE_QUEENSIDE,
+            4,
+            2,
+            SQUARE_BITS[1] | SQUARE_BITS[2] | SQUARE_BITS[3],
+            SQUARE_BITS[3] | SQUARE_BITS[2],
+        ),
+    ),
+    (
+        (
+            CastlingRights.BLACK_KINGSIDE,
+            60,
+            62,
+            SQUARE_BITS[61] | SQUARE_BITS[62],
+            SQUARE_BITS[61] | SQUARE_BITS[62],
+        ),
+        (
+            CastlingRights.BLACK_QUEENSIDE,
+            60,
+            58,
+            SQUARE_BITS[57] | SQUARE_BITS[58] | SQUARE_BITS[59],
+            SQUARE_BITS[59] | SQUARE_BITS[58],
+        ),
+    ),
+)
+
+# Above this many king target squares, building the opponent's whole attack
+# map is cheaper than testing the targets one at a time
+_KING_TARGETS_PER_MAP: int = 3
+
+_PROMOTION_RANK: tuple[int, int] = (RANK_MASKS[7], RANK_MASKS[0])
+# Rank a pawn reaches with a single push from its starting rank
+_FIRST_PUSH_RANK: tuple[int, int] = (RANK_MASKS[2], RANK_MASKS[5])
+
+
+def attackers_to(board: Board, square: int, by_color: int, occupied: int) -> int:
+    """Bitboard of by_color pieces attacking a square, given occupancy."""
+    pieces: list[int] = board.pieces[by_color]
+    return (
+        # A pawn attacks the square if the square "attacks" it as an enemy pawn
+        (_PAWN_ATTACKS[by_color ^ 1][square] & pieces[PAWN])
+        | (KNIGHT_ATTACKS[square] & pieces[KNIGHT])
+        | (KING_ATTACKS[square] & pieces[KING])
+        | (bishop_attacks(square, occupied) & (pieces[BISHOP] | pieces[QUEEN]))
+        | (rook_attacks(square, occupied) & (pieces[ROOK] | pieces[QUEEN]))
+    )
+
+
+def is_square_attacked(
+    board: Board, square: int, by_color: int, occupied: int | None = None
+) -> bool:
+    """Check whether by_color attacks a square."""
+    if occupied is None:
+        occupied = board.occupied
+    return attackers_to(board, square, by_color, occupied) != 0
+
+
+def in_check(state: GameState) -> bool:
+    """Check whether the side to move is in check."""
+    return is_check(state)
+
+
+def find_pins(board: Board, us: int, king_square: int) -> dict[int, int]:
+    """Map each pinned piece's square to the ray it may still move along."""
+    them: int = us ^ 1
+    their_pieces: list[int] = board.pieces[them]
+    their_occupied: int = board.colors[them]
+
+    # Enemy sliders that would see the king if our pieces were removed
+    snipers: int = (
+        rook_attacks(king_square, their_occupied)
+        & (their_pieces[ROOK] | their_pieces[QUEEN])
+    ) | (
+        bishop_attacks(king_square, their_occupied)
+        & (their_pieces[BISHOP] | their_pieces[QUEEN])
+    )
+
+    pins: dict[int, int] = {}
+    for sniper in iter_squares(snipers):
+        blockers: int = BETWEEN[king_square][sniper] & board.occupied
+        # Exactly one piece in between, and it's ours
+        if blockers and not blockers & (blockers - 1) and blockers & board.colors[us]:
+            pinned: int = blockers.bit_length() - 1
+            pins[pinned] = BETWEEN[king_square][sniper] | SQUARE_BITS[sniper]
+    return pins
+
+
+def generate_legal_moves(state: GameState) -> list[Move]:
+    """Generate all legal moves for the side to move."""
+    board: Board = state.board
+    us: int = state.side_to_move
+    them: int = us ^ 1
+    our_pieces: list[int] = board.pieces[us]
+    own: int = board.colors[us]
+    occupied: int = board.occupied
+    king_square: int = board.king_square(us)
+
+    moves: list[Move] = []
+    append = moves.append
+
+    # King moves, tested against the opponent's attack map when it is cached
+    # or cheaper than testing each target. Both see through our king, so it
+    # can't hide behind itself on a checking slider's ray.
+    king_targets: int = KING_ATTACKS[king_square] & ~own
+    danger: int | None = state.attack_maps[them]
+    if danger is None and king_targets.bit_count() > _KING_TARGETS_PER_MAP:
+        danger = attack_map(state, them)
+
+    if danger is not None:
+        for target in iter_squares(king_targets & ~danger):
+            append(Move(king_square, target))
+        checkers: int = 0
+        if danger & SQUARE_BITS[king_square]:
+            checkers = attackers_to(board, king_square, them, occupied)
+    else:
+        without_king: int = occupied ^ SQUARE_BITS[king_square]
+        for target in iter_squares(king_targets):
+            if not attackers_to(board, target, them, without_king):
+                append(Move(king_square, target))
+        checkers = attackers_to(board, king_square, them, occupied)
+
+    if checkers & (checkers - 1):
+        return moves  # Double check: only the king can move
+
+    if checkers:
+        checker: int = checkers.bit_length() - 1
+        # Capture the checker or block the line to it
+        check_mask: int = checkers | BETWEEN[king_square][checker]
+    else:
+        check_mask = FULL
+        _add_castling_moves(state, moves)
+
+    pins: dict[int, int] = find_pins(board, us, king_square)
+    targets_mask: int = ~own & check_mask
+
+    # Knights (a pinned knight can never move)
+    for square in iter_squares(our_pieces[KNIGHT]):
+        if square in pins:
+            continue
+        for target in iter_squares(KNIGHT_ATTACKS[square] & targets_mask):
+            append(Move(square, target))
+
+    # Sliders
+    for piece, attack_fn in (
+        (BISHOP, bishop_attacks),
+        (ROOK, rook_attacks),
+        (QUEEN, queen_attacks),
+    ):
+        for square in iter_squares(our_pieces[piece]):
+            attacks: int = attack_fn(square, occupied) & targets_mask
+            if square in pins:
+                attacks &= pins[square]
+            for target in iter_squares(attacks):
+                append(Move(square, target))
+
+    _add_pawn_moves(state, moves, check_mask, pins, king_square)
+    return moves
+
+
+def legal_moves_from(state: GameState, square: int) -> list[Move]:
+    """Legal moves of the piece on one square (e.g. for a UI click)."""
+    return [move for move in generate_legal_moves(state) if move.from_square == square]
+
+
+def _add_castling_moves(state: GameState, moves: list[Move]) -> None:
+    """Append castling moves (caller ensures the king isn't in check)."""
+    occupied: int = state.board.occupied
+    us: int = state.side_to_move
+    for right, king_from, king_to, must_be_empty, king_path in _CASTLING[us]:
+        if not state.castling & right or occupied & must_be_empty:
+            continue
+        if attack_map(state, us ^ 1) & king_path:
+            continue
+        moves.append(Move(king_from, king_to, None, MoveFlag.CASTLE))
+
+
+def _add_pawn_moves(
+    state: GameState,
+    moves: list[Move],
+    check_mask: int,
+    pins: dict[int, int],
+    king_square: int,
+) -> None:
+    """Append pushes, captures, promotions and en passant."""
+    board: Board = state.board
+    us: int = state.side_to_move
+    them: int = us ^ 1
+    enemy: int = board.colors[them]
+    empty: int = ~board.occupied & FULL
+    forward: int = 8 if us == WHITE else -8
+    promotion_rank: int = _PROMOTION_RANK[us]
+    first_push_rank: int = _FIRST_PUSH_RANK[us]
+    pawn_attacks: tuple[int, ...] = _PAWN_ATTACKS[us]
+
+    for square in iter_squares(board.pieces[us][PAWN]):
+        allowed: int = check_mask & pins.get(square, FULL)
+
+        targets: int = pawn_attacks[square] & enemy
+        one_step: int = square + forward
+        if SQUARE_BITS[one_step] & empty:
+            targets |= SQUARE_BITS[one_step]
+            if SQUARE_BITS[one_step] & first_push_rank:
+                two_steps: int = one_step + forward
+                if SQUARE_BITS[two_steps] & empty & allowed:
+                    moves.append(Move(square, two_steps, None, MoveFlag.DOUBLE_PUSH))
+
+        for target in iter_squares(targets & allowed):
+            if SQUARE_BITS[target] & promotion_rank:
+                for promotion in PROMOTION_PIECES:
+                    moves.append(Move(square, target, promotion))
+            else:
+                moves.append(Move(square, target))
+
+    if state.en_passant is not None:
+        _add_en_passant(state, moves, king_square)
+
+
+def _add_en_passant(state: GameState, moves: list[Move], king_square: int) -> None:
+    """Append en passant captures, verified by replaying the occupancy change."""
+    board: Board = state.board
+    us: int = state.side_to_move
+    them: int = us ^ 1
+    target: int = state.en_passant
+    captured: int = target - 8 if us == WHITE else target + 8
+    their_pieces: list[int] = board.pieces[them]
+
+    # Our pawns that attack the en passant square
+    capturers: int = _PAWN_ATTACKS[them][target] & board.pieces[us][PAWN]
+    for square in iter_squares(capturers):
+        # Rare enough to check directly: remove both pawns, add ours on target
+        occupied: int = (
+            board.occupied ^ SQUARE_BITS[square] ^ SQUARE_BITS[captured]
+            | SQUARE_BITS[target]
+        )
+        remaining: int = ~SQUARE_BITS[captured]
+        if rook_attacks(king_square, occupied) & (
+            their_pieces[ROOK] | their_pieces[QUEEN]
+        ):
+            continue
+        if bishop_attacks(king_square, occupied) & (
+            their_pieces[BISHOP] | their_pieces[QUEEN]
+        ):
+            continue
+        if (KNIGHT_ATTACKS[king_square] & their_pieces[KNIGHT]) | (
+            _PAWN_ATTACKS[us][king_square] & their_pieces[PAWN] & remaining
+        ):
+            continue
+        moves.append(Move(square, target, None, MoveFlag.EN_PASSANT))
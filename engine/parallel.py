@@ -0,0 +1,145 @@
+"""
+Parallel search (Lazy SMP).
+Several processes search the same root and share one transposition table
+in shared memory; the parent merges what they report.
+"""
+
+from __future__ import annotations
+import multiprocessing
+import os
+import queue
+from multiprocessing import shared_memory
+from multiprocessing.synchronize import Event
+from typing import Callable, Iterable
+from engine.game_state import GameState
+from engine.search import Searcher, SearchLimits, SearchResult
+from engine.transposition import TranspositionTable
+
+# How long to wait for helpers to report after the main search returns
+_HELPER_TIMEOUT: float = 5.0
+
+
+def default_workers() -> int:
+    """One worker per available core."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _helper(
+    table_name: str,
+    table_mb: float,
+    state: GameState,
+    limits: SearchLimits,
+    previous_keys: list[int],
+    start_depth: int,
+    stop_event: Event,
+    results: multiprocessing.Queue,
+) -> None:
+    """Worker process: search until stopped and report the result."""
+    memory = shared_memory.SharedMemory(name=table_name)
+    table: TranspositionTable | None = None
+    try:
+        table = TranspositionTable(table_mb, buffer=memory.buf)
+        result: SearchResult = Searcher(table, stop_event).search(
+            state, limits, previous_keys, start_depth=start_depth
+        )
+        results.put(result)
+    finally:
+        # Views into the shared block must go before it can be closed; an
+        # exception's traceback may still hold the searcher and its table
+        if table is not None:
+            table.release()
+        memory.close()
+
+
+def _better(candidate: SearchResult, current: SearchResult) -> bool:
+    """Prefer deeper completed iterations; the main search wins ties."""
+    return candidate.best_move is not None and candidate.depth > current.depth
+
+
+def parallel_search(
+    state: GameState,
+    limits: SearchLimits,
+    workers: int | None = None,
+    table_mb: float = 64,
+    previous_keys: Iterable[int] = (),
+    on_iteration: Callable[[SearchResult], None] | None = None,
+) -> SearchResult:
+    """
+    Search with the parent as the main searcher and workers - 1 helper
+    processes. Helpers alternate starting depths so they fill the shared
+    table one iteration ahead of each other, and all stop when the main
+    search finishes. The node count is the total over all processes.
+    """
+    workers = workers or default_workers()
+    keys: list[int] = list(previous_keys)
+    if workers <= 1:
+        return Searcher(TranspositionTable(table_mb)).search(
+            state, limits, keys, on_iteration
+        )
+
+    table_bytes: int = TranspositionTable.size_in_bytes(table_mb)
+    memory = shared_memory.SharedMemory(create=True, size=table_bytes)
+    context = multiprocessing.get_context()
+    stop_event = context.Event()
+    results: multiprocessing.Queue = context.Queue()
+    # Split a node budget so the total stays within it
+    worker_limits = SearchLimits(
+        limits.depth,
+        limits.movetime,
+        limits.nodes // workers if limits.nodes is not None else None,
+    )
+    processes: list[multiprocessing.Process] = []
+    table: TranspositionTable | None = None
+
+    try:
+        for worker in range(1, workers):
+            process = context.Process(
+                target=_helper,
+                args=(
+                    memory.name,
+                    table_mb,
+                    state,
+                    worker_limits,
+                    keys,
+                    1 + worker % 2,
+                    stop_event,
+                    results,
+                ),
+                daemon=True,
+            )
+            process.start()
+            processes.append(process)
+
+        table = TranspositionTable(table_mb, buffer=memory.buf)
+        result: SearchResult = Searcher(table).search(
+            state, worker_limits, keys, on_iteration
+        )
+        stop_event.set()
+
+        nodes: int = result.nodes
+        seconds: float = result.seconds
+        for _ in processes:
+            try:
+                helper_result: SearchResult = results.get(timeout=_HELPER_TIMEOUT)
+            except queue.Empty:
+                break
+            nodes += helper_result.nodes
+            if _better(helper_result, result):
+                result = helper_result
+        result.nodes = nodes
+        result.seconds = seconds
+        return result
+    finally:
+        stop_event.set()
+        for process in processes:
+            process.join(timeout=_HELPER_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+        if table is not None:
+            table.release()
+        try:
+            memory.close()
+        finally:
+            memory.unlink()
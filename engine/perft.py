@@ -0,0 +1,100 @@
+"""
+Perft: count leaf nodes of the legal move tree.
+Used as the move generator's correctness oracle and throughput benchmark.
+"""
+
+from __future__ import annotations
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+from commands.move_executer import MoveExecuter
+from engine.game_state import STARTING_FEN, GameState
+from engine.move_generator import generate_legal_moves
+
+# Standard positions from the chess programming community's perft results
+REFERENCE_POSITIONS: dict[str, str] = {
+    "start": STARTING_FEN,
+    "kiwipete": "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+    "en-passant": "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+    "promotion": "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+    "promotion-mirrored": "r2q1rk1/pP1p2pp/Q4n2/bbp1p3/Np6/1B3NBn/pPPP1PPP/R3K2R b KQ - 0 1",
+    "talkchess": "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+    "middlegame": "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+}
+
+
+@dataclass
+class PerftResult:
+    """Node count and timing for one perft run."""
+
+    depth: int
+    nodes: int
+    seconds: float
+    divide: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.seconds if self.seconds > 0 else 0.0
+
+
+def perft(state: GameState, depth: int) -> int:
+    """Count leaf nodes at the given depth (the state is restored afterwards)."""
+    return _perft(MoveExecuter(state), depth)
+
+
+def _perft(executer: MoveExecuter, depth: int) -> int:
+    moves = generate_legal_moves(executer.state)
+    if depth <= 1:
+        return len(moves) if depth == 1 else 1
+
+    nodes: int = 0
+    for move in moves:
+        executer.make(move)
+        nodes += _perft(executer, depth - 1)
+        executer.unmake()
+    return nodes
+
+
+def divide(state: GameState, depth: int) -> dict[str, int]:
+    """Leaf node count below each root move (for diffing against other engines)."""
+    executer = MoveExecuter(state)
+    counts: dict[str, int] = {}
+    for move in generate_legal_moves(state):
+        executer.make(move)
+        counts[move.uci] = _perft(executer, depth - 1)
+        executer.unmake()
+    return counts
+
+
+def run_perft(state: GameState, depth: int, split: bool = False) -> PerftResult:
+    """Time a perft run, optionally keeping the per-move breakdown."""
+    start: float = time.perf_counter()
+    if split:
+        counts = divide(state, depth)
+        nodes: int = sum(counts.values())
+    else:
+        counts = {}
+        nodes = perft(state, depth)
+    return PerftResult(depth, nodes, time.perf_counter() - start, counts)
+
+
+def read_perft_suite(path: str | Path) -> Iterator[tuple[str, dict[int, int]]]:
+    """
+    Read an EPD perft suite lazily.
+    Each line is a FEN followed by ';D<depth> <nodes>' fields.
+    """
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            fen, *fields = (part.strip() for part in line.split(";"))
+            expected: dict[int, int] = {}
+            for entry in fields:
+                label, _, count = entry.partition(" ")
+                if not label.startswith("D"):
+                    raise ValueError(f"Invalid perft suite field: {entry}")
+                expected[int(label[1:])] = int(count)
+            yield fen, expected
@@ -0,0 +1,148 @@
+"""
+Piece-square tables.
+Tapered middlegame and endgame values per (color, piece, square) and the
+game phase weights, kept incrementally in the game state.
+"""
+
+from __future__ import annotations
+from core.bitboard import iter_squares
+from engine.board import BLACK, WHITE, Board
+
+# Centipawn values indexed by engine piece index (king is never traded)
+PIECE_VALUES: tuple[int, ...] = (100, 320, 330, 500, 900, 0)
+
+# Phase contributed by each piece; all minor and major pieces on the board
+# make MAX_PHASE (pure middlegame), bare kings and pawns make 0 (endgame)
+PHASE_WEIGHTS: tuple[int, ...] = (0, 1, 1, 2, 4, 0)
+MAX_PHASE: int = 24
+
+# Bonuses for white, written as the board is seen from white's side
+# (rank 8 first); black uses the same tables mirrored vertically
+# fmt: off
+_PAWN_MIDGAME: tuple[int, ...] = (
+     0,   0,   0,   0,   0,   0,   0,   0,
+    50,  50,  50,  50,  50,  50,  50,  50,
+    10,  10,  20,  30,  30,  20,  10,  10,
+     5,   5,  10,  25,  25,  10,   5,   5,
+     0,   0,   0,  20,  20,   0,   0,   0,
+     5,  -5, -10,   0,   0, -10,  -5,   5,
+     5,  10,  10, -20, -20,  10,  10,   5,
+     0,   0,   0,   0,   0,   0,   0,   0,
+)
+_PAWN_ENDGAME: tuple[int, ...] = (
+     0,   0,   0,   0,   0,   0,   0,   0,
+    80,  80,  80,  80,  80,  80,  80,  80,
+    50,  50,  50,  50,  50,  50,  50,  50,
+    30,  30,  30,  30,  30,  30,  30,  30,
+    15,  15,  15,  15,  15,  15,  15,  15,
+     5,   5,   5,   5,   5,   5,   5,   5,
+     0,   0,   0,   0,   0,   0,   0,   0,
+     0,   0,   0,   0,   0,   0,   0,   0,
+)
+_KNIGHT: tuple[int, ...] = (
+    -50, -40, -30, -30, -30, -30, -40, -50,
+    -40, -20,   0,   0,   0,   0, -20, -40,
+    -30,   0,  10,  15,  15,  10,   0, -30,
+    -30,   5,  15,  20,  20,  15,   5, -30,
+    -30,   0,  15,  20,  20,  15,   0, -30,
+    -30,   5,  10,  15,  15,  10,   5, -30,
+    -40, -20,   0,   5,   5,   0, -20, -40,
+    -50, -40, -30, -30, -30, -30, -40, -50,
+)
+_BISHOP: tuple[int, ...] = (
+    -20, -10, -10, -10, -10, -10, -10, -20,
+    -10,   0,   0,   0,   0,   0,   0, -10,
+    -10,   0,   5,  10,  10,   5,   0, -10,
+    -10,   5,   5,  10,  10,   5,   5, -10,
+    -10,   0,  10,  10,  10,  10,   0, -10,
+    -10,  10,  10,  10,  10,  10,  10, -10,
+    -10,   5,   0,   0,   0,   0,   5, -10,
+    -20, -10, -10, -10, -10, -10, -10, -20,
+)
+_ROOK: tuple[int, ...] = (
+     0,   0,   0,   0,   0,   0,   0,   0,
+     5,  10,  10,  10,  10,  10,  10,   5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+     0,   0,   0,   5,   5,   0,   0,   0,
+)
+_QUEEN: tuple[int, ...] = (
+    -20, -10, -10,  -5,  -5, -10, -10, -20,
+    -10,   0,   0,   0,   0,   0,   0, -10,
+    -10,   0,   5,   5,   5,   5,   0, -10,
+     -5,   0,   5,   5,   5,   5,   0,  -5,
+      0,   0,   5,   5,   5,   5,   0,  -5,
+    -10,   5,   5,   5,   5,   5,   0, -10,
+    -10,   0,   5,   0,   0,   0,   0, -10,
+    -20, -10, -10,  -5,  -5, -10, -10, -20,
+)
+_KING_MIDGAME: tuple[int, ...] = (
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -20, -30, -30, -40, -40, -30, -30, -20,
+    -10, -20, -20, -20, -20, -20, -20, -10,
+     20,  20,   0,   0,   0,   0,  20,  20,
+     20,  30,  10,   0,   0,  10,  30,  20,
+)
+_KING_ENDGAME: tuple[int, ...] = (
+    -50, -40, -30, -20, -20, -30, -40, -50,
+    -30, -20, -10,   0,   0, -10, -20, -30,
+    -30, -10,  20,  30,  30,  20, -10, -30,
+    -30, -10,  30,  40,  40,  30, -10, -30,
+    -30, -10,  30,  40,  40,  30, -10, -30,
+    -30, -10,  20,  30,  30,  20, -10, -30,
+    -30, -30,   0,   0,   0,   0, -30, -30,
+    -50, -30, -30, -30, -30, -30, -30, -50,
+)
+# fmt: on
+
+
+def _signed_tables(
+    tables: tuple[tuple[int, ...], ...],
+) -> tuple[tuple[tuple[int, ...], ...], ...]:
+    """
+    Material plus bonus per [color][piece][square] in square index order
+    (a1=0), positive for white and negative for black.
+    """
+    white: tuple[tuple[int, ...], ...] = tuple(
+        tuple(
+            PIECE_VALUES[piece] + table[(7 - square // 8) * 8 + square % 8]
+            for square in range(64)
+        )
+        for piece, table in enumerate(tables)
+    )
+    black: tuple[tuple[int, ...], ...] = tuple(
+        tuple(-values[square ^ 56] for square in range(64)) for values in white
+    )
+    return white, black
+
+
+# MIDGAME_VALUES[color][piece][square], from white's point of view
+MIDGAME_VALUES: tuple[tuple[tuple[int, ...], ...], ...] = _signed_tables(
+    (_PAWN_MIDGAME, _KNIGHT, _BISHOP, _ROOK, _QUEEN, _KING_MIDGAME)
+)
+# ENDGAME_VALUES[color][piece][square], from white's point of view
+ENDGAME_VALUES: tuple[tuple[tuple[int, ...], ...], ...] = _signed_tables(
+    (_PAWN_ENDGAME, _KNIGHT, _BISHOP, _ROOK, _QUEEN, _KING_ENDGAME)
+)
+
+
+def compute_scores(board: Board) -> tuple[int, int, int]:
+    """(midgame, endgame, phase) of a board from scratch."""
+    midgame: int = 0
+    endgame: int = 0
+    phase: int = 0
+    for color in (WHITE, BLACK):
+        for piece, bitboard in enumerate(board.pieces[color]):
+            midgame_table: tuple[int, ...] = MIDGAME_VALUES[color][piece]
+            endgame_table: tuple[int, ...] = ENDGAME_VALUES[color][piece]
+            for square in iter_squares(bitboard):
+                midgame += midgame_table[square]
+                endgame += endgame_table[square]
+                phase += PHASE_WEIGHTS[piece]
+    return midgame, endgame, phase
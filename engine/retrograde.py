@@ -0,0 +1,188 @@
+"""
+Tablebase generation.
+Retrograde analysis of KQvK, KRvK and KPvK: positions are solved backwards
+from checkmates, in order of distance to mate, and written as table files
+for engine.tablebase.
+"""
+
+from __future__ import annotations
+from array import array
+from collections import defaultdict
+from pathlib import Path
+from core.bitboard import KING_ATTACKS, PAWN_ATTACKS, SQUARE_BITS, iter_squares
+from core.color import Color
+from core.magic import queen_attacks, rook_attacks
+from engine.board import BLACK, PAWN, QUEEN, ROOK, WHITE
+from engine.tablebase import (
+    ENTRY_COUNT,
+    TABLES,
+    split_index,
+    table_index,
+    table_path,
+    write_table,
+)
+
+# Black-to-move entries are the second half of every table
+_BLACK_ENTRIES: int = ENTRY_COUNT // 2
+# Marks a black-to-move entry where black can take the piece: never lost
+_ESCAPES: int = -1
+
+_WHITE_PAWN_ATTACKS: tuple[int, ...] = PAWN_ATTACKS[Color.WHITE]
+
+
+def _piece_attacks(piece: int, square: int, occupied: int) -> int:
+    if piece == QUEEN:
+        return queen_attacks(square, occupied)
+    if piece == ROOK:
+        return rook_attacks(square, occupied)
+    return _WHITE_PAWN_ATTACKS[square]
+
+
+def _is_valid(
+    side: int, white_king: int, black_king: int, square: int, piece: int
+) -> bool:
+    """Whether a position can occur: no overlaps, kings apart, no check out of turn."""
+    if white_king == black_king or square in (white_king, black_king):
+        return False
+    if KING_ATTACKS[white_king] >> black_king & 1:
+        return False
+    if piece == PAWN and not 8 <= square < 56:
+        return False
+    if side == WHITE:
+        occupied: int = (
+            SQUARE_BITS[white_king] | SQUARE_BITS[black_king] | SQUARE_BITS[square]
+        )
+        if _piece_attacks(piece, square, occupied) >> black_king & 1:
+            return False
+    return True
+
+
+def _white_predecessors(
+    white_king: int, black_king: int, square: int, piece: int
+) -> list[int]:
+    """White-to-move entries with a white move leading to this position."""
+    occupied: int = (
+        SQUARE_BITS[white_king] | SQUARE_BITS[black_king] | SQUARE_BITS[square]
+    )
+    kings: int = KING_ATTACKS[white_king] & ~occupied & ~KING_ATTACKS[black_king]
+    entries: list[int] = [
+        table_index(WHITE, king, black_king, square)
+        for king in iter_squares(kings)
+        if _is_valid(WHITE, king, black_king, square, piece)  # Discovered checks
+    ]
+    if piece == PAWN:
+        origins: list[int] = []
+        if square >= 16 and not occupied >> (square - 8) & 1:
+            origins.append(square - 8)
+            if 24 <= square < 32 and not occupied >> (square - 16) & 1:
+                origins.append(square - 16)  # Double push
+        entries += [
+            table_index(WHITE, white_king, black_king, origin)
+            for origin in origins
+            if not _WHITE_PAWN_ATTACKS[origin] >> black_king & 1
+        ]
+        return entries
+
+    # The piece can't have come from a square where it would give check
+    checking: int = _piece_attacks(piece, black_king, occupied ^ SQUARE_BITS[square])
+    sliding: int = _piece_attacks(piece, square, occupied) & ~occupied & ~checking
+    entries += [
+        table_index(WHITE, white_king, black_king, origin)
+        for origin in iter_squares(sliding)
+    ]
+    return entries
+
+
+def _black_predecessors(
+    white_king: int, black_king: int, square: int, piece: int
+) -> list[int]:
+    """Black-to-move entries with a king move leading to this position."""
+    occupied: int = (
+        SQUARE_BITS[white_king] | SQUARE_BITS[black_king] | SQUARE_BITS[square]
+    )
+    kings: int = KING_ATTACKS[black_king] & ~occupied & ~KING_ATTACKS[white_king]
+    return [
+        table_index(BLACK, white_king, king, square) for king in iter_squares(kings)
+    ]
+
+
+def generate_table(piece: int, promotions: dict[int, array] | None = None) -> array:
+    """
+    Solve one ending with white's king and piece against black's king.
+    KPvK needs the solved tables of the pieces a pawn may promote to.
+    Returns the signed byte values engine.tablebase stores.
+    """
+    values: array = array("b", bytes(ENTRY_COUNT))
+    # Legal black moves not yet known to lose, per black-to-move entry
+    remaining: array = array("b", bytes(_BLACK_ENTRIES))
+    # Plies to mate -> entries decided at that distance
+    pending: defaultdict[int, list[int]] = defaultdict(list)
+
+    for index in range(_BLACK_ENTRIES, ENTRY_COUNT):
+        _, white_king, black_king, square = split_index(index)
+        if not _is_valid(BLACK, white_king, black_king, square, piece):
+            continue
+        occupied: int = SQUARE_BITS[white_king] | SQUARE_BITS[square]
+        attacked: int = KING_ATTACKS[white_king] | _piece_attacks(
+            piece, square, occupied
+        )
+        targets: int = KING_ATTACKS[black_king] & ~attacked
+        if targets & SQUARE_BITS[square]:
+            remaining[index - _BLACK_ENTRIES] = _ESCAPES
+        elif targets:
+            remaining[index - _BLACK_ENTRIES] = targets.bit_count()
+        elif attacked >> black_king & 1:
+            values[index] = -1  # Checkmated
+            pending[0].append(index)
+
+    if piece == PAWN:
+        for index in range(_BLACK_ENTRIES):
+            _, white_king, black_king, square = split_index(index)
+            if square < 48 or square + 8 in (white_king, black_king):
+                continue
+            if not _is_valid(WHITE, white_king, black_king, square, piece):
+                continue
+            plies: list[int] = [
+                -table[table_index(BLACK, white_king, black_king, square + 8)]
+                for table in (promotions or {}).values()
+                if table[table_index(BLACK, white_king, black_king, square + 8)] < 0
+            ]
+            if plies:
+                pending[min(plies)].append(index)
+
+    ply: int = 0
+    while pending:
+        for index in pending.pop(ply, ()):
+            side, white_king, black_king, square = split_index(index)
+            if side == BLACK:
+                # Lost for black: white wins a ply earlier by moving here
+                for entry in _white_predecessors(white_king, black_king, square, piece):
+                    if not values[entry]:
+                        pending[ply + 1].append(entry)
+                continue
+            if values[index]:
+                continue  # Already won faster
+            values[index] = ply
+            for entry in _black_predecessors(white_king, black_king, square, piece):
+                moves: int = remaining[entry - _BLACK_ENTRIES]
+                if moves > 0:
+                    remaining[entry - _BLACK_ENTRIES] = moves - 1
+                    if moves == 1:  # Every move loses; this one lasts longest
+                        values[entry] = -(ply + 1) - 1
+                        pending[ply + 1].append(entry)
+        ply += 1
+    return values
+
+
+def generate_tables(directory: str | Path) -> list[Path]:
+    """Solve and write every built-in table; returns the files written."""
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    solved: dict[int, array] = {}
+    paths: list[Path] = []
+    for name, piece in sorted(TABLES.items(), key=lambda item: item[1] == PAWN):
+        promotions: dict[int, array] | None = solved if piece == PAWN else None
+        solved[piece] = generate_table(piece, promotions)
+        path: Path = table_path(directory, name)
+        write_table(path, solved[piece])
+        paths.append(path)
+    return paths
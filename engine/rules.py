@@ -0,0 +1,76 @@
+"""
+Attack maps.
+Per-color bitboards of attacked squares, cached on the game state so check,
+castling and king-safety questions are single mask tests.
+"""
+
+from __future__ import annotations
+from core.bitboard import FILE_MASKS, FULL, KING_ATTACKS, KNIGHT_ATTACKS
+from core.magic import bishop_attacks, rook_attacks
+from engine.board import BISHOP, KING, KNIGHT, PAWN, QUEEN, ROOK, WHITE, Board
+from engine.game_state import GameState
+
+_NOT_A_FILE: int = FULL ^ FILE_MASKS[0]
+_NOT_H_FILE: int = FULL ^ FILE_MASKS[7]
+
+
+def pawn_attack_map(pawns: int, color: int) -> int:
+    """Squares attacked by a set of pawns, shifted all at once."""
+    if color == WHITE:
+        return ((pawns & _NOT_A_FILE) << 7 | (pawns & _NOT_H_FILE) << 9) & FULL
+    return (pawns & _NOT_A_FILE) >> 9 | (pawns & _NOT_H_FILE) >> 7
+
+
+def compute_attack_map(board: Board, color: int) -> int:
+    """
+    Every square color attacks. The enemy king is treated as transparent,
+    so squares behind it on a slider's line count as attacked and the king
+    can't step back along the line of a check.
+    """
+    pieces: list[int] = board.pieces[color]
+    occupied: int = board.occupied & ~board.pieces[color ^ 1][KING]
+
+    attacks: int = pawn_attack_map(pieces[PAWN], color)
+    knights: int = pieces[KNIGHT]
+    while knights:
+        bit: int = knights & -knights
+        attacks |= KNIGHT_ATTACKS[bit.bit_length() - 1]
+        knights ^= bit
+    diagonal: int = pieces[BISHOP] | pieces[QUEEN]
+    while diagonal:
+        bit = diagonal & -diagonal
+        attacks |= bishop_attacks(bit.bit_length() - 1, occupied)
+        diagonal ^= bit
+    orthogonal: int = pieces[ROOK] | pieces[QUEEN]
+    while orthogonal:
+        bit = orthogonal & -orthogonal
+        attacks |= rook_attacks(bit.bit_length() - 1, occupied)
+        orthogonal ^= bit
+    if pieces[KING]:
+        attacks |= KING_ATTACKS[pieces[KING].bit_length() - 1]
+    return attacks
+
+
+def attack_map(state: GameState, color: int) -> int:
+    """
+    Squares color attacks in this position, computed at most once per
+    position: MoveExecuter clears the cache on make and restores it on
+    unmake.
+    """
+    maps = state.attack_maps
+    attacks: int | None = maps[color]
+    if attacks is None:
+        attacks = compute_attack_map(state.board, color)
+        state.attack_maps = (attacks, maps[1]) if color == WHITE else (maps[0], attacks)
+    return attacks
+
+
+def is_attacked(state: GameState, square: int, by_color: int) -> bool:
+    """Whether by_color attacks a square in the current position."""
+    return bool(attack_map(state, by_color) >> square & 1)
+
+
+def is_check(state: GameState) -> bool:
+    """Whether the side to move is in check."""
+    us: int = state.side_to_move
+    return bool(attack_map(state, us ^ 1) & state.board.pieces[us][KING])
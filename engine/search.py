@@ -0,0 +1,545 @@
+"""
+Alpha-beta search.
+Negamax with iterative deepening, a transposition table, move ordering,
+quiescence search and wall-clock / node budgets.
+"""
+
+from __future__ import annotations
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Protocol
+from commands.move import Move, MoveFlag
+from commands.move_executer import MoveExecuter
+from core.bitboard import SQUARE_BITS
+from engine.board import PAWN
+from engine.evaluation import evaluate
+from engine.game_state import GameState
+from engine.move_generator import generate_legal_moves, in_check, is_square_attacked
+from engine.pst import PIECE_VALUES
+from engine.tablebase import MAX_PIECES, Tablebase, TablebaseResult
+from engine.transposition import Bound, TranspositionTable
+
+MATE_SCORE: int = 30000
+MATE_THRESHOLD: int = MATE_SCORE - 1000  # Scores beyond this are mates
+INFINITY: int = 32000
+MAX_PLY: int = 128
+# Depth searched when no depth, time or node limit is given
+DEFAULT_DEPTH: int = 6
+
+# Ordering tiers (history scores stay below KILLER_SCORE)
+_HASH_MOVE_SCORE: int = 1 << 30
+_CAPTURE_SCORE: int = 1 << 22
+_PROMOTION_SCORE: int = 1 << 21
+_KILLER_SCORE: int = 1 << 20
+_HISTORY_LIMIT: int = _KILLER_SCORE - 1
+
+# Largest positional swing assumed when delta pruning quiescence captures
+_DELTA_MARGIN: int = 200
+
+# How often (in nodes) the clock and node budget are checked
+_CHECK_INTERVAL: int = 1024
+
+
+@dataclass
+class SearchLimits:
+    """Budgets for one search; the search stops at the first one reached."""
+
+    depth: int | None = None
+    movetime: float | None = None  # Seconds
+    nodes: int | None = None
+
+
+@dataclass
+class SearchResult:
+    """
+    Outcome of the deepest completed iteration, or of the moves finished in
+    an iteration the budget cut short.
+    """
+
+    best_move: Move | None
+    score: int  # Centipawns for the side to move
+    depth: int
+    nodes: int
+    seconds: float
+    pv: list[Move] = field(default_factory=list)
+
+    @property
+    def mate_in(self) -> int | None:
+        """Moves to mate (negative if being mated), None if no mate found."""
+        if abs(self.score) < MATE_THRESHOLD:
+            return None
+        plies: int = MATE_SCORE - abs(self.score)
+        moves: int = (plies + 1) // 2
+        return moves if self.score > 0 else -moves
+
+
+class StopSignal(Protocol):
+    """Anything a search can poll to learn it should stop."""
+
+    def is_set(self) -> bool: ...
+
+
+class SearchAborted(Exception):
+    """Raised inside the tree when a budget runs out or stop() is called."""
+
+
+def _score_to_table(score: int, ply: int) -> int:
+    """Store mate scores relative to the node, not the root."""
+    if score >= MATE_THRESHOLD:
+        return score + ply
+    if score <= -MATE_THRESHOLD:
+        return score - ply
+    return score
+
+
+def _score_from_table(score: int, ply: int) -> int:
+    if score >= MATE_THRESHOLD:
+        return score - ply
+    if score <= -MATE_THRESHOLD:
+        return score + ply
+    return score
+
+
+def _score_from_tablebase(result: TablebaseResult, ply: int) -> int:
+    """Exact tablebase result as a search score, mates counted from the root."""
+    if result.wdl > 0:
+        return MATE_SCORE - ply - result.dtm
+    if result.wdl < 0:
+        return -MATE_SCORE + ply + result.dtm
+    return 0
+
+
+class Searcher:
+    """Searches positions; keeps its table and ordering data between searches."""
+
+    def __init__(
+        self,
+        table: TranspositionTable | None = None,
+        stop_signal: StopSignal | None = None,
+        tablebase: Tablebase | None = None,
+    ) -> None:
+        """
+        table may be shared with other searchers. stop_signal, e.g. a
+        multiprocessing.Event, aborts the search once it is set. Positions
+        the tablebase covers are scored exactly instead of searched.
+        """
+        self.table: TranspositionTable = table or TranspositionTable()
+        self.stop_signal: StopSignal | None = stop_signal
+        self.tablebase: Tablebase | None = tablebase
+        self.killers: list[list[Move | None]] = [[None, None] for _ in range(MAX_PLY)]
+        # history[color][from * 64 + to]: how often a quiet move caused a cutoff
+        self.history: list[list[int]] = [[0] * 4096, [0] * 4096]
+        self.nodes: int = 0
+        self._stopped: bool = False
+        self._deadline: float | None = None
+        self._node_limit: int | None = None
+        self._executer: MoveExecuter = MoveExecuter(GameState.initial())
+        self._keys: list[int] = []
+        self._root_best: tuple[int, Move] | None = None
+
+    def stop(self) -> None:
+        """
+        Ask the running search, or the next one if none has started yet, to
+        return as soon as possible.
+        """
+        self._stopped = True
+
+    def set_deadline(self, seconds: float | None) -> None:
+        """
+        Give the running search, or the next one if none has started yet, a
+        time limit counted from now; None removes it.
+        """
+        self._deadline = None if seconds is None else time.perf_counter() + seconds
+
+    def search(
+        self,
+        state: GameState,
+        limits: SearchLimits,
+        previous_keys: Iterable[int] = (),
+        on_iteration: Callable[[SearchResult], None] | None = None,
+        start_depth: int = 1,
+    ) -> SearchResult:
+        """
+        Search a position (the state itself is not modified).
+        previous_keys are Zobrist keys of earlier game positions, oldest first,
+        used to score repetitions as draws. Iterative deepening begins at
+        start_depth. Depth 0 scores the position by quiescence search alone;
+        with no limits at all the search stops at DEFAULT_DEPTH.
+        """
+        try:
+            return self._search(state, limits, previous_keys, on_iteration, start_depth)
+        finally:
+            # A stop request or deadline covers one search
+            self._stopped = False
+            self._deadline = None
+
+    def _search(
+        self,
+        state: GameState,
+        limits: SearchLimits,
+        previous_keys: Iterable[int],
+        on_iteration: Callable[[SearchResult], None] | None,
+        start_depth: int,
+    ) -> SearchResult:
+        start: float = time.perf_counter()
+        self.nodes = 0
+        deadline: float | None = start + limits.movetime if limits.movetime else None
+        if self._deadline is not None:  # Set before the search began
+            deadline = (
+                self._deadline if deadline is None else min(deadline, self._deadline)
+            )
+        self._deadline = deadline
+        self._node_limit = limits.nodes
+        self._executer = MoveExecuter(state.copy())
+        self._keys = list(previous_keys)
+        if not self._keys or self._keys[-1] != state.zobrist_key:
+            self._keys.append(state.zobrist_key)
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        self.table.new_search()
+
+        legal: list[Move] = generate_legal_moves(state)
+        if not legal:
+            score: int = -MATE_SCORE if in_check(state) else 0
+            return SearchResult(None, score, 0, 0, time.perf_counter() - start)
+        entry = self.table.probe(state.zobrist_key)
+        root_moves: list[Move] = [
+            move
+            for move, _ in self._ordered(
+                state, legal, entry.move if entry is not None else None, 0
+            )
+        ]
+
+        # Exact score if the tablebase covers the root; one iteration that
+        # reaches it means every root move was scored from the tables
+        solved: int | None = None
+        if self.tablebase is not None:
+            probed: TablebaseResult | None = self.tablebase.probe(state)
+            if probed is not None:
+                solved = _score_from_tablebase(probed, 0)
+
+        # Fallback if not even depth 1 completes in time
+        result = SearchResult(root_moves[0], 0, 0, 0, 0.0, [root_moves[0]])
+        if limits.depth is not None:
+            max_depth: int = min(limits.depth, MAX_PLY - 1)
+        elif limits.movetime is None and limits.nodes is None:
+            max_depth = DEFAULT_DEPTH
+        else:
+            max_depth = MAX_PLY - 1
+
+        if max_depth <= 0:
+            try:
+                result.score = self._quiescence(-INFINITY, INFINITY, 0)
+            except SearchAborted:
+                result.score = evaluate(self._executer.state)
+            result.nodes = self.nodes
+            result.seconds = time.perf_counter() - start
+            return result
+
+        for depth in range(min(start_depth, max_depth), max_depth + 1):
+            self._root_best = None
+            try:
+                self._check_limits()  # A stop that came before the search began
+                score, best_move = self._search_root(root_moves, depth)
+            except SearchAborted:
+                # Moves finished in the cut-short iteration are still usable;
+                # the first one searched was the previous best move
+                if self._root_best is not None:
+                    result.score, result.best_move = self._root_best
+                    if result.pv[:1] != [result.best_move]:
+                        result.pv = [result.best_move]
+                break
+
+            elapsed: float = time.perf_counter() - start
+            result = SearchResult(
+                best_move,
+                score,
+                depth,
+                self.nodes,
+                elapsed,
+                self._principal_variation(state, depth),
+            )
+            if on_iteration is not None:
+                on_iteration(result)
+
+            # Searching the root best move first next iteration
+            root_moves.remove(best_move)
+            root_moves.insert(0, best_move)
+
+            if abs(score) >= MATE_THRESHOLD and MATE_SCORE - abs(score) <= depth:
+                break  # Forced mate found within the full-width horizon
+            if score == solved:
+                break
+            if limits.movetime is not None and elapsed >= limits.movetime / 2:
+                break  # The next iteration would not finish in time
+
+        result.nodes = self.nodes
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def _check_limits(self) -> None:
+        if self._stopped:
+            raise SearchAborted
+        if self.stop_signal is not None and self.stop_signal.is_set():
+            raise SearchAborted
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            raise SearchAborted
+        if self._node_limit is not None and self.nodes >= self._node_limit:
+            raise SearchAborted
+
+    def _search_root(self, root_moves: list[Move], depth: int) -> tuple[int, Move]:
+        """Full-window search of the root moves in their given order."""
+        executer: MoveExecuter = self._executer
+        alpha: int = -INFINITY
+        best_move: Move = root_moves[0]
+
+        for move in root_moves:
+            executer.make(move)
+            self._keys.append(executer.state.zobrist_key)
+            try:
+                score: int = -self._alpha_beta(depth - 1, -INFINITY, -alpha, 1)
+            finally:
+                self._keys.pop()
+                executer.unmake()
+            if score > alpha:
+                alpha = score
+                best_move = move
+                self._root_best = (score, move)
+
+        self.table.store(
+            executer.state.zobrist_key, depth, alpha, Bound.EXACT, best_move
+        )
+        return alpha, best_move
+
+    def _alpha_beta(self, depth: int, alpha: int, beta: int, ply: int) -> int:
+        self.nodes += 1
+        if self.nodes % _CHECK_INTERVAL == 0:
+            self._check_limits()
+
+        state: GameState = self._executer.state
+        if state.halfmove_clock >= 100 or self._is_repetition():
+            return 0
+        if (
+            self.tablebase is not None
+            and state.board.occupied.bit_count() <= MAX_PIECES
+        ):
+            probed: TablebaseResult | None = self.tablebase.probe(state)
+            if probed is not None:
+                return _score_from_tablebase(probed, ply)
+        if depth <= 0 or ply >= MAX_PLY - 1:
+            return self._quiescence(alpha, beta, ply)
+
+        key: int = state.zobrist_key
+        hash_move: Move | None = None
+        entry = self.table.probe(key)
+        if entry is not None:
+            hash_move = entry.move
+            if entry.depth >= depth:
+                score: int = _score_from_table(entry.score, ply)
+                if entry.bound == Bound.EXACT:
+                    return score
+                if entry.bound == Bound.LOWER and score >= beta:
+                    return score
+                if entry.bound == Bound.UPPER and score <= alpha:
+                    return score
+
+        moves: list[Move] = generate_legal_moves(state)
+        if not moves:
+            return -MATE_SCORE + ply if in_check(state) else 0
+
+        executer: MoveExecuter = self._executer
+        original_alpha: int = alpha
+        best_score: int = -INFINITY
+        best_move: Move | None = None
+        us: int = state.side_to_move
+
+        for move, is_quiet in self._ordered(state, moves, hash_move, ply):
+            executer.make(move)
+            self._keys.append(state.zobrist_key)
+            try:
+                score = -self._alpha_beta(depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                self._keys.pop()
+                executer.unmake()
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        if is_quiet:
+                            self._record_cutoff(move, us, depth, ply)
+                        break
+
+        if best_score >= beta:
+            bound: int = Bound.LOWER
+        elif best_score > original_alpha:
+            bound = Bound.EXACT
+        else:
+            bound = Bound.UPPER
+        self.table.store(key, depth, _score_to_table(best_score, ply), bound, best_move)
+        return best_score
+
+    def _quiescence(self, alpha: int, beta: int, ply: int) -> int:
+        """Resolve captures (and check evasions) before trusting the eval."""
+        self.nodes += 1
+        if self.nodes % _CHECK_INTERVAL == 0:
+            self._check_limits()
+
+        state: GameState = self._executer.state
+        if ply >= MAX_PLY - 1:
+            return evaluate(state)
+
+        checked: bool = in_check(state)
+        moves: list[Move] = generate_legal_moves(state)
+        if checked:
+            if not moves:
+                return -MATE_SCORE + ply
+            best_score: int = -INFINITY
+            candidates = [move for move, _ in self._ordered(state, moves, None, ply)]
+        else:
+            best_score = evaluate(state)  # Stand pat
+            if best_score >= beta:
+                return best_score
+            alpha = max(alpha, best_score)
+            candidates = [
+                move
+                for move, is_quiet in self._ordered(state, moves, None, ply)
+                if not is_quiet and self._worth_trying(state, move, best_score, alpha)
+            ]
+
+        executer: MoveExecuter = self._executer
+        for move in candidates:
+            executer.make(move)
+            try:
+                score: int = -self._quiescence(-beta, -alpha, ply + 1)
+            finally:
+                executer.unmake()
+            if score > best_score:
+                best_score = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        return best_score
+
+    @staticmethod
+    def _worth_trying(state: GameState, move: Move, stand_pat: int, alpha: int) -> bool:
+        """
+        Prune quiescence captures that can't raise alpha even if they win
+        the piece outright (delta pruning), and those that give up a more
+        valuable piece to a defended square.
+        """
+        board = state.board
+        if move.flag == MoveFlag.EN_PASSANT:
+            return stand_pat + PIECE_VALUES[PAWN] + _DELTA_MARGIN > alpha
+        target = board.piece_at(move.to_square)
+        gain: int = PIECE_VALUES[target[1]] if target is not None else 0
+        if move.promotion is not None:
+            gain += PIECE_VALUES[move.promotion] - PIECE_VALUES[PAWN]
+        if stand_pat + gain + _DELTA_MARGIN <= alpha:
+            return False
+
+        attacker = board.piece_at(move.from_square)
+        risked: int = PIECE_VALUES[attacker[1]] if attacker is not None else 0
+        if move.promotion is None and risked > gain:
+            us: int = state.side_to_move
+            occupied: int = board.occupied & ~SQUARE_BITS[move.from_square]
+            return not is_square_attacked(board, move.to_square, us ^ 1, occupied)
+        return True
+
+    def _ordered(
+        self, state: GameState, moves: list[Move], hash_move: Move | None, ply: int
+    ) -> list[tuple[Move, bool]]:
+        """
+        Sort moves best-first: hash move, captures by MVV-LVA, promotions,
+        killers, then quiet moves by history. Returns (move, is_quiet) pairs.
+        """
+        board = state.board
+        us: int = state.side_to_move
+        their_occupied: int = board.colors[us ^ 1]
+        killers: list[Move | None] = self.killers[ply]
+        history: list[int] = self.history[us]
+
+        scored: list[tuple[int, int, Move, bool]] = []
+        for index, move in enumerate(moves):
+            is_capture: bool = bool(their_occupied & SQUARE_BITS[move.to_square]) or (
+                move.flag == MoveFlag.EN_PASSANT
+            )
+            is_quiet: bool = not is_capture and move.promotion is None
+
+            if move == hash_move:
+                score: int = _HASH_MOVE_SCORE
+            elif is_capture:
+                found = board.piece_at(move.to_square)
+                victim: int = found[1] if found is not None else PAWN
+                attacker = board.piece_at(move.from_square)
+                score = (
+                    _CAPTURE_SCORE
+                    + PIECE_VALUES[victim] * 16
+                    - (attacker[1] if attacker is not None else 0)
+                )
+            elif move.promotion is not None:
+                score = _PROMOTION_SCORE + move.promotion
+            elif move == killers[0]:
+                score = _KILLER_SCORE + 1
+            elif move == killers[1]:
+                score = _KILLER_SCORE
+            else:
+                score = min(
+                    history[move.from_square * 64 + move.to_square], _HISTORY_LIMIT
+                )
+            # The index keeps the sort stable and avoids comparing moves
+            scored.append((-score, index, move, is_quiet))
+
+        scored.sort()
+        return [(move, is_quiet) for _, _, move, is_quiet in scored]
+
+    def _record_cutoff(self, move: Move, color: int, depth: int, ply: int) -> None:
+        """Remember a quiet move that refuted the previous move."""
+        killers: list[Move | None] = self.killers[ply]
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+        history: list[int] = self.history[color]
+        index: int = move.from_square * 64 + move.to_square
+        history[index] += depth * depth
+        if history[index] > _HISTORY_LIMIT:
+            # Age all entries so the table keeps distinguishing moves
+            self.history[color] = [value // 2 for value in history]
+
+    def _is_repetition(self) -> bool:
+        """Has the current position occurred since the last irreversible move?"""
+        keys: list[int] = self._keys
+        key: int = keys[-1]
+        oldest: int = max(len(keys) - 1 - self._executer.state.halfmove_clock, 0)
+        for index in range(len(keys) - 3, oldest - 1, -2):
+            if keys[index] == key:
+                return True
+        return False
+
+    def _principal_variation(self, state: GameState, depth: int) -> list[Move]:
+        """Follow hash moves from the root, checking each is legal."""
+        executer = MoveExecuter(state.copy())
+        pv: list[Move] = []
+        seen: set[int] = set()
+        while len(pv) < depth:
+            key: int = executer.state.zobrist_key
+            entry = self.table.probe(key)
+            if entry is None or entry.move is None or key in seen:
+                break
+            if entry.move not in generate_legal_moves(executer.state):
+                break
+            seen.add(key)
+            pv.append(entry.move)
+            executer.make(entry.move)
+        return pv
+
+
+def search(
+    state: GameState,
+    limits: SearchLimits,
+    previous_keys: Iterable[int] = (),
+) -> SearchResult:
+    """Search a position with a fresh searcher."""
+    return Searcher().search(state, limits, previous_keys)
@@ -0,0 +1,240 @@
+"""
+Endgame tablebases.
+Exact win/draw/loss and distance-to-mate for three-piece endings, read
+from local table files through a memory map with an LRU cache of
+decompressed blocks.
+"""
+
+from __future__ import annotations
+import mmap
+import struct
+import zlib
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple
+from engine.board import BISHOP, BLACK, KING, KNIGHT, PAWN, QUEEN, ROOK, WHITE
+from engine.game_state import GameState
+
+# Largest number of pieces (kings included) any table covers
+MAX_PIECES: int = 3
+
+# Table name -> the strong side's extra piece; the weak side has a bare king
+TABLES: dict[str, int] = {"KQvK": QUEEN, "KRvK": ROOK, "KPvK": PAWN}
+
+# One entry per (side to move, white king on files a-d, black king, piece)
+ENTRY_COUNT: int = 2 * 32 * 64 * 64
+BLOCK_SIZE: int = 4096
+DEFAULT_CACHE_BLOCKS: int = 256
+
+_MAGIC: bytes = b"C2TB"
+_VERSION: int = 1
+# Magic, version, block size, entry count, block count
+_HEADER = struct.Struct("<4sHIII")
+
+
+class TablebaseResult(NamedTuple):
+    """A probed position, from the side to move's point of view."""
+
+    wdl: int  # 1 win, 0 draw, -1 loss
+    dtm: int  # Plies until mate with best play, 0 for draws
+
+
+def table_index(side: int, white_king: int, black_king: int, piece: int) -> int:
+    """
+    Entry of a position with the strong side as white. Boards are mirrored
+    left to right so the white king is always on files a-d.
+    """
+    if white_king & 7 > 3:
+        white_king ^= 7
+        black_king ^= 7
+        piece ^= 7
+    king: int = (white_king >> 3) * 4 + (white_king & 7)
+    return ((side * 32 + king) * 64 + black_king) * 64 + piece
+
+
+def split_index(index: int) -> tuple[int, int, int, int]:
+    """(side, white king, black king, piece square) of an entry."""
+    piece: int = index & 63
+    black_king: int = index >> 6 & 63
+    king: int = index >> 12 & 31
+    return index >> 17, (king >> 2) * 8 + (king & 3), black_king, piece
+
+
+def encode_value(result: TablebaseResult) -> int:
+    """
+    Signed byte stored per entry: 0 draw, n > 0 mate in n plies, and
+    -(n + 1) for being mated in n plies (so mated now is -1).
+    """
+    if result.wdl > 0:
+        return result.dtm
+    if result.wdl < 0:
+        return -result.dtm - 1
+    return 0
+
+
+def decode_value(value: int) -> TablebaseResult:
+    if value > 0:
+        return TablebaseResult(1, value)
+    if value < 0:
+        return TablebaseResult(-1, -value - 1)
+    return TablebaseResult(0, 0)
+
+
+def table_path(directory: str | Path, name: str) -> Path:
+    return Path(directory) / f"{name}.c2tb"
+
+
+def write_table(path: str | Path, values: array) -> None:
+    """Write ENTRY_COUNT signed byte values as zlib-compressed blocks."""
+    if len(values) != ENTRY_COUNT:
+        raise ValueError(f"Expected {ENTRY_COUNT} values, got {len(values)}")
+    raw: bytes = values.tobytes()
+    blocks: list[bytes] = [
+        zlib.compress(raw[start : start + BLOCK_SIZE], 9)
+        for start in range(0, len(raw), BLOCK_SIZE)
+    ]
+    offsets: list[int] = []
+    offset: int = _HEADER.size + 8 * (len(blocks) + 1)
+    for block in blocks:
+        offsets.append(offset)
+        offset += len(block)
+    offsets.append(offset)
+
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(_MAGIC, _VERSION, BLOCK_SIZE, ENTRY_COUNT, len(blocks)))
+        file.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        for block in blocks:
+            file.write(block)
+
+
+class _TableFile:
+    """One table's memory map and block offsets."""
+
+    __slots__ = ("map", "offsets")
+
+    def __init__(self, path: Path) -> None:
+        with open(path, "rb") as file:
+            self.map: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, block_size, entries, blocks = _HEADER.unpack_from(self.map, 0)
+        if (magic, version, block_size, entries) != (
+            _MAGIC,
+            _VERSION,
+            BLOCK_SIZE,
+            ENTRY_COUNT,
+        ):
+            self.map.close()
+            raise ValueError(f"Not a version {_VERSION} tablebase file: {path}")
+        self.offsets: tuple[int, ...] = struct.unpack_from(
+            f"<{blocks + 1}Q", self.map, _HEADER.size
+        )
+
+    def block(self, number: int) -> bytes:
+        start, end = self.offsets[number], self.offsets[number + 1]
+        return zlib.decompress(self.map[start:end])
+
+
+def _material(state: GameState) -> tuple[str, int] | None:
+    """
+    (table name, strong side) of a position, "KvK" for drawn material, or
+    None if no table covers it.
+    """
+    pieces: list[list[int]] = state.board.pieces
+    counts: list[tuple[int, int]] = [
+        (color, piece)
+        for color in (WHITE, BLACK)
+        for piece in range(KING)
+        if pieces[color][piece]
+    ]
+    if not counts:
+        return "KvK", WHITE
+    if len(counts) > 1:
+        return None
+    color, piece = counts[0]
+    if pieces[color][piece] & (pieces[color][piece] - 1):
+        return None  # Two of the same piece
+    if piece in (KNIGHT, BISHOP):
+        return "KvK", color  # A lone minor piece can't mate
+    for name, table_piece in TABLES.items():
+        if table_piece == piece:
+            return name, color
+    return None
+
+
+class Tablebase:
+    """
+    Tables in a directory, opened on first use. Decompressed blocks are
+    kept in an LRU cache shared by all tables.
+    """
+
+    def __init__(
+        self, directory: str | Path, cache_blocks: int = DEFAULT_CACHE_BLOCKS
+    ) -> None:
+        self.directory: Path = Path(directory)
+        self.cache_blocks: int = cache_blocks
+        self._files: dict[str, _TableFile | None] = {}
+        self._cache: OrderedDict[tuple[str, int], bytes] = OrderedDict()
+
+    def _file(self, name: str) -> _TableFile | None:
+        if name not in self._files:
+            path: Path = table_path(self.directory, name)
+            self._files[name] = _TableFile(path) if path.exists() else None
+        return self._files[name]
+
+    def _value(self, name: str, index: int) -> int | None:
+        number, offset = divmod(index, BLOCK_SIZE)
+        block: bytes | None = self._cache.get((name, number))
+        if block is None:
+            file: _TableFile | None = self._file(name)
+            if file is None:
+                return None
+            block = file.block(number)
+            self._cache[name, number] = block
+            if len(self._cache) > self.cache_blocks:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end((name, number))
+        value: int = block[offset]
+        return value - 256 if value > 127 else value
+
+    def probe(self, state: GameState) -> TablebaseResult | None:
+        """Exact result of a position, or None if no table covers it."""
+        if state.board.occupied.bit_count() > MAX_PIECES or state.castling:
+            return None
+        material: tuple[str, int] | None = _material(state)
+        if material is None:
+            return None
+        name, strong = material
+        if name == "KvK":
+            return TablebaseResult(0, 0)
+
+        pieces: list[list[int]] = state.board.pieces
+        white_king: int = pieces[strong][KING].bit_length() - 1
+        black_king: int = pieces[strong ^ 1][KING].bit_length() - 1
+        piece: int = pieces[strong][TABLES[name]].bit_length() - 1
+        side: int = state.side_to_move
+        if strong == BLACK:
+            # Flip the board so the strong side plays white
+            white_king, black_king, piece = white_king ^ 56, black_king ^ 56, piece ^ 56
+            side ^= 1
+        value: int | None = self._value(
+            name, table_index(side, white_king, black_king, piece)
+        )
+        return None if value is None else decode_value(value)
+
+    def probe_wdl(self, state: GameState) -> int | None:
+        result: TablebaseResult | None = self.probe(state)
+        return None if result is None else result.wdl
+
+    def close(self) -> None:
+        for file in self._files.values():
+            if file is not None:
+                file.map.close()
+        self._files.clear()
+        self._cache.clear()
+
+    def __enter__(self) -> Tablebase:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,176 @@
+"""
+Transposition table.
+Fixed-size, preallocated hash table of search results keyed by Zobrist key.
+"""
+
+from __future__ import annotations
+from typing import NamedTuple
+from commands.move import Move
+
+
+class Bound:
+    """How a stored score relates to the true score."""
+
+    NONE = 0  # Empty slot
+    EXACT = 1
+    LOWER = 2  # Fail high: true score >= stored score
+    UPPER = 3  # Fail low: true score <= stored score
+
+
+class TTEntry(NamedTuple):
+    """A probed search result."""
+
+    depth: int
+    score: int
+    bound: int
+    move: Move | None
+
+
+# Packed data word layout (low to high bits)
+_MOVE_BITS = 17
+_SCORE_BITS = 20
+_SCORE_SHIFT = _MOVE_BITS
+_SCORE_OFFSET = 1 << (_SCORE_BITS - 1)
+_DEPTH_SHIFT = _SCORE_SHIFT + _SCORE_BITS
+_BOUND_SHIFT = _DEPTH_SHIFT + 8
+_AGE_SHIFT = _BOUND_SHIFT + 2
+
+_MOVE_MASK = (1 << _MOVE_BITS) - 1
+_SCORE_MASK = (1 << _SCORE_BITS) - 1
+
+# Depth an entry is worth less for each search it is out of date
+_AGE_PENALTY = 8
+
+
+class TranspositionTable:
+    """
+    Buckets of two entries: a depth-preferred slot and an always-replace slot.
+    Each entry is two 64-bit words (key ^ data, data), so the memory used is
+    fixed when the table is created and never grows during a search.
+    The XOR lets concurrent readers reject entries torn by another writer.
+    """
+
+    ENTRY_BYTES: int = 16
+    BUCKET_ENTRIES: int = 2
+    BUCKET_WORDS: int = 4
+
+    def __init__(self, size_mb: float = 16, buffer: memoryview | None = None) -> None:
+        """
+        Allocate roughly size_mb megabytes (rounded down to a power of two
+        buckets). Pass buffer to use existing memory, e.g. shared memory.
+        """
+        table_bytes: int = self.size_in_bytes(size_mb)
+        if buffer is None:
+            buffer = memoryview(bytearray(table_bytes))
+        elif len(buffer) < table_bytes:
+            raise ValueError(
+                f"Buffer of {len(buffer)} bytes is too small for {size_mb} MB"
+            )
+
+        self.bucket_count: int = table_bytes // (self.ENTRY_BYTES * self.BUCKET_ENTRIES)
+        self._mask: int = self.bucket_count - 1
+        self._bytes: memoryview = memoryview(buffer).cast("B")[:table_bytes]
+        self._words: memoryview = self._bytes.cast("Q")
+        self.age: int = 0
+
+    @staticmethod
+    def size_in_bytes(size_mb: float) -> int:
+        """Bytes a table of size_mb actually uses (for allocating a buffer)."""
+        bucket_bytes: int = (
+            TranspositionTable.ENTRY_BYTES * TranspositionTable.BUCKET_ENTRIES
+        )
+        wanted: int = max(1, int(size_mb * 1024 * 1024) // bucket_bytes)
+        return (1 << (wanted.bit_length() - 1)) * bucket_bytes
+
+    @property
+    def capacity(self) -> int:
+        """Number of entries the table can hold."""
+        return self.bucket_count * self.BUCKET_ENTRIES
+
+    def new_search(self) -> None:
+        """Age existing entries so fresh results replace them first."""
+        self.age = (self.age + 1) & 0xFF
+
+    def clear(self) -> None:
+        """Empty the table."""
+        self._bytes[:] = bytes(len(self._bytes))
+        self.age = 0
+
+    def probe(self, key: int) -> TTEntry | None:
+        """Look up a position, None if it isn't stored."""
+        words: memoryview = self._words
+        base: int = (key & self._mask) * self.BUCKET_WORDS
+        for slot in (base, base + 2):
+            data: int = words[slot + 1]
+            if data and words[slot] ^ data == key:
+                packed_move: int = data & _MOVE_MASK
+                return TTEntry(
+                    (data >> _DEPTH_SHIFT) & 0xFF,
+                    ((data >> _SCORE_SHIFT) & _SCORE_MASK) - _SCORE_OFFSET,
+                    (data >> _BOUND_SHIFT) & 3,
+                    Move.unpack(packed_move) if packed_move else None,
+                )
+        return None
+
+    def store(
+        self, key: int, depth: int, score: int, bound: int, move: Move | None
+    ) -> None:
+        """Save a search result, replacing by depth and age."""
+        words: memoryview = self._words
+        base: int = (key & self._mask) * self.BUCKET_WORDS
+        depth = min(max(depth, 0), 0xFF)
+
+        # Keep an existing best move when re-storing without one
+        packed_move: int = move.packed if move is not None else 0
+        for slot in (base, base + 2):
+            old: int = words[slot + 1]
+            if old and words[slot] ^ old == key:
+                if not packed_move:
+                    packed_move = old & _MOVE_MASK
+                break
+
+        data: int = (
+            packed_move
+            | (score + _SCORE_OFFSET) << _SCORE_SHIFT
+            | depth << _DEPTH_SHIFT
+            | bound << _BOUND_SHIFT
+            | self.age << _AGE_SHIFT
+        )
+
+        # Depth-preferred slot: take it if it's empty, the same position, or
+        # not searched deeper than this result once its age is counted
+        old_data: int = words[base + 1]
+        searches_old: int = (self.age - (old_data >> _AGE_SHIFT)) & 0xFF
+        old_depth: int = (old_data >> _DEPTH_SHIFT) & 0xFF
+        if (
+            not old_data
+            or words[base] ^ old_data == key
+            or old_depth - _AGE_PENALTY * searches_old <= depth
+        ):
+            slot = base
+        else:
+            slot = base + 2  # Always-replace slot
+
+        words[slot] = key ^ data
+        words[slot + 1] = data
+
+    def hashfull(self) -> int:
+        """Permille of sampled entries used by the current search (UCI style)."""
+        words: memoryview = self._words
+        sample: int = min(self.bucket_count, 500)
+        used: int = 0
+        for bucket in range(sample):
+            for slot in (bucket * 4, bucket * 4 + 2):
+                data: int = words[slot + 1]
+                if data and (data >> _AGE_SHIFT) & 0xFF == self.age:
+                    used += 1
+        return used * 1000 // (sample * self.BUCKET_ENTRIES)
+
+    def release(self) -> None:
+        """
+        Drop the views of the buffer, so shared memory under the table can be
+        closed even while something still refers to the table. The table
+        can't be used afterwards.
+        """
+        self._words.release()
+        self._bytes.release()
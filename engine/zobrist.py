@@ -0,0 +1,58 @@
+"""
+Zobrist hashing.
+Random 64-bit keys per (color, piece, square), side, castling and en passant.
+"""
+
+from __future__ import annotations
+import random
+from core.bitboard import PAWN_ATTACKS, iter_squares
+from core.color import Color
+from engine.board import BLACK, PAWN, Board
+
+_rng = random.Random(0x5EED_C4E55)
+
+# PIECE_KEYS[color][piece][square]
+PIECE_KEYS: tuple[tuple[tuple[int, ...], ...], ...] = tuple(
+    tuple(tuple(_rng.getrandbits(64) for _ in range(64)) for _ in range(6))
+    for _ in range(2)
+)
+BLACK_TO_MOVE_KEY: int = _rng.getrandbits(64)
+CASTLING_KEYS: tuple[int, ...] = tuple(_rng.getrandbits(64) for _ in range(16))
+EN_PASSANT_FILE_KEYS: tuple[int, ...] = tuple(_rng.getrandbits(64) for _ in range(8))
+
+# Pawn attack bitboards indexed by engine color
+_PAWN_ATTACKS: tuple[tuple[int, ...], tuple[int, ...]] = (
+    PAWN_ATTACKS[Color.WHITE],
+    PAWN_ATTACKS[Color.BLACK],
+)
+
+
+def en_passant_key(board: Board, en_passant: int | None, side_to_move: int) -> int:
+    """
+    Key for the en passant file, or 0.
+    Only hashed when a pawn could actually capture, so positions that differ
+    only by a useless en passant square share a key (repetition rules).
+    """
+    if en_passant is None:
+        return 0
+    capturers: int = (
+        _PAWN_ATTACKS[side_to_move ^ 1][en_passant] & board.pieces[side_to_move][PAWN]
+    )
+    return EN_PASSANT_FILE_KEYS[en_passant & 7] if capturers else 0
+
+
+def compute_key(
+    board: Board, side_to_move: int, castling: int, en_passant: int | None
+) -> int:
+    """Hash a position from scratch (make/unmake update it incrementally)."""
+    key: int = 0
+    for color in range(2):
+        for piece in range(6):
+            piece_keys: tuple[int, ...] = PIECE_KEYS[color][piece]
+            for square in iter_squares(board.pieces[color][piece]):
+                key ^= piece_keys[square]
+    if side_to_move == BLACK:
+        key ^= BLACK_TO_MOVE_KEY
+    key ^= CASTLING_KEYS[castling]
+    key ^= en_passant_key(board, en_passant, side_to_move)
+    return key
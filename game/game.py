@@ -0,0 +1,156 @@
+"""
+A game in progress.
+Tracks the position and move history, applies the draw rules, and can ask
+the engine for a move.
+"""
+
+from __future__ import annotations
+from enum import Enum
+from commands.history import History
+from commands.move import Move
+from commands.move_executer import MoveExecuter
+from commands.pgn import game_to_pgn
+from core.color import Color
+from core.coordinate import Coordinate
+from engine.book import OpeningBook
+from engine.game_state import GameState
+from engine.move_generator import generate_legal_moves, in_check, legal_moves_from
+from engine.search import Searcher, SearchLimits, SearchResult
+from engine.tablebase import Tablebase
+from game.game_rules import RepetitionTracker, is_fifty_move_draw
+
+
+class GameStatus(Enum):
+    """Whether the game is still going and how it ended."""
+
+    ONGOING = "ongoing"
+    CHECKMATE = "checkmate"
+    STALEMATE = "stalemate"
+    REPETITION = "threefold repetition"
+    FIFTY_MOVES = "fifty-move rule"
+
+    @property
+    def is_draw(self) -> bool:
+        return self not in (GameStatus.ONGOING, GameStatus.CHECKMATE)
+
+
+class Game:
+    """A game between two players, either of which may be the computer."""
+
+    # Default latency budget for computer moves
+    DEFAULT_MOVETIME: float = 1.0
+
+    def __init__(
+        self,
+        state: GameState | None = None,
+        engine_limits: SearchLimits | None = None,
+        book: OpeningBook | None = None,
+        tablebase: Tablebase | None = None,
+    ) -> None:
+        self.state: GameState = state or GameState.initial()
+        self.executer: MoveExecuter = MoveExecuter(self.state)
+        self.history: History = History(self.state)
+        self.engine_limits: SearchLimits = engine_limits or SearchLimits(
+            movetime=self.DEFAULT_MOVETIME
+        )
+        self.book: OpeningBook | None = book
+        self.tablebase: Tablebase | None = tablebase
+        self._searcher: Searcher | None = None
+        self.last_search: SearchResult | None = None
+        self.repetitions: RepetitionTracker = RepetitionTracker(self.state.zobrist_key)
+
+    @property
+    def turn(self) -> Color:
+        return self.state.turn
+
+    @property
+    def moves(self) -> list[Move]:
+        """Moves played so far."""
+        return self.history.moves
+
+    @property
+    def searcher(self) -> Searcher:
+        """
+        The engine, created on first use: its transposition table is large,
+        and games that never ask for a computer move shouldn't pay for it.
+        """
+        if self._searcher is None:
+            self._searcher = Searcher(tablebase=self.tablebase)
+        return self._searcher
+
+    @property
+    def position_keys(self) -> list[int]:
+        """Zobrist keys of the positions since the last capture or pawn move."""
+        return self.repetitions.keys
+
+    def legal_moves(self) -> list[Move]:
+        return generate_legal_moves(self.state)
+
+    def legal_moves_from(self, coordinate: Coordinate) -> list[Move]:
+        return legal_moves_from(self.state, coordinate.index)
+
+    def play(self, move: Move) -> None:
+        """Play a move, raising ValueError if it isn't legal."""
+        if move not in self.legal_moves():
+            raise ValueError(f"Illegal move: {move.uci}")
+        self.executer.make(move)
+        self.history.append(move)
+        self.repetitions.push(self.state.zobrist_key, self.state.halfmove_clock == 0)
+
+    def play_uci(self, text: str) -> Move:
+        """Play a move given in UCI notation, e.g. 'e2e4' or 'e7e8q'."""
+        for move in self.legal_moves():
+            if move.uci == text:
+                self.play(move)
+                return move
+        raise ValueError(f"Illegal move: {text}")
+
+    def undo(self) -> Move:
+        """Take back the last move."""
+        move: Move = self.executer.unmake()
+        self.history.pop()
+        self.repetitions.pop()
+        return move
+
+    def computer_move(self) -> Move:
+        """
+        Play a book move if the opening book has one, otherwise search
+        within the engine limits and play the best move found.
+        """
+        if self.status != GameStatus.ONGOING:
+            raise ValueError(f"Game is over: {self.status.value}")
+        if self.book is not None:
+            book_move: Move | None = self.book.choose(self.state)
+            if book_move is not None:
+                self.last_search = None
+                self.play(book_move)
+                return book_move
+        self.last_search = self.searcher.search(
+            self.state, self.engine_limits, self.position_keys
+        )
+        move: Move | None = self.last_search.best_move
+        assert move is not None  # Ongoing games always have a legal move
+        self.play(move)
+        return move
+
+    def to_pgn(self, headers: dict[str, str] | None = None) -> str:
+        """Export the moves played so far as PGN."""
+        status: GameStatus = self.status
+        result: str = "*"
+        if status == GameStatus.CHECKMATE:
+            result = "0-1" if self.turn == Color.WHITE else "1-0"
+        elif status.is_draw:
+            result = "1/2-1/2"
+        return game_to_pgn(self.history, headers, result)
+
+    @property
+    def status(self) -> GameStatus:
+        if not self.legal_moves():
+            if in_check(self.state):
+                return GameStatus.CHECKMATE
+            return GameStatus.STALEMATE
+        if self.repetitions.is_threefold():
+            return GameStatus.REPETITION
+        if is_fifty_move_draw(self.state):
+            return GameStatus.FIFTY_MOVES
+        return GameStatus.ONGOING
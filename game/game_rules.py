@@ -0,0 +1,61 @@
+"""
+Draw rules.
+Threefold repetition and the fifty-move rule, tracked without rescanning
+the game's history.
+"""
+
+from __future__ import annotations
+from collections import Counter
+from engine.game_state import GameState
+
+# Plies without a capture or pawn move after which the game is drawn
+FIFTY_MOVE_PLIES: int = 100
+# Occurrences of one position that draw the game
+REPETITION_LIMIT: int = 3
+
+
+class RepetitionTracker:
+    """
+    Zobrist keys of the positions since the last irreversible move, plus a
+    count of each. Positions before a capture or pawn move can never occur
+    again, so an irreversible move starts a fresh segment; the old one is
+    set aside only so undo can bring it back.
+    """
+
+    __slots__ = ("keys", "counts", "_segments")
+
+    def __init__(self, key: int) -> None:
+        self.keys: list[int] = [key]
+        self.counts: Counter[int] = Counter(self.keys)
+        self._segments: list[tuple[list[int], Counter[int]]] = []
+
+    def push(self, key: int, irreversible: bool = False) -> None:
+        """Record the position reached by a move."""
+        if irreversible:
+            self._segments.append((self.keys, self.counts))
+            self.keys = []
+            self.counts = Counter()
+        self.keys.append(key)
+        self.counts[key] += 1
+
+    def pop(self) -> int:
+        """Forget the last position recorded, as when a move is taken back."""
+        if len(self.keys) == 1 and not self._segments:
+            raise IndexError("No position to pop")
+        key: int = self.keys.pop()
+        self.counts[key] -= 1
+        if not self.keys:
+            self.keys, self.counts = self._segments.pop()
+        return key
+
+    def count(self) -> int:
+        """How many times the current position has occurred."""
+        return self.counts[self.keys[-1]]
+
+    def is_threefold(self) -> bool:
+        return self.count() >= REPETITION_LIMIT
+
+
+def is_fifty_move_draw(state: GameState) -> bool:
+    """Whether fifty moves by each side passed without a capture or pawn move."""
+    return state.halfmove_clock >= FIFTY_MOVE_PLIES
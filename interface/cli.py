@@ -0,0 +1,306 @@
+"""
+UCI front end.
+Speaks the Universal Chess Interface on stdin/stdout so tournament managers
+and GUIs can run the engine. Searches run on a background thread, so
+'stop' and 'isready' are answered while the engine thinks.
+"""
+
+from __future__ import annotations
+import sys
+import threading
+from pathlib import Path
+from typing import TextIO
+from commands.move import Move
+from engine.board import WHITE
+from engine.book import OpeningBook
+from engine.game_state import STARTING_FEN, GameState
+from engine.search import Searcher, SearchLimits, SearchResult
+from engine.tablebase import Tablebase
+from engine.transposition import TranspositionTable
+from game.game import Game
+
+ENGINE_NAME: str = "Chess2"
+ENGINE_AUTHOR: str = "the Chess2 authors"
+DEFAULT_HASH_MB: int = 16
+MAX_HASH_MB: int = 4096
+
+# Moves assumed left when the GUI doesn't send movestogo
+DEFAULT_MOVES_TO_GO: int = 30
+# Milliseconds kept back per move for I/O and GUI lag
+MOVE_OVERHEAD_MS: int = 50
+
+_GO_NUMBERS: frozenset[str] = frozenset(
+    {"wtime", "btime", "winc", "binc", "movestogo", "depth", "nodes", "movetime"}
+)
+
+
+def time_budget(remaining_ms: int, increment_ms: int, moves_to_go: int | None) -> float:
+    """Seconds to spend on one move given the clock."""
+    share: float = remaining_ms / (moves_to_go or DEFAULT_MOVES_TO_GO)
+    budget_ms: float = share + 0.75 * increment_ms
+    budget_ms = min(budget_ms, remaining_ms / 2) - MOVE_OVERHEAD_MS
+    return max(budget_ms, 10) / 1000
+
+
+def parse_go(tokens: list[str]) -> tuple[dict[str, int], set[str]]:
+    """Split 'go' arguments into numeric parameters and flags."""
+    numbers: dict[str, int] = {}
+    flags: set[str] = set()
+    index: int = 0
+    while index < len(tokens):
+        token: str = tokens[index]
+        if token in _GO_NUMBERS and index + 1 < len(tokens):
+            numbers[token] = int(tokens[index + 1])
+            index += 2
+        else:
+            flags.add(token)  # infinite, ponder; searchmoves is not supported
+            index += 1
+    return numbers, flags
+
+
+class UciEngine:
+    """The engine's side of a UCI session; handle() takes one input line."""
+
+    def __init__(self, output: TextIO = sys.stdout) -> None:
+        self.output: TextIO = output
+        self.game: Game = Game()
+        self.book: OpeningBook | None = None
+        self.tablebase: Tablebase | None = None
+        self.hash_mb: int = DEFAULT_HASH_MB
+        self._stop_event = threading.Event()
+        self._searcher: Searcher | None = None
+        self._thread: threading.Thread | None = None
+        # Held back while pondering or in an infinite search: UCI only
+        # allows bestmove after 'stop' or 'ponderhit'
+        self._release = threading.Event()
+        self._ponder_time: float | None = None
+        self._write_lock = threading.Lock()
+        # The position command last applied, to play only new moves next time
+        self._base: str = STARTING_FEN
+        self._moves: list[str] = []
+
+    @property
+    def searcher(self) -> Searcher:
+        if self._searcher is None:
+            self._searcher = Searcher(
+                TranspositionTable(self.hash_mb), self._stop_event, self.tablebase
+            )
+        return self._searcher
+
+    def send(self, line: str) -> None:
+        with self._write_lock:
+            self.output.write(line + "\n")
+            self.output.flush()
+
+    def handle(self, line: str) -> bool:
+        """Process one command; returns False once the session should end."""
+        tokens: list[str] = line.split()
+        if not tokens:
+            return True
+        command, arguments = tokens[0], tokens[1:]
+        try:
+            if command == "uci":
+                self._uci()
+            elif command == "isready":
+                self.send("readyok")
+            elif command == "setoption":
+                self._set_option(arguments)
+            elif command == "ucinewgame":
+                self.halt()
+                self._searcher = None
+                self.set_position(STARTING_FEN, [])
+            elif command == "position":
+                self._position(arguments)
+            elif command == "go":
+                self._go(arguments)
+            elif command == "stop":
+                self._stop_event.set()
+                self._release.set()
+            elif command == "ponderhit":
+                self._ponderhit()
+            elif command == "quit":
+                self.halt()
+                return False
+            elif command != "debug":
+                self.send(f"info string Unknown command: {command}")
+        except (ValueError, OSError) as error:
+            self.send(f"info string Error: {error}")
+        return True
+
+    def wait(self) -> None:
+        """Let a running search finish; callers stop it first if needed."""
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def halt(self) -> None:
+        """
+        Stop a running search and wait for its bestmove. Waiting without
+        stopping would hang on an infinite or ponder search.
+        """
+        self._stop_event.set()
+        self._release.set()
+        self.wait()
+
+    def _uci(self) -> None:
+        self.send(f"id name {ENGINE_NAME}")
+        self.send(f"id author {ENGINE_AUTHOR}")
+        self.send(
+            f"option name Hash type spin default {DEFAULT_HASH_MB} "
+            f"min 1 max {MAX_HASH_MB}"
+        )
+        self.send("option name Ponder type check default false")
+        self.send("option name BookFile type string default <empty>")
+        self.send("option name TablebasePath type string default <empty>")
+        self.send("uciok")
+
+    def _set_option(self, arguments: list[str]) -> None:
+        text: str = " ".join(arguments)
+        name, _, value = text.removeprefix("name ").partition(" value ")
+        name = name.strip().lower()
+        value = value.strip()
+        self.halt()
+        if name == "hash":
+            self.hash_mb = max(1, min(int(value), MAX_HASH_MB))
+            self._searcher = None
+        elif name == "bookfile":
+            if self.book is not None:
+                self.book.close()
+            self.book = None
+            if value and value != "<empty>":
+                self.book = OpeningBook(Path(value))
+        elif name == "tablebasepath":
+            if self.tablebase is not None:
+                self.tablebase.close()
+            self.tablebase = None
+            if value and value != "<empty>":
+                self.tablebase = Tablebase(Path(value))
+            self._searcher = None
+        # Ponder needs no setup: 'go ponder' is honoured either way
+
+    def _position(self, arguments: list[str]) -> None:
+        if "moves" in arguments:
+            split: int = arguments.index("moves")
+            setup, moves = arguments[:split], arguments[split + 1 :]
+        else:
+            setup, moves = arguments, []
+        if setup[:1] == ["startpos"]:
+            fen: str = STARTING_FEN
+        elif setup[:1] == ["fen"]:
+            fen = " ".join(setup[1:])
+        else:
+            raise ValueError(f"Bad position command: {' '.join(arguments)}")
+        self.set_position(fen, moves)
+
+    def set_position(self, fen: str, moves: list[str]) -> None:
+        """
+        Set up a position. When it continues the previous one, only the
+        moves that differ are taken back or played.
+        """
+        self.halt()
+        common: int = 0
+        if fen == self._base:
+            limit: int = min(len(moves), len(self._moves))
+            while common < limit and moves[common] == self._moves[common]:
+                common += 1
+            for _ in range(len(self._moves) - common):
+                self.game.undo()
+        else:
+            self.game = Game(GameState.from_fen(fen))
+            self._base = fen
+        del self._moves[common:]
+        for text in moves[common:]:
+            self.game.play_uci(text)
+            self._moves.append(text)
+
+    def _go(self, arguments: list[str]) -> None:
+        self.halt()
+        numbers, flags = parse_go(arguments)
+        state: GameState = self.game.state
+        held: bool = "infinite" in flags or "ponder" in flags
+
+        movetime: float | None = None
+        if "movetime" in numbers:
+            movetime = numbers["movetime"] / 1000
+        elif "wtime" in numbers or "btime" in numbers:
+            us: str = "w" if state.side_to_move == WHITE else "b"
+            if f"{us}time" in numbers:
+                movetime = time_budget(
+                    numbers[f"{us}time"],
+                    numbers.get(f"{us}inc", 0),
+                    numbers.get("movestogo"),
+                )
+        # A ponder search runs untimed until ponderhit starts the clock
+        self._ponder_time = movetime if "ponder" in flags else None
+        if "ponder" in flags:
+            movetime = None
+        limits = SearchLimits(numbers.get("depth"), movetime, numbers.get("nodes"))
+
+        if self.book is not None and not held:
+            book_move: Move | None = self.book.choose(state)
+            if book_move is not None:
+                self.send(f"bestmove {book_move.uci}")
+                return
+
+        self._stop_event.clear()
+        if held:
+            self._release.clear()
+        else:
+            self._release.set()
+        self._thread = threading.Thread(
+            target=self._search, args=(limits,), name="uci-search", daemon=True
+        )
+        self._thread.start()
+
+    def _ponderhit(self) -> None:
+        if self._ponder_time is not None and self._thread is not None:
+            self.searcher.set_deadline(self._ponder_time)
+        self._ponder_time = None
+        self._release.set()
+
+    def _search(self, limits: SearchLimits) -> None:
+        """
+        Search thread: report each iteration, then the best move. A
+        bestmove is sent whatever happens, or the GUI would wait forever.
+        """
+        line: str = "bestmove 0000"
+        try:
+            result: SearchResult = self.searcher.search(
+                self.game.state,
+                limits,
+                list(self.game.position_keys),
+                on_iteration=self._info,
+            )
+            if result.best_move is not None:
+                line = f"bestmove {result.best_move.uci}"
+                if len(result.pv) > 1:
+                    line += f" ponder {result.pv[1].uci}"
+        except Exception as error:
+            self.send(f"info string Search failed: {error!r}")
+        finally:
+            self._release.wait()
+            # A ponderhit after the search ended mustn't time the next one
+            self.searcher.set_deadline(None)
+            self.send(line)
+
+    def _info(self, result: SearchResult) -> None:
+        mate: int | None = result.mate_in
+        score: str = f"mate {mate}" if mate is not None else f"cp {result.score}"
+        milliseconds: int = int(result.seconds * 1000)
+        nps: int = int(result.nodes / result.seconds) if result.seconds else 0
+        pv: str = " ".join(move.uci for move in result.pv)
+        self.send(
+            f"info depth {result.depth} score {score} nodes {result.nodes} "
+            f"time {milliseconds} nps {nps} pv {pv}"
+        )
+
+
+def run(input: TextIO = sys.stdin, output: TextIO = sys.stdout) -> int:
+    """Serve one UCI session until 'quit' or end of input."""
+    engine = UciEngine(output)
+    for line in input:
+        if not engine.handle(line):
+            break
+    else:
+        engine.handle("quit")
+    return 0
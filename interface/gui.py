@@ -0,0 +1,338 @@
+"""
+Pygame board.
+Play against the engine with the mouse. Square and piece images are drawn
+once and cached, only squares whose appearance changed are redrawn, and
+the engine thinks on a background thread so the window stays responsive.
+"""
+
+from __future__ import annotations
+import threading
+from typing import NamedTuple
+import pygame
+from commands.move import Move
+from engine.board import BLACK, QUEEN, WHITE
+from engine.game_state import GameState
+from engine.move_generator import in_check
+from engine.search import SearchResult
+from game.game import Game, GameStatus
+
+SQUARE_SIZE: int = 80
+BOARD_SIZE: int = 8 * SQUARE_SIZE
+# Frame cap: the loop sleeps between frames instead of spinning
+FPS: int = 30
+
+LIGHT: tuple[int, int, int] = (240, 217, 181)
+DARK: tuple[int, int, int] = (181, 136, 99)
+# Blended over the square colour
+LAST_MOVE_TINT: tuple[int, int, int, int] = (205, 210, 106, 130)
+SELECTED_TINT: tuple[int, int, int, int] = (130, 151, 105, 170)
+CHECK_TINT: tuple[int, int, int, int] = (220, 40, 40, 150)
+TARGET_COLOR: tuple[int, int, int, int] = (20, 85, 30, 110)
+
+# Highlight levels of a square, lowest first
+NO_HIGHLIGHT, LAST_MOVE, SELECTED, CHECK = range(4)
+_TINTS: dict[int, tuple[int, int, int, int]] = {
+    LAST_MOVE: LAST_MOVE_TINT,
+    SELECTED: SELECTED_TINT,
+    CHECK: CHECK_TINT,
+}
+
+# Solid chess glyphs, pawn to king; the outline glyphs are 6 code points lower
+_GLYPHS: str = "♟♞♝♜♛♚"
+_LETTERS: str = "PNBRQK"
+_SYMBOL_FONTS: str = "dejavusans,freeserif,segoeuisymbol,arialunicodems,symbola"
+
+
+class SquareLook(NamedTuple):
+    """Everything that decides how a square is drawn."""
+
+    highlight: int
+    piece: tuple[int, int] | None  # (color, piece)
+    target: bool  # A legal destination of the selected piece
+
+
+class SpriteCache:
+    """Square and piece surfaces, rendered once and blitted from then on."""
+
+    def __init__(self, size: int = SQUARE_SIZE) -> None:
+        self.size: int = size
+        self.squares: dict[tuple[bool, int], pygame.Surface] = {
+            (light, highlight): self._square(light, highlight)
+            for light in (True, False)
+            for highlight in (NO_HIGHLIGHT, LAST_MOVE, SELECTED, CHECK)
+        }
+        font: pygame.font.Font = pygame.font.SysFont(_SYMBOL_FONTS, size * 3 // 4)
+        self.pieces: dict[tuple[int, int], pygame.Surface] = {
+            (color, piece): self._piece(font, color, piece)
+            for color in (WHITE, BLACK)
+            for piece in range(6)
+        }
+        self.dot: pygame.Surface = self._target(capture=False)
+        self.ring: pygame.Surface = self._target(capture=True)
+
+    def _square(self, light: bool, highlight: int) -> pygame.Surface:
+        surface = pygame.Surface((self.size, self.size)).convert()
+        surface.fill(LIGHT if light else DARK)
+        if highlight != NO_HIGHLIGHT:
+            tint = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+            tint.fill(_TINTS[highlight])
+            surface.blit(tint, (0, 0))
+        return surface
+
+    def _piece(self, font: pygame.font.Font, color: int, piece: int) -> pygame.Surface:
+        surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+        fill: tuple[int, int, int] = (255, 255, 255) if color == WHITE else (0, 0, 0)
+        center: tuple[int, int] = (self.size // 2, self.size // 2)
+        solid: str = _GLYPHS[piece]
+        outline: str = chr(ord(solid) - 6)
+        if all(font.metrics(glyph)[0] is not None for glyph in (solid, outline)):
+            # The solid glyph in the piece colour, then a black outline on top
+            for glyph, glyph_color in ((solid, fill), (outline, (0, 0, 0))):
+                image: pygame.Surface = font.render(glyph, True, glyph_color)
+                surface.blit(image, image.get_rect(center=center))
+        else:
+            # No chess glyphs installed: a lettered disc
+            pygame.draw.circle(surface, fill, center, self.size * 3 // 8)
+            pygame.draw.circle(surface, (0, 0, 0), center, self.size * 3 // 8, 2)
+            letter_color = (0, 0, 0) if color == WHITE else (255, 255, 255)
+            letter_font = pygame.font.Font(None, self.size // 2)
+            image = letter_font.render(_LETTERS[piece], True, letter_color)
+            surface.blit(image, image.get_rect(center=center))
+        return surface.convert_alpha()
+
+    def _target(self, capture: bool) -> pygame.Surface:
+        surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+        center: tuple[int, int] = (self.size // 2, self.size // 2)
+        if capture:
+            pygame.draw.circle(
+                surface, TARGET_COLOR, center, self.size // 2, self.size // 12
+            )
+        else:
+            pygame.draw.circle(surface, TARGET_COLOR, center, self.size // 6)
+        return surface.convert_alpha()
+
+
+class ChessGui:
+    """A window showing one game, with the engine playing one side."""
+
+    def __init__(
+        self, screen: pygame.Surface, game: Game | None = None, human: int = WHITE
+    ) -> None:
+        self.screen: pygame.Surface = screen
+        self.game: Game = game or Game()
+        self.human: int = human
+        self.flipped: bool = human == BLACK
+        self.sprites: SpriteCache = SpriteCache()
+        self.selected: int | None = None
+        # Legal moves of the selected piece by destination, found once per click
+        self.targets: dict[int, list[Move]] = {}
+        # What each square currently shows, to redraw only the ones that change
+        self._shown: list[SquareLook | None] = [None] * 64
+        self._dirty: list[pygame.Rect] = []
+        # Set when something on the board may have changed; idle frames skip
+        # the comparison entirely
+        self._stale: bool = True
+        # Worked out once per move rather than every frame
+        self.status: GameStatus = self.game.status
+        self._checked_king: int | None = self._find_checked_king()
+        self._caption: str = ""
+        self._thinker: threading.Thread | None = None
+        # Set to abort a search; the thinker thread owns the searcher, so
+        # the GUI thread signals it through this rather than Searcher.stop()
+        self._stop_event = threading.Event()
+        self._engine_result: SearchResult | None = None
+
+    def square_rect(self, square: int) -> pygame.Rect:
+        file, rank = square & 7, square >> 3
+        column: int = 7 - file if self.flipped else file
+        row: int = rank if self.flipped else 7 - rank
+        return pygame.Rect(
+            column * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE
+        )
+
+    def square_at(self, position: tuple[int, int]) -> int | None:
+        column, row = position[0] // SQUARE_SIZE, position[1] // SQUARE_SIZE
+        if not (0 <= column < 8 and 0 <= row < 8):
+            return None
+        file: int = 7 - column if self.flipped else column
+        rank: int = row if self.flipped else 7 - row
+        return rank * 8 + file
+
+    @property
+    def thinking(self) -> bool:
+        return self._thinker is not None
+
+    def _looks(self) -> list[SquareLook]:
+        """How every square should look now."""
+        state: GameState = self.game.state
+        highlights: list[int] = [NO_HIGHLIGHT] * 64
+        if self.game.moves:
+            last: Move = self.game.moves[-1]
+            highlights[last.from_square] = highlights[last.to_square] = LAST_MOVE
+        if self.selected is not None:
+            highlights[self.selected] = SELECTED
+        if self._checked_king is not None:
+            highlights[self._checked_king] = CHECK
+        return [
+            SquareLook(
+                highlights[square], state.board.piece_at(square), square in self.targets
+            )
+            for square in range(64)
+        ]
+
+    def _find_checked_king(self) -> int | None:
+        state: GameState = self.game.state
+        if not in_check(state):
+            return None
+        return state.board.king_square(state.side_to_move)
+
+    def refresh(self) -> None:
+        """Redraw the squares whose look changed since they were last drawn."""
+        if not self._stale:
+            return
+        self._stale = False
+        for square, look in enumerate(self._looks()):
+            if self._shown[square] == look:
+                continue
+            self._shown[square] = look
+            rect: pygame.Rect = self.square_rect(square)
+            light: bool = ((square >> 3) + (square & 7)) & 1 == 1
+            self.screen.blit(self.sprites.squares[light, look.highlight], rect)
+            if look.piece is not None:
+                self.screen.blit(self.sprites.pieces[look.piece], rect)
+            if look.target:
+                marker = self.sprites.ring if look.piece else self.sprites.dot
+                self.screen.blit(marker, rect)
+            self._dirty.append(rect)
+
+        caption: str = self._status_text()
+        if caption != self._caption:
+            self._caption = caption
+            pygame.display.set_caption(caption)
+
+    def flip(self) -> None:
+        """Push the redrawn squares to the display."""
+        if self._dirty:
+            pygame.display.update(self._dirty)
+            self._dirty.clear()
+
+    def _status_text(self) -> str:
+        if self.status != GameStatus.ONGOING:
+            return f"Chess2 - {self.status.value}"
+        if self.thinking:
+            return "Chess2 - thinking..."
+        side: str = "White" if self.game.state.side_to_move == WHITE else "Black"
+        return f"Chess2 - {side} to move"
+
+    def click(self, square: int | None) -> None:
+        if self.thinking or self.status != GameStatus.ONGOING:
+            return
+        self._stale = True
+        if square is not None and square in self.targets:
+            moves: list[Move] = self.targets[square]
+            # Promotions: always a queen
+            move: Move = next(
+                (move for move in moves if move.promotion in (None, QUEEN)), moves[0]
+            )
+            self._deselect()
+            self.play(move)
+            return
+        piece: tuple[int, int] | None = (
+            None if square is None else self.game.state.board.piece_at(square)
+        )
+        if square == self.selected or piece is None or piece[0] != self.human:
+            self._deselect()
+            return
+        self.selected = square
+        self.targets = {}
+        for move in self.game.legal_moves():
+            if move.from_square == square:
+                self.targets.setdefault(move.to_square, []).append(move)
+
+    def _deselect(self) -> None:
+        self.selected = None
+        self.targets = {}
+
+    def play(self, move: Move) -> None:
+        self.game.play(move)
+        self.status = self.game.status
+        self._checked_king = self._find_checked_king()
+        self._stale = True
+        if self.status == GameStatus.ONGOING and self._engine_to_move():
+            self.start_engine()
+
+    def _engine_to_move(self) -> bool:
+        return self.game.state.side_to_move != self.human
+
+    def start_engine(self) -> None:
+        """Ask for the engine's move; book moves are played at once."""
+        if self.game.book is not None:
+            book_move: Move | None = self.game.book.choose(self.game.state)
+            if book_move is not None:
+                self.game.last_search = None
+                self.play(book_move)
+                return
+        self._engine_result = None
+        self.game.searcher.stop_signal = self._stop_event
+        self._stop_event.clear()
+        self._thinker = threading.Thread(
+            target=self._think,
+            args=(self.game.state.copy(), list(self.game.position_keys)),
+            name="gui-search",
+            daemon=True,
+        )
+        self._thinker.start()
+        self._stale = True  # Caption
+
+    def _think(self, state: GameState, previous_keys: list[int]) -> None:
+        self._engine_result = self.game.searcher.search(
+            state, self.game.engine_limits, previous_keys
+        )
+
+    def poll_engine(self) -> None:
+        """Play the engine's move once its search has finished."""
+        if self._thinker is None or self._thinker.is_alive():
+            return
+        self._thinker = None
+        result: SearchResult | None = self._engine_result
+        if result is not None and result.best_move is not None:
+            self.game.last_search = result
+            self.play(result.best_move)
+
+    def stop_engine(self) -> None:
+        if self._thinker is not None:
+            self._stop_event.set()
+            self._thinker.join()
+            self._thinker = None
+
+    def run(self, fps: int = FPS) -> None:
+        """Event loop; returns when the window is closed."""
+        clock = pygame.time.Clock()
+        if self._engine_to_move():
+            self.start_engine()
+        self.refresh()
+        running: bool = True
+        while running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    self.click(self.square_at(event.pos))
+                elif event.type == pygame.WINDOWEXPOSED:
+                    self._shown = [None] * 64  # The window contents were lost
+                    self._stale = True
+            self.poll_engine()
+            self.refresh()
+            self.flip()
+            clock.tick(fps)
+        self.stop_engine()
+
+
+def run(game: Game | None = None, human: int = WHITE, fps: int = FPS) -> None:
+    """Open a window and play until it is closed."""
+    pygame.init()
+    try:
+        screen: pygame.Surface = pygame.display.set_mode((BOARD_SIZE, BOARD_SIZE))
+        ChessGui(screen, game, human).run(fps)
+    finally:
+        pygame.quit()
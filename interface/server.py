@@ -0,0 +1,293 @@
+"""
+Game server.
+Hosts many games in one asyncio process, spoken to in line-delimited JSON
+over TCP or a Unix socket; engine searches run in a process pool so the
+event loop never blocks.
+
+Each request is one JSON object per line with a "cmd" and an optional "id"
+that is echoed back:
+    {"id": 1, "cmd": "new", "fen": "..."}       -> {"game": 7, "fen": ...}
+    {"cmd": "move", "game": 7, "move": "e2e4"}  -> {"fen": ..., "status": ...}
+    {"cmd": "go", "game": 7, "movetime": 0.5}   -> {"move": "e7e5", ...}
+    {"cmd": "state" | "undo" | "close", "game": 7}
+    {"cmd": "ping"}
+Replies carry "ok"; failed requests get "ok": false and an "error".
+"""
+
+from __future__ import annotations
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import count
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+from engine.game_state import GameState
+from engine.parallel import default_workers
+from engine.search import Searcher, SearchLimits, SearchResult
+from game.game import Game, GameStatus
+
+DEFAULT_MAX_GAMES: int = 10_000
+DEFAULT_MOVETIME: float = 1.0
+# Longest request line accepted, in bytes
+LINE_LIMIT: int = 1 << 16
+
+# Each pool process keeps one searcher so its transposition table is
+# allocated once, not per request
+_worker_searcher: Searcher | None = None
+
+
+def _search_in_worker(
+    fen: str, previous_keys: list[int], limits: SearchLimits
+) -> tuple[str | None, int, int, int]:
+    """Pool task: search a position, returning (move, score, depth, nodes)."""
+    global _worker_searcher
+    if _worker_searcher is None:
+        _worker_searcher = Searcher()
+    result: SearchResult = _worker_searcher.search(
+        GameState.from_fen(fen), limits, previous_keys
+    )
+    move: str | None = result.best_move.uci if result.best_move else None
+    return move, result.score, result.depth, result.nodes
+
+
+class RequestError(Exception):
+    """A request that can't be carried out; reported back to the client."""
+
+
+@dataclass
+class Session:
+    """A hosted game; its lock keeps requests on one game in order."""
+
+    game: Game
+    limits: SearchLimits
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class GameServer:
+    """Games shared by every connection, addressed by integer id."""
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        limits: SearchLimits | None = None,
+        max_games: int = DEFAULT_MAX_GAMES,
+    ) -> None:
+        self.limits: SearchLimits = limits or SearchLimits(movetime=DEFAULT_MOVETIME)
+        self.max_games: int = max_games
+        self.sessions: dict[int, Session] = {}
+        self._ids = count(1)
+        self._pool = ProcessPoolExecutor(max_workers=workers or default_workers())
+        self._handlers: dict[str, Callable[[dict[str, Any]], Awaitable[dict]]] = {
+            "new": self._new,
+            "move": self._move,
+            "go": self._go,
+            "state": self._state,
+            "undo": self._undo,
+            "close": self._close,
+            "ping": self._ping,
+        }
+
+    async def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Carry out one request and build its reply."""
+        reply: dict[str, Any] = {"id": request["id"]} if "id" in request else {}
+        handler = self._handlers.get(request.get("cmd"))
+        try:
+            if handler is None:
+                raise RequestError(f"Unknown command: {request.get('cmd')}")
+            reply.update(await handler(request))
+        except (RequestError, ValueError, TypeError) as error:
+            reply.update(ok=False, error=str(error))
+        except Exception as error:
+            # Whatever went wrong, the client still gets an answer
+            reply.update(ok=False, error=f"Internal error: {error!r}")
+        else:
+            reply["ok"] = True
+        return reply
+
+    def _session(self, request: dict[str, Any]) -> Session:
+        game_id: Any = request.get("game")
+        session: Session | None = (
+            self.sessions.get(game_id) if isinstance(game_id, int) else None
+        )
+        if session is None:
+            raise RequestError(f"No such game: {request.get('game')}")
+        return session
+
+    @staticmethod
+    def _limits(request: dict[str, Any], default: SearchLimits) -> SearchLimits:
+        if not any(key in request for key in ("depth", "movetime", "nodes")):
+            return default
+        depth, movetime, nodes = (
+            request.get("depth"),
+            request.get("movetime"),
+            request.get("nodes"),
+        )
+        for name, value, kinds in (
+            ("depth", depth, int),
+            ("movetime", movetime, (int, float)),
+            ("nodes", nodes, int),
+        ):
+            if value is not None and (not isinstance(value, kinds) or value <= 0):
+                raise RequestError(f"{name} must be a positive number")
+        return SearchLimits(depth, movetime, nodes)
+
+    @staticmethod
+    def _position(game: Game) -> dict[str, Any]:
+        return {"fen": game.state.to_fen(), "status": game.status.value}
+
+    async def _new(self, request: dict[str, Any]) -> dict[str, Any]:
+        if len(self.sessions) >= self.max_games:
+            raise RequestError("Too many games")
+        state: GameState | None = None
+        if "fen" in request:
+            state = GameState.from_fen(str(request["fen"]))
+        game = Game(state)
+        limits: SearchLimits = self._limits(request, self.limits)
+        position: dict[str, Any] = self._position(game)
+        # Registered only once nothing else can fail
+        game_id: int = next(self._ids)
+        self.sessions[game_id] = Session(game, limits)
+        return {"game": game_id, **position}
+
+    async def _move(self, request: dict[str, Any]) -> dict[str, Any]:
+        session: Session = self._session(request)
+        async with session.lock:
+            session.game.play_uci(str(request.get("move")))
+            return self._position(session.game)
+
+    async def _go(self, request: dict[str, Any]) -> dict[str, Any]:
+        session: Session = self._session(request)
+        async with session.lock:
+            game: Game = session.game
+            if game.status != GameStatus.ONGOING:
+                raise RequestError(f"Game is over: {game.status.value}")
+            loop = asyncio.get_running_loop()
+            found: tuple[str | None, int, int, int] = await loop.run_in_executor(
+                self._pool,
+                _search_in_worker,
+                game.state.to_fen(),
+                list(game.position_keys),
+                self._limits(request, session.limits),
+            )
+            move, score, depth, nodes = found
+            if move is None:
+                raise RequestError("No move found")
+            game.play_uci(move)
+            return {
+                "move": move,
+                "score": score,
+                "depth": depth,
+                "nodes": nodes,
+                **self._position(game),
+            }
+
+    async def _state(self, request: dict[str, Any]) -> dict[str, Any]:
+        session: Session = self._session(request)
+        async with session.lock:
+            return {
+                "moves": [move.uci for move in session.game.moves],
+                **self._position(session.game),
+            }
+
+    async def _undo(self, request: dict[str, Any]) -> dict[str, Any]:
+        session: Session = self._session(request)
+        async with session.lock:
+            if not session.game.moves:
+                raise RequestError("No move to undo")
+            move: str = session.game.undo().uci
+            return {"move": move, **self._position(session.game)}
+
+    async def _close(self, request: dict[str, Any]) -> dict[str, Any]:
+        session: Session = self._session(request)
+        async with session.lock:
+            self.sessions.pop(request["game"], None)
+        return {}
+
+    async def _ping(self, request: dict[str, Any]) -> dict[str, Any]:
+        return {"games": len(self.sessions)}
+
+    async def serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Answer one client's requests. Each line is handled in its own task,
+        so a search on one game doesn't hold up requests on the others.
+        """
+        write_lock = asyncio.Lock()
+        tasks: set[asyncio.Task] = set()
+
+        async def respond(line: bytes) -> None:
+            try:
+                request: Any = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("Request must be a JSON object")
+            except ValueError as error:
+                reply: dict[str, Any] = {"ok": False, "error": f"Bad request: {error}"}
+            else:
+                try:
+                    reply = await self.handle(request)
+                except Exception as error:  # handle() replies to anything it can
+                    reply = {"ok": False, "error": f"Internal error: {error!r}"}
+            async with write_lock:
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    task = asyncio.create_task(respond(line))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks)
+        except (ConnectionError, ValueError):
+            pass  # Client went away or sent an over-long line
+        except asyncio.CancelledError:
+            pass  # Server shutting down; ending quietly keeps asyncio from logging it
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def start(
+        self,
+        host: str | None = None,
+        port: int | None = None,
+        path: str | Path | None = None,
+    ) -> asyncio.AbstractServer:
+        """Listen on a Unix socket if path is given, otherwise on TCP."""
+        if path is not None:
+            return await asyncio.start_unix_server(
+                self.serve_connection, str(path), limit=LINE_LIMIT
+            )
+        return await asyncio.start_server(
+            self.serve_connection, host, port, limit=LINE_LIMIT
+        )
+
+    def close(self) -> None:
+        """Stop the search processes."""
+        self._pool.shutdown(cancel_futures=True)
+
+
+async def serve(
+    host: str | None = "127.0.0.1",
+    port: int | None = 8765,
+    path: str | Path | None = None,
+    workers: int | None = None,
+    limits: SearchLimits | None = None,
+    max_games: int = DEFAULT_MAX_GAMES,
+    on_ready: Callable[[list[Any]], None] | None = None,
+) -> None:
+    """
+    Run a game server until cancelled. on_ready is called with the
+    addresses listened on once the server accepts connections.
+    """
+    server = GameServer(workers, limits, max_games)
+    try:
+        listener: asyncio.AbstractServer = await server.start(host, port, path)
+        async with listener:
+            if on_ready is not None:
+                on_ready([socket.getsockname() for socket in listener.sockets])
+            await listener.serve_forever()
+    finally:
+        server.close()
@@ -1,6 +1,170 @@
-def main():
-    print("Hello from chess2!")
+import argparse
+import asyncio
+import sys
+
+from engine.batch import BatchOptions, run_batch
+from engine.game_state import GameState
+from engine.perft import REFERENCE_POSITIONS, read_perft_suite, run_perft
+from engine.retrograde import generate_tables
+from engine.search import SearchLimits
+from interface.cli import run as run_uci
+from interface.server import DEFAULT_MAX_GAMES, DEFAULT_MOVETIME, serve
+
+
+def perft_command(args: argparse.Namespace) -> int:
+    """Run perft on one FEN, the reference positions, or a suite file."""
+    if args.suite:
+        failures: int = 0
+        for fen, expected in read_perft_suite(args.suite):
+            for depth, expected_nodes in sorted(expected.items()):
+                if depth > args.depth:
+                    break
+                result = run_perft(GameState.from_fen(fen), depth)
+                status: str = "ok" if result.nodes == expected_nodes else "FAIL"
+                failures += result.nodes != expected_nodes
+                print(
+                    f"{status:4} depth {depth} nodes {result.nodes:>10} "
+                    f"(expected {expected_nodes}) {result.nodes_per_second:>10.0f} nps"
+                    f"  {fen}"
+                )
+        return 1 if failures else 0
+
+    positions: dict[str, str] = (
+        {"fen": args.fen} if args.fen else dict(REFERENCE_POSITIONS)
+    )
+    for name, fen in positions.items():
+        result = run_perft(GameState.from_fen(fen), args.depth, split=args.divide)
+        for move, nodes in sorted(result.divide.items()):
+            print(f"{move}: {nodes}")
+        print(
+            f"{name}: depth {result.depth} nodes {result.nodes} "
+            f"time {result.seconds:.3f}s nps {result.nodes_per_second:.0f}"
+        )
+    return 0
+
+
+def batch_command(args: argparse.Namespace) -> int:
+    """Analyse every position in a FEN/EPD file, writing JSON Lines."""
+    search: SearchLimits | None = None
+    if args.search_depth or args.movetime:
+        search = SearchLimits(depth=args.search_depth, movetime=args.movetime)
+    options = BatchOptions(perft_depth=args.perft_depth, search=search)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            run_batch(args.input, output, options, args.workers, args.chunk_size)
+    else:
+        run_batch(args.input, sys.stdout, options, args.workers, args.chunk_size)
+    return 0
+
+
+def tablebase_command(args: argparse.Namespace) -> int:
+    """Generate the built-in endgame tables into a directory."""
+    for path in generate_tables(args.directory):
+        print(f"wrote {path}")
+    return 0
+
+
+def serve_command(args: argparse.Namespace) -> int:
+    """Host games for network clients until interrupted."""
+    limits = SearchLimits(depth=args.depth, movetime=args.movetime)
+
+    def ready(addresses: list) -> None:
+        for address in addresses:
+            print(f"listening on {address}", flush=True)
+
+    try:
+        asyncio.run(
+            serve(
+                args.host,
+                args.port,
+                args.unix,
+                args.workers,
+                limits,
+                args.max_games,
+                ready,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def uci_command(args: argparse.Namespace) -> int:
+    """Talk UCI on stdin/stdout for chess GUIs."""
+    return run_uci(sys.stdin, sys.stdout)
+
+
+def gui_command(args: argparse.Namespace) -> int:
+    """Play against the engine in a window."""
+    # Imported here so the other commands don't need a display library
+    from engine.board import BLACK, WHITE
+    from game.game import Game
+    from interface.gui import run as run_gui
+
+    game = Game(engine_limits=SearchLimits(movetime=args.movetime))
+    run_gui(game, BLACK if args.black else WHITE, args.fps)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="chess2")
+    commands = parser.add_subparsers(dest="command")
+
+    perft = commands.add_parser("perft", help="count move-tree leaf nodes")
+    perft.add_argument("--fen", help="position to search (default: reference set)")
+    perft.add_argument("--depth", type=int, default=3)
+    perft.add_argument(
+        "--divide", action="store_true", help="print counts per root move"
+    )
+    perft.add_argument("--suite", help="EPD file with ';D<depth> <nodes>' fields")
+    perft.set_defaults(handler=perft_command)
+
+    batch = commands.add_parser("batch", help="analyse a FEN/EPD file")
+    batch.add_argument("input", help="file with one FEN or EPD position per line")
+    batch.add_argument("-o", "--output", help="JSON Lines file (default: stdout)")
+    batch.add_argument("--perft-depth", type=int, default=0)
+    batch.add_argument("--search-depth", type=int, help="search to this depth")
+    batch.add_argument("--movetime", type=float, help="seconds to search each")
+    batch.add_argument("--workers", type=int, help="processes (default: all cores)")
+    batch.add_argument("--chunk-size", type=int, default=16)
+    batch.set_defaults(handler=batch_command)
+
+    tablebase = commands.add_parser(
+        "tablebase", help="generate the KQvK, KRvK and KPvK tables"
+    )
+    tablebase.add_argument("directory", help="where to write the table files")
+    tablebase.set_defaults(handler=tablebase_command)
+
+    server = commands.add_parser("serve", help="host games over TCP or a socket")
+    server.add_argument("--host", default="127.0.0.1")
+    server.add_argument("--port", type=int, default=8765)
+    server.add_argument("--unix", help="listen on this Unix socket path instead")
+    server.add_argument("--workers", type=int, help="search processes")
+    server.add_argument("--movetime", type=float, default=DEFAULT_MOVETIME)
+    server.add_argument("--depth", type=int, help="default search depth")
+    server.add_argument("--max-games", type=int, default=DEFAULT_MAX_GAMES)
+    server.set_defaults(handler=serve_command)
+
+    uci = commands.add_parser("uci", help="run as a UCI engine on stdin/stdout")
+    uci.set_defaults(handler=uci_command)
+
+    gui = commands.add_parser("gui", help="play against the engine in a window")
+    gui.add_argument("--black", action="store_true", help="play the black pieces")
+    gui.add_argument("--movetime", type=float, default=1.0, help="engine seconds")
+    gui.add_argument("--fps", type=int, default=30, help="frame rate cap")
+    gui.set_defaults(handler=gui_command)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        print("Hello from chess2!")
+        return 0
+    return args.handler(args)
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -5,13 +5,16 @@ Moves diagonally any number of squares.
 
 from __future__ import annotations
 from core.coordinate import Coordinate
-from core.direction import Directions
+from core.attack_tables import DIAGONAL_RAYS
+from core.magic import bishop_attacks
 from pieces.piece import Piece, PieceType
 
 
 class Bishop(Piece):
     """Bishop piece - moves diagonally."""
 
+    __slots__ = ()
+
     @property
     def piece_type(self) -> PieceType:
         return PieceType.BISHOP
@@ -23,9 +26,9 @@ class Bishop(Piece):
         attack_squares = set()
 
         # Check all diagonal directions
-        for direction in Directions.DIAGONAL:
-            # Get all squares in this direction until we hit something
-            for target_square in direction.ray_from(self.coordinate):
+        for ray in DIAGONAL_RAYS[self.coordinate.index]:
+            # Walk squares in this direction until we hit something
+            for target_square in ray:
                 attack_squares.add(target_square)
 
                 # Stop if we hit any piece (friendly or enemy)
@@ -33,3 +36,7 @@ class Bishop(Piece):
                     break
 
         return attack_squares
+
+    def get_attack_bitboard(self, occupied: int) -> int:
+        """Magic bitboard lookup (get_attack_squares walks the rays instead)."""
+        return bishop_attacks(self.coordinate.index, occupied)
@@ -0,0 +1,30 @@
+"""
+King chess piece implementation.
+Moves one square in any direction.
+"""
+
+from __future__ import annotations
+from core.coordinate import Coordinate
+from core.attack_tables import KING_TARGETS
+from core.bitboard import KING_ATTACKS
+from pieces.piece import Piece, PieceType
+
+
+class King(Piece):
+    """King piece - moves a single square in any direction."""
+
+    __slots__ = ()
+
+    @property
+    def piece_type(self) -> PieceType:
+        return PieceType.KING
+
+    def get_attack_squares(
+        self, board_state: dict[Coordinate, Piece]
+    ) -> set[Coordinate]:
+        """Get all squares adjacent to the king."""
+        return set(KING_TARGETS[self.coordinate.index])
+
+    def get_attack_bitboard(self, occupied: int) -> int:
+        """Precomputed jump targets (occupancy doesn't matter)."""
+        return KING_ATTACKS[self.coordinate.index]
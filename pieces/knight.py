@@ -0,0 +1,30 @@
+"""
+Knight chess piece implementation.
+Jumps in an L-shape, ignoring pieces in between.
+"""
+
+from __future__ import annotations
+from core.coordinate import Coordinate
+from core.attack_tables import KNIGHT_TARGETS
+from core.bitboard import KNIGHT_ATTACKS
+from pieces.piece import Piece, PieceType
+
+
+class Knight(Piece):
+    """Knight piece - jumps two squares one way and one square the other."""
+
+    __slots__ = ()
+
+    @property
+    def piece_type(self) -> PieceType:
+        return PieceType.KNIGHT
+
+    def get_attack_squares(
+        self, board_state: dict[Coordinate, Piece]
+    ) -> set[Coordinate]:
+        """Get all squares the knight attacks (blocking pieces don't matter)."""
+        return set(KNIGHT_TARGETS[self.coordinate.index])
+
+    def get_attack_bitboard(self, occupied: int) -> int:
+        """Precomputed jump targets (occupancy doesn't matter)."""
+        return KNIGHT_ATTACKS[self.coordinate.index]
@@ -0,0 +1,67 @@
+"""
+Pawn chess piece implementation.
+Moves forward, captures diagonally forward.
+"""
+
+from __future__ import annotations
+from core.coordinate import Coordinate
+from core.color import Color
+from core.attack_tables import PAWN_TARGETS
+from core.bitboard import PAWN_ATTACKS
+from pieces.piece import Piece, PieceType
+
+
+class Pawn(Piece):
+    """Pawn piece - pushes forward and captures diagonally."""
+
+    __slots__ = ()
+
+    @property
+    def piece_type(self) -> PieceType:
+        return PieceType.PAWN
+
+    @property
+    def start_rank_index(self) -> int:
+        """Rank index the pawn starts on (can double-push from here)."""
+        return 1 if self.color == Color.WHITE else 6
+
+    def get_attack_squares(
+        self, board_state: dict[Coordinate, Piece]
+    ) -> set[Coordinate]:
+        """Get the two diagonal squares in front of the pawn."""
+        return set(PAWN_TARGETS[self.color][self.coordinate.index])
+
+    def get_attack_bitboard(self, occupied: int) -> int:
+        """Precomputed diagonal targets (occupancy doesn't matter)."""
+        return PAWN_ATTACKS[self.color][self.coordinate.index]
+
+    def get_legal_moves(self, board_state: dict[Coordinate, Piece]) -> set[Coordinate]:
+        """
+        Get pushes onto empty squares and captures of enemy pieces.
+        En passant depends on the previous move and is left to the
+        move generator.
+        """
+        legal_moves: set = set()
+        forward: int = self.color.value  # White moves up the board, black down
+
+        # Single push, then double push from the starting rank
+        one_step = Coordinate.from_indices(
+            self.coordinate.file_index, self.coordinate.rank_index + forward
+        )
+        if one_step is not None and one_step not in board_state:
+            legal_moves.add(one_step)
+
+            if self.coordinate.rank_index == self.start_rank_index:
+                two_steps = Coordinate.from_indices(
+                    self.coordinate.file_index, self.coordinate.rank_index + 2 * forward
+                )
+                if two_steps is not None and two_steps not in board_state:
+                    legal_moves.add(two_steps)
+
+        # Diagonal captures
+        for target in self.get_attack_squares(board_state):
+            target_piece: Piece | None = board_state.get(target)
+            if target_piece is not None and target_piece.color != self.color:
+                legal_moves.add(target)
+
+        return legal_moves
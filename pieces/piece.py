@@ -6,6 +6,7 @@ Defines common interface and behavior for all piece types.
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from enum import Enum
+from core import bitboard
 from core.coordinate import Coordinate
 from core.color import Color
 
@@ -22,7 +23,13 @@ class PieceType(Enum):
 
 
 class Piece(ABC):
-    """Abstract base class for all chess pieces."""
+    """
+    Abstract base class for all chess pieces.
+    The engine works on bitboards; pieces are small slotted views built on
+    demand (e.g. by Board.get_piece) for the UI and rules-level code.
+    """
+
+    __slots__ = ("color", "coordinate", "has_moved")
 
     def __init__(self, color: Color, coordinate: Coordinate) -> None:
         self.color = color
@@ -45,12 +52,25 @@ class Piece(ABC):
         """
         pass
 
+    def get_attack_bitboard(self, occupied: int) -> int:
+        """
+        Get attack squares as a bitboard, given board occupancy as a bitboard.
+        Default implementation goes through get_attack_squares; pieces with
+        precomputed tables override it with a direct lookup.
+        """
+        blockers: dict[Coordinate, Piece] = {
+            coord: self for coord in bitboard.to_coordinates(occupied)
+        }
+        return bitboard.from_coordinates(self.get_attack_squares(blockers))
+
     def get_legal_moves(self, board_state: dict[Coordinate, Piece]) -> set[Coordinate]:
         """
         Get all legal moves for this piece.
         Default implementation: attack squares that are empty or
         contain enemy pieces.
         Override for special piece behavior (like pawn).
+        Checks, pins, castling and en passant are handled by
+        engine.move_generator, which works on the whole position.
         """
         legal_moves: set = set()
 
@@ -0,0 +1,42 @@
+"""
+Queen chess piece implementation.
+Moves horizontally, vertically and diagonally any number of squares.
+"""
+
+from __future__ import annotations
+from core.coordinate import Coordinate
+from core.attack_tables import ALL_RAYS
+from core.magic import queen_attacks
+from pieces.piece import Piece, PieceType
+
+
+class Queen(Piece):
+    """Queen piece - moves like a rook and a bishop combined."""
+
+    __slots__ = ()
+
+    @property
+    def piece_type(self) -> PieceType:
+        return PieceType.QUEEN
+
+    def get_attack_squares(
+        self, board_state: dict[Coordinate, Piece]
+    ) -> set[Coordinate]:
+        """Get all squares the queen attacks (all eight directions)."""
+        attack_squares: set = set()
+
+        # Check orthogonal and diagonal directions
+        for ray in ALL_RAYS[self.coordinate.index]:
+            # Walk squares in this direction until we hit something
+            for target_square in ray:
+                attack_squares.add(target_square)
+
+                # Stop if we hit any piece (friendly or enemy)
+                if target_square in board_state:
+                    break
+
+        return attack_squares
+
+    def get_attack_bitboard(self, occupied: int) -> int:
+        """Magic bitboard lookup (get_attack_squares walks the rays instead)."""
+        return queen_attacks(self.coordinate.index, occupied)
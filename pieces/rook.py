@@ -5,13 +5,16 @@ Moves horizontally and vertically any number of squares.
 
 from __future__ import annotations
 from core.coordinate import Coordinate
-from core.direction import Directions
+from core.attack_tables import ORTHOGONAL_RAYS
+from core.magic import rook_attacks
 from pieces.piece import Piece, PieceType
 
 
 class Rook(Piece):
     """Rook piece - moves orthogonally (horizontally and vertically)."""
 
+    __slots__ = ()
+
     @property
     def piece_type(self) -> PieceType:
         return PieceType.ROOK
@@ -23,9 +26,9 @@ class Rook(Piece):
         attack_squares: set = set()
 
         # Check all orthogonal directions
-        for direction in Directions.ORTHOGONAL:
-            # Get all squares in this direction until we hit something
-            for target_square in direction.ray_from(self.coordinate):
+        for ray in ORTHOGONAL_RAYS[self.coordinate.index]:
+            # Walk squares in this direction until we hit something
+            for target_square in ray:
                 attack_squares.add(target_square)
 
                 # Stop if we hit any piece (friendly or enemy)
@@ -33,3 +36,7 @@ class Rook(Piece):
                     break
 
         return attack_squares
+
+    def get_attack_bitboard(self, occupied: int) -> int:
+        """Magic bitboard lookup (get_attack_squares walks the rays instead)."""
+        return rook_attacks(self.coordinate.index, occupied)
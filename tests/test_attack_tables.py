@@ -0,0 +1,51 @@
+"""Tests for precomputed movement tables."""
+
+from __future__ import annotations
+import sys
+
+sys.path.append("..")
+
+from core.attack_tables import (
+    DIAGONAL_RAYS,
+    KING_TARGETS,
+    KNIGHT_TARGETS,
+    ORTHOGONAL_RAYS,
+    RAYS,
+)
+from core.coordinate import Coordinate
+from core.direction import Directions
+
+
+def test_rays_match_direction():
+    """Test table rays equal rays built step by step."""
+    for direction in Directions.ALL_EIGHT:
+        for coord in Coordinate.all():
+            assert list(RAYS[direction][coord.index]) == direction.ray_from(coord)
+
+
+def test_ray_groups():
+    """Test per-square ray groups."""
+    d4 = Coordinate.from_str("d4").index
+    assert len(ORTHOGONAL_RAYS[d4]) == 4
+    assert len(DIAGONAL_RAYS[d4]) == 4
+    assert sum(len(ray) for ray in ORTHOGONAL_RAYS[d4]) == 14
+    assert sum(len(ray) for ray in DIAGONAL_RAYS[d4]) == 13
+
+
+def test_jump_targets():
+    """Test knight and king target tables."""
+    assert len(KNIGHT_TARGETS[Coordinate.from_str("e4").index]) == 8
+    assert len(KNIGHT_TARGETS[Coordinate.from_str("a1").index]) == 2
+    assert len(KING_TARGETS[Coordinate.from_str("e4").index]) == 8
+    assert len(KING_TARGETS[Coordinate.from_str("h8").index]) == 3
+
+    # Table entries are the shared coordinate instances
+    assert Coordinate.from_str("b3") in KNIGHT_TARGETS[0]
+    assert Coordinate.from_str("c2") in KNIGHT_TARGETS[0]
+
+
+if __name__ == "__main__":
+    test_rays_match_direction()
+    test_ray_groups()
+    test_jump_targets()
+    print("✅ All attack table tests passed!")
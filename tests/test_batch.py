@@ -0,0 +1,123 @@
+"""Tests for the batch position runner."""
+
+from __future__ import annotations
+import io
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.append("..")
+
+import engine.batch
+from engine.batch import (
+    BatchOptions,
+    Position,
+    analyse_position,
+    analyse_positions,
+    parse_position_line,
+    read_positions,
+    run_batch,
+)
+from engine.evaluation import evaluate
+from engine.game_state import GameState
+from engine.search import SearchLimits
+
+SUITE_PATH = Path(__file__).parent / "perftsuite.epd"
+
+
+def test_parse_position_line():
+    """Test FEN, EPD and perft suite lines are all understood."""
+    fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+    assert parse_position_line(fen) == (fen, {})
+    assert parse_position_line(fen + " ;D1 20 ;D2 400") == (fen, {1: 20, 2: 400})
+
+    epd = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - bm e4; id "x";'
+    assert parse_position_line(epd) == (fen[:-4], {})
+
+    try:
+        parse_position_line("8/8/8 w")
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+
+def test_read_positions_is_lazy():
+    """Test positions are read one at a time with their line numbers."""
+    positions = read_positions(SUITE_PATH)
+    first = next(positions)
+    assert first.line == 2
+    assert first.expected[1] == 20
+    assert sum(1 for _ in positions) == 10
+
+
+def test_results_in_input_order():
+    """Test chunks from several workers come back in input order."""
+    positions = list(read_positions(SUITE_PATH))
+    results = list(
+        analyse_positions(
+            positions, BatchOptions(perft_depth=2), workers=2, chunk_size=2
+        )
+    )
+    assert [result["line"] for result in results] == [p.line for p in positions]
+    assert all(result["perft"]["ok"] for result in results)
+
+
+def test_search_and_errors():
+    """Test search results and invalid lines become JSON records."""
+    positions = [
+        Position(1, "6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1"),
+        Position(2, "not a position"),
+    ]
+    options = BatchOptions(search=SearchLimits(depth=2))
+    mate, error = analyse_positions(positions, options, workers=1)
+
+    assert mate["best_move"] == "a1a8"
+    assert mate["pv"][0] == "a1a8"
+    assert mate["seconds"] >= 0
+    assert "error" in error and "best_move" not in error
+
+
+def test_failed_analysis_is_an_error_record():
+    """Test a position whose analysis raises is recorded, not raised."""
+
+    def broken(state, depth):
+        raise RuntimeError("broken perft")
+
+    original = engine.batch.perft
+    engine.batch.perft = broken
+    try:
+        position = Position(3, GameState.initial().to_fen())
+        result = analyse_position(position, BatchOptions(perft_depth=1))
+    finally:
+        engine.batch.perft = original
+    assert result["line"] == 3
+    assert result["error"] == "RuntimeError('broken perft')"
+    assert "perft" not in result
+
+
+def test_run_batch_writes_json_lines():
+    """Test a file is turned into one JSON object per position."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "positions.fen"
+        path.write_text(
+            "# comment\n4k3/8/8/8/8/8/8/3QK3 w - - 0 1\n\n8/8/8/8/8/8/8/K6k b - -\n"
+        )
+        output = io.StringIO()
+        assert run_batch(path, output, BatchOptions(), workers=1) == 2
+
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [line["line"] for line in lines] == [2, 4]
+    assert lines[0]["eval"] == evaluate(
+        GameState.from_fen("4k3/8/8/8/8/8/8/3QK3 w - - 0 1")
+    )
+
+
+if __name__ == "__main__":
+    test_parse_position_line()
+    test_read_positions_is_lazy()
+    test_results_in_input_order()
+    test_search_and_errors()
+    test_failed_analysis_is_an_error_record()
+    test_run_batch_writes_json_lines()
+    print("✅ All batch tests passed!")
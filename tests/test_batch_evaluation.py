@@ -0,0 +1,71 @@
+"""Tests for vectorized batch evaluation."""
+
+from __future__ import annotations
+import sys
+from pathlib import Path
+
+sys.path.append("..")
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from commands.move_executer import MoveExecuter
+from engine.batch import read_positions
+from engine.batch_evaluation import (
+    PLANE_COUNT,
+    encode_planes,
+    evaluate_batch,
+    plane_index,
+)
+from engine.board import BLACK, KING, PAWN, WHITE
+from engine.evaluation import evaluate
+from engine.game_state import GameState
+from engine.move_generator import generate_legal_moves
+
+SUITE_PATH = Path(__file__).parent / "perftsuite.epd"
+KIWIPETE: str = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+
+def _children(fen: str) -> list[GameState]:
+    executer = MoveExecuter(GameState.from_fen(fen))
+    children: list[GameState] = []
+    for move in generate_legal_moves(executer.state):
+        executer.make(move)
+        children.append(executer.state.copy())
+        executer.unmake()
+    return children
+
+
+def test_encode_planes():
+    """Test planes have one bit per piece on the right square."""
+    planes = encode_planes([GameState.initial()])
+    assert planes.shape == (1, PLANE_COUNT, 64)
+    assert planes[0, plane_index(WHITE, PAWN)].sum() == 8
+    assert planes[0, plane_index(WHITE, KING), 4] == 1
+    assert planes[0, plane_index(BLACK, KING), 60] == 1
+    assert planes.sum() == 32
+
+
+def test_matches_scalar_evaluation():
+    """Test batch scores equal evaluate() on every position."""
+    states: list[GameState] = [
+        GameState.from_fen(position.fen)
+        for position in read_positions(SUITE_PATH)
+        if position.fen
+    ]
+    states += _children(KIWIPETE)
+    scores = evaluate_batch(states)
+    assert scores.tolist() == [evaluate(state) for state in states]
+
+
+def test_empty_batch():
+    """Test an empty batch gives an empty result."""
+    assert evaluate_batch([]).shape == (0,)
+
+
+if __name__ == "__main__":
+    test_encode_planes()
+    test_matches_scalar_evaluation()
+    test_empty_batch()
+    print("✅ All batch evaluation tests passed!")
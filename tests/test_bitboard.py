@@ -0,0 +1,56 @@
+"""Tests for bitboard helpers."""
+
+from __future__ import annotations
+import sys
+
+sys.path.append("..")
+
+from core.bitboard import (
+    FILE_MASKS,
+    KNIGHT_ATTACKS,
+    PAWN_ATTACKS,
+    RANK_MASKS,
+    from_coordinates,
+    iter_squares,
+    lowest_square,
+    popcount,
+    to_coordinates,
+)
+from core.color import Color
+from core.coordinate import Coordinate
+
+
+def test_coordinate_conversion():
+    """Test converting between coordinates and bitboards."""
+    coords = {Coordinate.from_str("a1"), Coordinate.from_str("h8")}
+    bitboard = from_coordinates(coords)
+
+    assert bitboard == (1 << 0) | (1 << 63)
+    assert to_coordinates(bitboard) == coords
+    assert list(iter_squares(bitboard)) == [0, 63]
+    assert lowest_square(bitboard) == 0
+    assert popcount(bitboard) == 2
+
+
+def test_masks():
+    """Test file and rank masks."""
+    assert popcount(FILE_MASKS[0]) == 8
+    assert to_coordinates(RANK_MASKS[0]) == {
+        Coordinate.from_str(f"{file}1") for file in "abcdefgh"
+    }
+    assert FILE_MASKS[3] & RANK_MASKS[3] == 1 << Coordinate.from_str("d4").index
+
+
+def test_jump_attacks():
+    """Test precomputed jump attack bitboards."""
+    assert popcount(KNIGHT_ATTACKS[Coordinate.from_str("d4").index]) == 8
+    assert to_coordinates(
+        PAWN_ATTACKS[Color.WHITE][Coordinate.from_str("a2").index]
+    ) == {Coordinate.from_str("b3")}
+
+
+if __name__ == "__main__":
+    test_coordinate_conversion()
+    test_masks()
+    test_jump_attacks()
+    print("✅ All bitboard tests passed!")
@@ -0,0 +1,127 @@
+"""Tests for the bitboard Board."""
+
+from __future__ import annotations
+import sys
+
+sys.path.append("..")
+
+from core.bitboard import iter_squares, to_coordinates
+from core.coordinate import Coordinate
+from core.color import Color
+from engine.board import BISHOP, BLACK, KING, ROOK, WHITE, Board
+from pieces.bishop import Bishop
+from pieces.king import King
+from pieces.piece import Piece, PieceType
+from pieces.rook import Rook
+
+
+def sample_board_state() -> dict[Coordinate, Piece]:
+    """A few pieces of both colors."""
+    return {
+        Coordinate.from_str("e1"): King(Color.WHITE, Coordinate.from_str("e1")),
+        Coordinate.from_str("a1"): Rook(Color.WHITE, Coordinate.from_str("a1")),
+        Coordinate.from_str("e8"): King(Color.BLACK, Coordinate.from_str("e8")),
+        Coordinate.from_str("c5"): Bishop(Color.BLACK, Coordinate.from_str("c5")),
+    }
+
+
+def test_board_from_board_state():
+    """Test bitboards are filled from a board_state dict."""
+    board = Board.from_board_state(sample_board_state())
+
+    assert board.pieces[WHITE][KING] == 1 << Coordinate.from_str("e1").index
+    assert to_coordinates(board.pieces[WHITE][ROOK]) == {Coordinate.from_str("a1")}
+    assert to_coordinates(board.pieces[BLACK][BISHOP]) == {Coordinate.from_str("c5")}
+    assert board.occupied == board.colors[WHITE] | board.colors[BLACK]
+    assert len(list(iter_squares(board.occupied))) == 4
+
+
+def test_board_round_trip():
+    """Test converting back gives equal pieces usable for attacks."""
+    board_state = sample_board_state()
+    restored = Board.from_board_state(board_state).to_board_state()
+
+    assert restored == board_state
+
+    # Pieces from the board still answer attack queries on the dict
+    rook = restored[Coordinate.from_str("a1")]
+    assert Coordinate.from_str("a8") in rook.get_attack_squares(restored)
+    assert Coordinate.from_str("f1") not in rook.get_attack_squares(restored)
+
+
+def test_board_piece_queries():
+    """Test piece_at, get_piece and king_square."""
+    board = Board.from_board_state(sample_board_state())
+
+    assert board.piece_at(Coordinate.from_str("c5").index) == (BLACK, BISHOP)
+    assert board.piece_at(Coordinate.from_str("d5").index) is None
+    assert board.get_piece(Coordinate.from_str("e8")).piece_type == PieceType.KING
+    assert board.king_square(BLACK) == Coordinate.from_str("e8").index
+
+
+def test_board_move_and_copy():
+    """Test moving pieces keeps occupancy in sync and copies are independent."""
+    board = Board.from_board_state(sample_board_state())
+    snapshot = board.copy()
+
+    a1 = Coordinate.from_str("a1").index
+    a8 = Coordinate.from_str("a8").index
+    board.move(WHITE, ROOK, a1, a8)
+
+    assert board.piece_at(a8) == (WHITE, ROOK)
+    assert board.piece_at(a1) is None
+    assert board.occupied == board.colors[WHITE] | board.colors[BLACK]
+    assert snapshot.piece_at(a1) == (WHITE, ROOK)
+    assert board != snapshot
+
+
+def test_board_fen_placement():
+    """Test the FEN placement field parses to bitboards and back."""
+    placement = "r3k2r/8/8/8/8/8/8/R3K2R"
+    board = Board.from_fen(placement)
+
+    assert board.pieces[WHITE][ROOK] == (1 << 0) | (1 << 7)
+    assert board.pieces[BLACK][KING] == 1 << 60
+    assert board.occupied.bit_count() == 6
+    assert board.to_fen() == placement
+    assert Board.from_fen("8/8/8/8/8/8/8/8").to_fen() == "8/8/8/8/8/8/8/8"
+
+    for invalid in ("8/8/8/8/8/8/8", "8/8/8/8/8/8/8/7", "8/8/8/8/8/8/8/p8"):
+        try:
+            Board.from_fen(invalid)
+            assert False, f"Should have raised ValueError: {invalid}"
+        except ValueError:
+            pass
+
+
+def test_mailbox_matches_bitboards():
+    """Test the mailbox stays in sync through put, move, remove and copy."""
+    board = Board.starting_position()
+    for square in range(64):
+        expected = None
+        for color in (WHITE, BLACK):
+            for piece, bitboard in enumerate(board.pieces[color]):
+                if bitboard >> square & 1:
+                    expected = (color, piece)
+        assert board.piece_at(square) == expected
+
+    board.move(WHITE, 0, 12, 28)  # e2-e4
+    board.remove(BLACK, ROOK, 63)
+    copy = board.copy()
+    assert copy.piece_at(28) == (WHITE, 0)
+    assert copy.piece_at(12) is None and copy.piece_at(63) is None
+    assert Board.from_bitboards(*board.pieces).squares == board.squares
+
+    assert board.piece_list(BLACK)[:2] == [(48, 0), (49, 0)]
+    assert board.piece_list(WHITE)[4] == (4, KING)
+    assert len(board.piece_list(BLACK)) == 15
+
+
+if __name__ == "__main__":
+    test_board_from_board_state()
+    test_board_round_trip()
+    test_board_piece_queries()
+    test_board_move_and_copy()
+    test_board_fen_placement()
+    test_mailbox_matches_bitboards()
+    print("✅ All board tests passed!")
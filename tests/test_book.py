@@ -0,0 +1,93 @@
+"""Tests for the Polyglot opening book."""
+
+from __future__ import annotations
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.append("..")
+
+from commands.move import Move
+from commands.move_executer import MoveExecuter
+from engine.book import OpeningBook, write_book
+from engine.game_state import GameState
+from engine.move_generator import generate_legal_moves
+from engine.polyglot import polyglot_key
+from game.game import Game
+
+
+def _move(state: GameState, uci: str) -> Move:
+    return next(move for move in generate_legal_moves(state) if move.uci == uci)
+
+
+def _write_small_book(path: Path) -> None:
+    """A book with replies to 1.e4 and 1.d4 plus filler positions around them."""
+    start = GameState.initial()
+    executer = MoveExecuter(start.copy())
+    entries: list[tuple[int, Move, int]] = [
+        (polyglot_key(start), _move(start, "e2e4"), 3),
+        (polyglot_key(start), _move(start, "d2d4"), 1),
+        (polyglot_key(start), _move(start, "a2a3"), 0),
+    ]
+    executer.make(_move(executer.state, "e2e4"))
+    entries.append((polyglot_key(executer.state), _move(executer.state, "c7c5"), 5))
+    # Unrelated keys on both sides of the real ones
+    entries += [(key, Move(8, 16), 1) for key in range(0, 1 << 64, 1 << 58)]
+    write_book(path, entries)
+
+
+def test_lookup():
+    """Test entries are found by binary search and matched to legal moves."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "book.bin"
+        _write_small_book(path)
+        with OpeningBook(path) as book:
+            assert len(book) == 68
+            start = GameState.initial()
+            moves = {entry.move.uci: entry.weight for entry in book.entries(start)}
+            assert moves == {"e2e4": 3, "d2d4": 1, "a2a3": 0}
+            assert book.best_move(start).uci == "e2e4"
+
+            rng = random.Random(1)
+            chosen = {book.choose(start, rng).uci for _ in range(50)}
+            assert chosen == {"e2e4", "d2d4"}  # Zero weight is never played
+
+            assert book.entries(GameState.from_fen("8/8/8/8/8/8/8/K6k w - - 0 1")) == []
+
+
+def test_empty_and_invalid_books():
+    """Test an empty book has no moves and a truncated one is rejected."""
+    with tempfile.TemporaryDirectory() as directory:
+        empty = Path(directory) / "empty.bin"
+        empty.write_bytes(b"")
+        with OpeningBook(empty) as book:
+            assert len(book) == 0
+            assert book.choose(GameState.initial()) is None
+
+        broken = Path(directory) / "broken.bin"
+        broken.write_bytes(b"\0" * 17)
+        try:
+            OpeningBook(broken)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+
+def test_game_plays_from_book():
+    """Test the computer answers from the book without searching."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "book.bin"
+        _write_small_book(path)
+        with OpeningBook(path) as book:
+            game = Game(book=book)
+            game.play_uci("e2e4")
+            assert game.computer_move().uci == "c7c5"
+            assert game.last_search is None
+
+
+if __name__ == "__main__":
+    test_lookup()
+    test_empty_and_invalid_books()
+    test_game_plays_from_book()
+    print("✅ All book tests passed!")
@@ -0,0 +1,248 @@
+"""Tests for the UCI front end."""
+
+from __future__ import annotations
+import io
+import sys
+import threading
+import time
+
+sys.path.append("..")
+
+from engine.game_state import STARTING_FEN, GameState
+from interface.cli import UciEngine, parse_go, run, time_budget
+
+
+class _Output:
+    """Collects the engine's lines and lets a test wait for one."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self._changed = threading.Condition()
+
+    def write(self, text: str) -> None:
+        with self._changed:
+            self.lines.extend(text.splitlines())
+            self._changed.notify_all()
+
+    def flush(self) -> None:
+        pass
+
+    def wait_for(self, prefix: str, timeout: float = 10.0) -> str:
+        deadline: float = time.monotonic() + timeout
+        with self._changed:
+            while True:
+                for line in self.lines:
+                    if line.startswith(prefix):
+                        return line
+                remaining: float = deadline - time.monotonic()
+                assert remaining > 0, f"No '{prefix}' line in {self.lines}"
+                self._changed.wait(remaining)
+
+
+def _engine() -> tuple[UciEngine, _Output]:
+    output = _Output()
+    return UciEngine(output), output
+
+
+def test_handshake():
+    """uci lists the options and ends with uciok; isready gets readyok."""
+    engine, output = _engine()
+    engine.handle("uci")
+    assert output.lines[0].startswith("id name")
+    assert output.lines[-1] == "uciok"
+    assert any(line.startswith("option name Hash") for line in output.lines)
+    engine.handle("isready")
+    assert output.lines[-1] == "readyok"
+    assert engine.handle("quit") is False
+
+
+def test_parse_go():
+    """go arguments split into numbers and flags."""
+    numbers, flags = parse_go("wtime 60000 btime 50000 winc 1000 ponder".split())
+    assert numbers == {"wtime": 60000, "btime": 50000, "winc": 1000}
+    assert flags == {"ponder"}
+
+
+def test_time_budget():
+    """A share of the clock plus most of the increment, never the whole clock."""
+    assert abs(time_budget(60_000, 0, None) - (2000 - 50) / 1000) < 1e-9
+    assert abs(time_budget(60_000, 1000, 20) - (3000 + 750 - 50) / 1000) < 1e-9
+    assert time_budget(1000, 5000, 1) <= 0.5
+    assert time_budget(0, 0, None) > 0
+
+
+def test_go_depth():
+    """A fixed-depth search prints info lines and then its best move."""
+    engine, output = _engine()
+    engine.handle("position startpos moves e2e4")
+    engine.handle("go depth 2")
+    engine.wait()
+    assert output.wait_for("info depth 2").count(" pv ") == 1
+    assert output.lines[-1].startswith("bestmove ")
+
+
+def test_mate_score():
+    """Mates are reported as 'score mate' in moves."""
+    engine, output = _engine()
+    engine.handle("position fen 6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+    engine.handle("go depth 3")
+    engine.wait()
+    assert "score mate 1" in output.wait_for("info depth")
+    assert output.lines[-1].startswith("bestmove a1a8")
+
+
+def test_isready_while_searching():
+    """isready and stop are answered while an infinite search runs."""
+    engine, output = _engine()
+    engine.handle("position startpos")
+    engine.handle("go infinite")
+    started: float = time.perf_counter()
+    engine.handle("isready")
+    assert output.lines[-1] == "readyok" or "readyok" in output.lines
+    assert time.perf_counter() - started < 0.5
+    output.wait_for("info depth 1")
+    time.sleep(0.1)
+    assert not any(line.startswith("bestmove") for line in output.lines)
+    engine.handle("stop")
+    output.wait_for("bestmove ", timeout=2.0)
+    engine.handle("quit")
+
+
+def test_ponderhit():
+    """A ponder search holds its move until ponderhit, then keeps to the clock."""
+    engine, output = _engine()
+    engine.handle("position startpos moves e2e4 e7e5")
+    engine.handle("go ponder wtime 3000 btime 3000")
+    output.wait_for("info depth 1")
+    time.sleep(0.1)
+    assert not any(line.startswith("bestmove") for line in output.lines)
+    started: float = time.perf_counter()
+    engine.handle("ponderhit")
+    output.wait_for("bestmove ", timeout=5.0)
+    assert time.perf_counter() - started < 2.0
+    engine.handle("quit")
+
+
+def test_commands_during_infinite_search():
+    """position, go and setoption stop an infinite search instead of hanging."""
+    engine, output = _engine()
+    for command in (
+        "position startpos moves e2e4",
+        "setoption name Hash value 8",
+        "ucinewgame",
+        "go depth 1",
+    ):
+        engine.handle("position startpos")
+        engine.handle("go infinite")
+        output.wait_for("info depth 1")
+        handler = threading.Thread(target=engine.handle, args=(command,))
+        handler.start()
+        handler.join(timeout=5.0)
+        assert not handler.is_alive(), f"'{command}' hung"
+        engine.handle("quit")
+        output.wait_for("bestmove ")
+        output.lines.clear()
+
+
+def test_early_ponderhit():
+    """A ponderhit that beats the search thread still starts the clock."""
+    engine, output = _engine()
+    searcher = engine.searcher
+    search = searcher.search
+
+    def late_search(*args, **kwargs):
+        time.sleep(0.2)
+        return search(*args, **kwargs)
+
+    searcher.search = late_search
+    engine.handle("position startpos")
+    engine.handle("go ponder movetime 300")
+    engine.handle("ponderhit")
+    started: float = time.perf_counter()
+    output.wait_for("bestmove ", timeout=5.0)
+    assert time.perf_counter() - started < 2.0
+    engine.handle("quit")
+
+
+def test_position_reuse():
+    """A longer move list only plays the new moves on the same game."""
+    engine, _ = _engine()
+    engine.handle("position startpos moves e2e4 e7e5")
+    game = engine.game
+    engine.handle("position startpos moves e2e4 e7e5 g1f3 b8c6")
+    assert engine.game is game
+    assert [move.uci for move in game.moves] == ["e2e4", "e7e5", "g1f3", "b8c6"]
+    # A changed move takes back to the shared prefix
+    engine.handle("position startpos moves e2e4 c7c5")
+    assert engine.game is game
+    assert [move.uci for move in game.moves] == ["e2e4", "c7c5"]
+    expected = GameState.from_fen(
+        "rnbqkbnr/pp1ppppp/8/2p5/4P3/8/PPPP1PPP/RNBQKBNR w KQkq c6 0 2"
+    )
+    assert game.state.zobrist_key == expected.zobrist_key
+    # A different start position means a new game
+    engine.handle("position fen 4k3/8/8/8/8/8/8/4K3 w - - 0 1")
+    assert engine.game is not game
+    assert engine.game.state.to_fen() == "4k3/8/8/8/8/8/8/4K3 w - - 0 1"
+    engine.handle("ucinewgame")
+    assert engine.game.state.to_fen() == STARTING_FEN
+
+
+def test_bad_input():
+    """Illegal moves and unknown commands are reported, not raised."""
+    engine, output = _engine()
+    engine.handle("position startpos moves e2e5")
+    assert output.lines[-1].startswith("info string Error")
+    engine.handle("frobnicate")
+    assert output.lines[-1] == "info string Unknown command: frobnicate"
+
+
+def test_missing_book_file():
+    """A book that can't be opened is reported and the session goes on."""
+    engine, output = _engine()
+    assert engine.handle("setoption name BookFile value /nonexistent/book.bin")
+    assert output.lines[-1].startswith("info string Error")
+    assert engine.book is None
+    engine.handle("isready")
+    assert output.lines[-1] == "readyok"
+
+
+def test_failed_search_still_answers():
+    """A search that raises still ends with a bestmove."""
+    engine, output = _engine()
+
+    def broken(*args, **kwargs):
+        raise RuntimeError("broken search")
+
+    engine.searcher.search = broken
+    engine.handle("position startpos")
+    engine.handle("go depth 2")
+    engine.wait()
+    assert "broken search" in output.wait_for("info string Search failed")
+    assert output.lines[-1] == "bestmove 0000"
+
+
+def test_run():
+    """run() reads commands until quit."""
+    output = _Output()
+    run(io.StringIO("uci\nisready\nposition startpos\ngo depth 1\nquit\n"), output)
+    assert "uciok" in output.lines and "readyok" in output.lines
+    assert output.lines[-1].startswith("bestmove ")
+
+
+if __name__ == "__main__":
+    test_handshake()
+    test_parse_go()
+    test_time_budget()
+    test_go_depth()
+    test_mate_score()
+    test_isready_while_searching()
+    test_ponderhit()
+    test_commands_during_infinite_search()
+    test_early_ponderhit()
+    test_position_reuse()
+    test_bad_input()
+    test_missing_book_file()
+    test_failed_search_still_answers()
+    test_run()
+    print("✅ All UCI tests passed!")
@@ -61,10 +61,61 @@ def test_invalid_coordinates():
         pass
 
 
+def test_coordinate_interning():
+    """Test coordinates are shared canonical instances."""
+    assert Coordinate("e", "4") is Coordinate.from_str("e4")
+    assert Coordinate.from_index(28) is Coordinate.from_str("e4")
+    assert Coordinate.from_indices(4, 3) is Coordinate.from_str("e4")
+    assert Coordinate.from_indices(8, 0) is None
+    assert len(Coordinate.all()) == 64
+
+
+def test_coordinate_square_index():
+    """Test 0-63 square indices."""
+    assert Coordinate.from_str("a1").index == 0
+    assert Coordinate.from_str("h1").index == 7
+    assert Coordinate.from_str("a2").index == 8
+    assert Coordinate.from_str("h8").index == 63
+
+    for index, coord in enumerate(Coordinate.all()):
+        assert coord.index == index
+        assert Coordinate.from_index(index) is coord
+
+    try:
+        Coordinate.from_index(64)
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+
+def test_coordinate_immutable():
+    """Test coordinates cannot be modified."""
+    coord = Coordinate.from_str("e4")
+    try:
+        coord.file = "d"
+        assert False, "Should have raised AttributeError"
+    except AttributeError:
+        pass
+
+    assert coord.file == "e"
+
+
+def test_coordinate_pickle_keeps_identity():
+    """Test pickling returns the canonical instance."""
+    import pickle
+
+    coord = Coordinate.from_str("g7")
+    assert pickle.loads(pickle.dumps(coord)) is coord
+
+
 if __name__ == "__main__":
     test_coordinate_creation()
     test_coordinate_from_string()
     test_coordinate_indices()
     test_coordinate_equality()
     test_invalid_coordinates()
+    test_coordinate_interning()
+    test_coordinate_square_index()
+    test_coordinate_immutable()
+    test_coordinate_pickle_keeps_identity()
     print("✅ All coordinate tests passed!")
@@ -0,0 +1,100 @@
+"""Tests for static evaluation."""
+
+from __future__ import annotations
+import random
+import sys
+
+sys.path.append("..")
+
+from commands.move_executer import MoveExecuter
+from engine.evaluation import evaluate, evaluate_white
+from engine.game_state import GameState
+from engine.move_generator import generate_legal_moves
+from engine.pst import MAX_PHASE, PIECE_VALUES, compute_scores
+
+
+def test_starting_position_is_balanced():
+    """Test equal material scores zero."""
+    assert evaluate(GameState.initial()) == 0
+
+
+def test_score_is_from_side_to_move():
+    """Test the same material edge flips sign with the side to move."""
+    white = GameState.from_fen("4k3/8/8/8/8/8/8/3QK3 w - - 0 1")
+    black = GameState.from_fen("4k3/8/8/8/8/8/8/3QK3 b - - 0 1")
+    assert evaluate(white) == -evaluate(black) == evaluate_white(white)
+    assert evaluate(white) > 800
+
+
+def test_piece_square_bonus():
+    """Test a centralized knight scores more than one in the corner."""
+    center = GameState.from_fen("4k3/8/8/8/3N4/8/8/4K3 w - - 0 1")
+    corner = GameState.from_fen("4k3/8/8/8/8/8/8/N3K3 w - - 0 1")
+    assert evaluate(center) == PIECE_VALUES[1] + 20
+    assert evaluate(corner) == PIECE_VALUES[1] - 50
+
+
+def test_colors_are_mirrored():
+    """Test the same position with colors swapped scores the same."""
+    white = GameState.from_fen("4k3/8/8/3p4/2N5/8/PP6/4K3 w - - 0 1")
+    black = GameState.from_fen("4k3/pp6/8/2n5/3P4/8/8/4K3 b - - 0 1")
+    assert evaluate(white) == evaluate(black)
+
+
+def test_king_placement_depends_on_phase():
+    """Test a central king is penalized in the middlegame only."""
+    middlegame = "rnbq1bnr/pppppppp/8/8/4k3/8/PPPPPPPP/RNBQKBNR b - - 0 1"
+    endgame = "8/pppp4/8/8/4k3/8/PPPP4/4K3 b - - 0 1"
+    assert evaluate(GameState.from_fen(middlegame)) < 0
+    assert evaluate(GameState.from_fen(endgame)) > 0
+    assert GameState.initial().phase == MAX_PHASE
+    assert GameState.from_fen(endgame).phase == 0
+
+
+def test_scores_are_updated_incrementally():
+    """Test make/unmake keep the scores equal to a full rescan."""
+    rng = random.Random(7)
+    executer = MoveExecuter(
+        GameState.from_fen(
+            "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+        )
+    )
+    expected: list[tuple[int, int, int]] = []
+    for _ in range(60):
+        moves = generate_legal_moves(executer.state)
+        if not moves:
+            break
+        state = executer.state
+        expected.append((state.midgame_score, state.endgame_score, state.phase))
+        executer.make(rng.choice(moves))
+        state = executer.state
+        assert (state.midgame_score, state.endgame_score, state.phase) == (
+            compute_scores(state.board)
+        )
+        assert evaluate(state) == evaluate(GameState.from_fen(state.to_fen()))
+    while expected:
+        executer.unmake()
+        state = executer.state
+        assert (state.midgame_score, state.endgame_score, state.phase) == expected.pop()
+
+
+def test_promotion_updates_phase():
+    """Test promoting adds the new piece's phase and value."""
+    executer = MoveExecuter(GameState.from_fen("8/4P3/8/8/8/8/k7/4K3 w - - 0 1"))
+    queen = next(
+        move for move in generate_legal_moves(executer.state) if move.uci == "e7e8q"
+    )
+    executer.make(queen)
+    assert executer.state.phase == 4
+    assert compute_scores(executer.state.board)[0] == executer.state.midgame_score
+
+
+if __name__ == "__main__":
+    test_starting_position_is_balanced()
+    test_score_is_from_side_to_move()
+    test_piece_square_bonus()
+    test_colors_are_mirrored()
+    test_king_placement_depends_on_phase()
+    test_scores_are_updated_incrementally()
+    test_promotion_updates_phase()
+    print("✅ All evaluation tests passed!")
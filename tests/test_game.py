@@ -0,0 +1,102 @@
+"""Tests for the game wrapper and computer opponent."""
+
+from __future__ import annotations
+import sys
+import time
+
+sys.path.append("..")
+
+from core.color import Color
+from core.coordinate import Coordinate
+from engine.game_state import GameState
+from engine.search import SearchLimits
+from game.game import Game, GameStatus
+
+
+def test_play_and_undo():
+    """Test moves are played, validated and taken back."""
+    game = Game()
+    game.play_uci("e2e4")
+    assert game.turn == Color.BLACK
+    assert [move.uci for move in game.moves] == ["e2e4"]
+
+    try:
+        game.play_uci("e2e4")
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+    assert game.undo().uci == "e2e4"
+    assert game.state == GameState.initial()
+    assert game.position_keys == [game.state.zobrist_key]
+
+
+def test_legal_moves_from():
+    """Test moves can be listed per square."""
+    game = Game()
+    targets = {move.to_coord for move in game.legal_moves_from(Coordinate("g", "1"))}
+    assert targets == {Coordinate("f", "3"), Coordinate("h", "3")}
+
+
+def test_status():
+    """Test checkmate and stalemate are recognised."""
+    assert Game().status == GameStatus.ONGOING
+    mated = GameState.from_fen("R5k1/5ppp/8/8/8/8/8/6K1 b - - 0 1")
+    assert Game(mated).status == GameStatus.CHECKMATE
+    stalemate = GameState.from_fen("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1")
+    assert Game(stalemate).status == GameStatus.STALEMATE
+
+
+def test_draws():
+    """Test threefold repetition and the fifty-move rule end the game."""
+    game = Game()
+    for _ in range(2):
+        for text in ("g1f3", "g8f6", "f3g1", "f6g8"):
+            assert game.status == GameStatus.ONGOING
+            game.play_uci(text)
+    assert game.status == GameStatus.REPETITION
+    assert game.status.is_draw
+    assert '[Result "1/2-1/2"]' in game.to_pgn()
+    game.undo()
+    assert game.status == GameStatus.ONGOING
+
+    game = Game(GameState.from_fen("7k/8/6K1/8/8/8/8/R7 w - - 99 80"))
+    game.play_uci("a1a2")
+    assert game.status == GameStatus.FIFTY_MOVES
+    game.undo()
+    game.play_uci("a1a8")
+    assert game.status == GameStatus.CHECKMATE  # Mate outranks the fifty-move rule
+
+
+def test_computer_move_within_budget():
+    """Test the computer answers within its latency budget."""
+    game = Game(engine_limits=SearchLimits(movetime=0.2))
+    game.play_uci("e2e4")
+    start = time.perf_counter()
+    move = game.computer_move()
+    assert time.perf_counter() - start < 0.8
+    assert game.moves[-1] == move
+    assert game.turn == Color.WHITE
+    assert game.last_search is not None
+
+
+def test_to_pgn():
+    """Test the game so far exports as PGN with its result."""
+    game = Game()
+    for move in ("f2f3", "e7e5", "g2g4", "d8h4"):
+        game.play_uci(move)
+    pgn = game.to_pgn({"Event": "Fool's mate"})
+
+    assert '[Event "Fool\'s mate"]' in pgn
+    assert '[Result "0-1"]' in pgn
+    assert pgn.endswith("1. f3 e5 2. g4 Qh4# 0-1\n")
+
+
+if __name__ == "__main__":
+    test_play_and_undo()
+    test_legal_moves_from()
+    test_status()
+    test_draws()
+    test_computer_move_within_budget()
+    test_to_pgn()
+    print("✅ All game tests passed!")
@@ -0,0 +1,60 @@
+"""Tests for the draw rules."""
+
+from __future__ import annotations
+import sys
+
+sys.path.append("..")
+
+from engine.game_state import GameState
+from game.game_rules import RepetitionTracker, is_fifty_move_draw
+
+
+def test_threefold_repetition():
+    """Test a position is counted each time it recurs."""
+    tracker = RepetitionTracker(1)
+    for key in (2, 3, 4, 1, 2, 3, 4):
+        assert not tracker.is_threefold()
+        tracker.push(key)
+    tracker.push(1)
+    assert tracker.count() == 3
+    assert tracker.is_threefold()
+    assert tracker.pop() == 1
+    assert tracker.count() == 2
+
+
+def test_irreversible_move_starts_a_segment():
+    """Test keys before an irreversible move are set aside, then restored."""
+    tracker = RepetitionTracker(1)
+    tracker.push(2)
+    tracker.push(3, irreversible=True)
+    assert tracker.keys == [3]
+    tracker.push(1)
+    assert tracker.count() == 1  # The earlier 1 can't count any more
+    tracker.pop()
+    tracker.pop()
+    assert tracker.keys == [1, 2]
+    assert tracker.counts[2] == 1
+
+
+def test_pop_past_start():
+    """Test the starting position can't be popped."""
+    tracker = RepetitionTracker(1)
+    try:
+        tracker.pop()
+        assert False, "Should have raised IndexError"
+    except IndexError:
+        pass
+
+
+def test_fifty_move_rule():
+    """Test the draw comes after 100 plies without progress."""
+    assert not is_fifty_move_draw(GameState.from_fen("8/8/8/8/8/8/8/K6k w - - 99 80"))
+    assert is_fifty_move_draw(GameState.from_fen("8/8/8/8/8/8/8/K6k w - - 100 80"))
+
+
+if __name__ == "__main__":
+    test_threefold_repetition()
+    test_irreversible_move_starts_a_segment()
+    test_pop_past_start()
+    test_fifty_move_rule()
+    print("✅ All game rules tests passed!")
@@ -0,0 +1,144 @@
+"""Tests for GameState."""
+
+from __future__ import annotations
+import sys
+
+sys.path.append("..")
+
+from commands.move_executer import MoveExecuter
+from core.coordinate import Coordinate
+from engine.board import WHITE
+from engine.game_state import (
+    STARTING_FEN,
+    CastlingRights,
+    GameState,
+    frozen_from_fen,
+)
+from engine.move_generator import generate_legal_moves
+from engine.perft import REFERENCE_POSITIONS
+
+
+def test_from_fen():
+    """Test parsing FEN fields."""
+    state = GameState.from_fen(
+        "rnbqkbnr/pp1ppppp/8/2p5/4P3/8/PPPP1PPP/RNBQKBNR w Kq c6 0 2"
+    )
+
+    assert state.side_to_move == WHITE
+    assert (
+        state.castling == CastlingRights.WHITE_KINGSIDE | CastlingRights.BLACK_QUEENSIDE
+    )
+    assert state.en_passant_coord == Coordinate.from_str("c6")
+    assert state.fullmove_number == 2
+    assert GameState.from_fen(STARTING_FEN) == GameState.initial()
+
+
+def test_invalid_fen():
+    """Test malformed FEN raises ValueError."""
+    for fen in (
+        "",
+        "8/8/8/8 w - - 0 1",
+        "rnbqkbnr/pppppppp/9/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNX w KQkq - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR x KQkq - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq j9 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - x 1",
+    ):
+        try:
+            GameState.from_fen(fen)
+            assert False, f"Should have raised ValueError: {fen}"
+        except ValueError:
+            pass
+
+
+def test_impossible_positions():
+    """Test well-formed FEN of positions no game can reach raises ValueError."""
+    for fen in (
+        "8/8/8/8/8/8/8/K7 w - - 0 1",  # No black king
+        "k7/8/8/8/8/8/8/8 b - - 0 1",  # No white king
+        "KK6/8/8/8/8/8/8/7k w - - 0 1",  # Two white kings
+        "P7/8/8/8/8/8/8/K6k w - - 0 1",  # Pawn on the last rank
+        "k7/8/8/8/8/8/8/K6p b - - 0 1",  # Pawn on the first rank
+        "4k3/8/8/8/4Q3/8/8/4K3 w - - 0 1",  # Black, not to move, in check
+        "4k3/8/8/8/4P3/8/8/4K3 b - e4 0 1",  # En passant on the pawn's square
+        "4k3/8/8/3Pp3/8/8/8/4K3 w - e3 0 1",  # En passant on the wrong side's rank
+        "4k3/8/8/3P4/8/8/8/4K3 w - e6 0 1",  # No pawn that just moved past e6
+        "4k3/8/4n3/3Pp3/8/8/8/4K3 w - e6 0 1",  # The skipped square is occupied
+        "4k3/4n3/8/3Pp3/8/8/8/4K3 w - e6 0 1",  # The pawn's start is occupied
+        "4k3/8/8/8/3p4/8/8/4K3 b - e3 0 1",  # Black to move, no white pawn on e4
+    ):
+        try:
+            GameState.from_fen(fen)
+            assert False, f"Should have raised ValueError: {fen}"
+        except ValueError:
+            pass
+
+
+def test_valid_en_passant():
+    """Test a real double push keeps its en passant square and capture."""
+    state = GameState.from_fen("4k3/8/8/3Pp3/8/8/8/4K3 w - e6 0 2")
+    assert state.en_passant == Coordinate.from_str("e6").index
+    capture = [move for move in generate_legal_moves(state) if move.uci == "d5e6"]
+    executer = MoveExecuter(state)
+    executer.make(capture[0])
+    assert state.to_fen() == "4k3/8/4P3/8/8/8/8/4K3 b - - 0 2"
+    black = GameState.from_fen("4k3/8/8/8/3pP3/8/8/4K3 b - e3 0 1")
+    assert black.en_passant == Coordinate.from_str("e3").index
+
+
+def test_castling_rights_need_king_and_rook():
+    """Test castling rights whose king or rook has moved are dropped."""
+    assert GameState.from_fen("4k3/8/8/8/8/8/8/4K3 w K - 0 1").castling == 0
+    state = GameState.from_fen("r3k3/8/8/8/8/8/8/4K2R w KQkq - 0 1")
+    assert (
+        state.castling == CastlingRights.WHITE_KINGSIDE | CastlingRights.BLACK_QUEENSIDE
+    )
+    assert state.to_fen() == "r3k3/8/8/8/8/8/8/4K2R w Kq - 0 1"
+    # A king off its home square keeps no rights at all
+    assert GameState.from_fen("r6r/4k3/8/8/8/8/8/R3K2R b KQkq - 0 1").castling == (
+        CastlingRights.WHITE_KINGSIDE | CastlingRights.WHITE_QUEENSIDE
+    )
+
+
+def test_to_fen_round_trip():
+    """Test serializing gives back the parsed FEN."""
+    for fen in (*REFERENCE_POSITIONS.values(), "8/8/8/8/k2Pp2Q/8/8/3K4 b - d3 0 1"):
+        assert GameState.from_fen(fen).to_fen() == fen
+    assert GameState.from_fen("8/8/8/8/8/8/8/K6k w - -").to_fen().endswith(" 0 1")
+
+
+def test_cached_fen():
+    """Test cached parsing gives independent states equal to a fresh parse."""
+    fen = REFERENCE_POSITIONS["kiwipete"]
+    frozen_from_fen.cache_clear()
+
+    first = GameState.from_fen(fen, cached=True)
+    second = GameState.from_fen(fen, cached=True)
+    assert frozen_from_fen.cache_info().hits == 1
+    assert first == second == GameState.from_fen(fen)
+    assert first.zobrist_key == GameState.from_fen(fen).zobrist_key
+
+    # Thawed states don't share a board with the cache
+    first.board.remove(WHITE, 0, 8)
+    assert GameState.from_fen(fen, cached=True) == second
+
+
+def test_freeze_and_thaw():
+    """Test frozen positions are hashable and thaw to an equal state."""
+    state = GameState.initial()
+    frozen = state.freeze()
+    assert hash(frozen) == hash(GameState.initial().freeze())
+    assert frozen.thaw() == state
+    assert frozen.thaw().zobrist_key == state.zobrist_key
+
+
+if __name__ == "__main__":
+    test_from_fen()
+    test_invalid_fen()
+    test_impossible_positions()
+    test_valid_en_passant()
+    test_castling_rights_need_king_and_rook()
+    test_to_fen_round_trip()
+    test_cached_fen()
+    test_freeze_and_thaw()
+    print("✅ All game state tests passed!")
@@ -0,0 +1,112 @@
+"""Tests for the pygame board, run without a display."""
+
+from __future__ import annotations
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.append("..")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+pygame = pytest.importorskip("pygame")
+
+from engine.board import BLACK, WHITE
+from engine.search import SearchLimits
+from game.game import Game
+from interface.gui import BOARD_SIZE, SQUARE_SIZE, ChessGui
+
+
+def _gui(game: Game | None = None, human: int = WHITE) -> ChessGui:
+    pygame.init()
+    screen = pygame.display.set_mode((BOARD_SIZE, BOARD_SIZE))
+    return ChessGui(screen, game or Game(engine_limits=SearchLimits(depth=1)), human)
+
+
+def test_square_coordinates():
+    """Test square_at undoes square_rect on both board orientations."""
+    for human in (WHITE, BLACK):
+        gui = _gui(human=human)
+        for square in range(64):
+            rect = gui.square_rect(square)
+            assert gui.square_at(rect.center) == square
+            assert gui.square_at(rect.topleft) == square
+        assert gui.square_at((-1, 0)) is None
+        assert gui.square_at((BOARD_SIZE, 0)) is None
+    # a1 is bottom left for white and top right for black
+    assert _gui(human=WHITE).square_rect(0).topleft == (0, BOARD_SIZE - SQUARE_SIZE)
+    assert _gui(human=BLACK).square_rect(0).topleft == (BOARD_SIZE - SQUARE_SIZE, 0)
+
+
+def test_selection_targets():
+    """Test a click gathers the piece's moves once and keeps them."""
+    gui = _gui()
+    calls = []
+    legal_moves = gui.game.legal_moves
+
+    def counting():
+        calls.append(1)
+        return legal_moves()
+
+    gui.game.legal_moves = counting
+    gui.click(12)  # e2
+    assert sorted(gui.targets) == [20, 28]
+    for _ in range(5):
+        gui.refresh()
+    assert len(calls) == 1
+    gui.click(1)  # b1
+    assert sorted(gui.targets) == [16, 18]
+    gui.click(1)  # Clicking again deselects
+    assert gui.selected is None and gui.targets == {}
+    gui.click(52)  # Black's pawn can't be selected
+    assert gui.selected is None
+
+
+def test_refresh_redraws_changed_squares():
+    """Test only squares whose look changed are marked dirty after a move."""
+    gui = _gui()
+    gui.refresh()
+    assert len(gui._dirty) == 64
+    gui.flip()
+    gui.refresh()
+    assert gui._dirty == []  # Nothing changed
+
+    gui.click(12)  # e2: the square and its two targets
+    gui.refresh()
+    assert {gui.square_at(rect.topleft) for rect in gui._dirty} == {12, 20, 28}
+    gui.flip()
+
+    gui.click(28)  # e4: the targets clear, e2 and e4 change
+    gui.refresh()
+    assert {gui.square_at(rect.topleft) for rect in gui._dirty} == {12, 20, 28}
+    gui.flip()
+
+    # The reply moves a piece and takes the last-move tint off e2 and e4
+    gui._thinker.join()
+    gui.poll_engine()
+    reply = gui.game.moves[-1]
+    gui.refresh()
+    assert {gui.square_at(rect.topleft) for rect in gui._dirty} == {
+        12,
+        28,
+        reply.from_square,
+        reply.to_square,
+    }
+
+
+def test_stop_engine_is_prompt():
+    """Test closing the window right after a search starts doesn't wait it out."""
+    gui = _gui(Game(engine_limits=SearchLimits(movetime=5.0)), human=BLACK)
+    gui.start_engine()
+    started = time.perf_counter()
+    gui.stop_engine()
+    assert time.perf_counter() - started < 1.0
+    assert not gui.thinking
+
+
+if __name__ == "__main__":
+    test_square_coordinates()
+    test_selection_targets()
+    test_refresh_redraws_changed_squares()
+    test_stop_engine_is_prompt()
+    print("✅ All GUI tests passed!")
@@ -0,0 +1,125 @@
+"""Tests for the game history."""
+
+from __future__ import annotations
+import sys
+
+sys.path.append("..")
+
+import tempfile
+from pathlib import Path
+from commands.history import (
+    ArchiveReader,
+    ArchiveWriter,
+    History,
+    decode_move,
+    encode_move,
+)
+from commands.move import Move
+from engine.game_state import SQUARE_INDEX, GameState
+from engine.move_generator import generate_legal_moves
+
+
+def test_append_pop_and_replay():
+    """Test moves replay from an unchanged starting position."""
+    history = History()
+    history.append(Move(SQUARE_INDEX["e2"], SQUARE_INDEX["e4"], flag=1))
+    history.append(Move(SQUARE_INDEX["g8"], SQUARE_INDEX["f6"]))
+
+    assert len(history) == 2
+    assert history.start == GameState.initial()
+    assert history.san() == ["e4", "Nf6"]
+    assert [state.fullmove_number for state, _ in history.replay()] == [1, 1]
+    assert history.final_state().to_fen() == (
+        "rnbqkb1r/pppppppp/5n2/8/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 1 2"
+    )
+
+    assert history.pop().uci == "g8f6"
+    assert [move.uci for move in history] == ["e2e4"]
+
+
+def test_start_is_copied():
+    """Test later changes to the given state don't affect the history."""
+    state = GameState.from_fen("4k3/8/8/8/8/8/8/4K3 w - - 0 1")
+    history = History(state)
+    state.halfmove_clock = 50
+    assert history.start.halfmove_clock == 0
+
+    try:
+        history.pop()
+        assert False, "Should have raised IndexError"
+    except IndexError:
+        pass
+
+
+def test_encode_every_move_kind():
+    """Test 16-bit codes round-trip normal, special and promotion moves."""
+    for fen in (
+        "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+        "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+        "8/8/8/8/k2Pp2Q/8/8/3K4 b - d3 0 1",
+    ):
+        for move in generate_legal_moves(GameState.from_fen(fen)):
+            code = encode_move(move)
+            assert 0 <= code < 1 << 16
+            assert decode_move(code) == move
+
+
+def test_bytes_round_trip():
+    """Test the binary record keeps the start position and moves."""
+    start = GameState.from_fen("4k3/8/8/8/8/8/8/R3K3 b Q - 0 40")
+    history = History(start, [Move(60, 51), Move(4, 2, None, 3)])
+    data = history.to_bytes()
+    again = History.from_bytes(data)
+
+    assert again.start == start
+    assert again.moves == history.moves
+    assert len(History(moves=history.moves).to_bytes()) == 2 + 4 + 2 * 2
+
+
+def test_archive_random_access():
+    """Test games and single plies are read back by index."""
+    standard = History()
+    for move in generate_legal_moves(GameState.initial())[:1]:
+        standard.append(move)
+    custom = History(GameState.from_fen("4k3/8/8/8/8/8/8/R3K3 b Q - 0 40"))
+    custom.append(Move(60, 51))
+    custom.append(Move(4, 2, None, 3))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "games.bin"
+        with ArchiveWriter(path) as writer:
+            for history in (standard, custom, History()):
+                writer.add(history)
+
+        with ArchiveReader(path) as reader:
+            assert len(reader) == 3
+            assert reader[1].start == custom.start
+            assert reader[1].moves == custom.moves
+            assert reader[-1].moves == []
+            assert reader.ply_count(1) == 2
+            assert reader.move_at(1, 1) == Move(4, 2, None, 3)
+            assert [len(history) for history in reader] == [1, 2, 0]
+            for game, ply in ((3, 0), (1, 2)):
+                try:
+                    reader.move_at(game, ply)
+                    assert False, "Should have raised IndexError"
+                except IndexError:
+                    pass
+
+        archive = path.read_bytes()
+        for data in (b"not an archive" * 4, b"", b"C2HA", archive[:-1], archive[:40]):
+            path.write_bytes(data)
+            try:
+                ArchiveReader(path)
+                assert False, "Should have raised ValueError"
+            except ValueError:
+                pass
+
+
+if __name__ == "__main__":
+    test_append_pop_and_replay()
+    test_start_is_copied()
+    test_encode_every_move_kind()
+    test_bytes_round_trip()
+    test_archive_random_access()
+    print("✅ All history tests passed!")
@@ -0,0 +1,54 @@
+"""Tests for King piece."""
+
+from __future__ import annotations
+import sys
+
+sys.path.append("..")
+
+from core.coordinate import Coordinate
+from core.color import Color
+from pieces.king import King
+from pieces.piece import Piece, PieceType
+
+
+def test_king_creation():
+    """Test creating a king."""
+    king = King(Color.WHITE, Coordinate.from_str("e1"))
+
+    assert king.piece_type == PieceType.KING
+    assert king.symbol == "K"  # White king
+
+
+def test_king_attack_squares():
+    """Test king attacks adjacent squares only."""
+    center_king = King(Color.WHITE, Coordinate.from_str("e4"))
+    assert len(center_king.get_attack_squares({})) == 8
+
+    corner_king = King(Color.WHITE, Coordinate.from_str("a1"))
+    assert corner_king.get_attack_squares({}) == {
+        Coordinate.from_str("a2"),
+        Coordinate.from_str("b1"),
+        Coordinate.from_str("b2"),
+    }
+
+
+def test_king_legal_moves():
+    """Test king can't capture own pieces."""
+    king = King(Color.WHITE, Coordinate.from_str("a1"))
+
+    board_state: dict[Coordinate, Piece] = {
+        Coordinate.from_str("a2"): King(Color.WHITE, Coordinate.from_str("a2")),
+        Coordinate.from_str("b2"): King(Color.BLACK, Coordinate.from_str("b2")),
+    }
+
+    assert king.get_legal_moves(board_state) == {
+        Coordinate.from_str("b1"),
+        Coordinate.from_str("b2"),
+    }
+
+
+if __name__ == "__main__":
+    test_king_creation()
+    test_king_attack_squares()
+    test_king_legal_moves()
+    print("✅ All king tests passed!")
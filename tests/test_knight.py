@@ -0,0 +1,58 @@
+"""Tests for Knight piece."""
+
+from __future__ import annotations
+import sys
+
+sys.path.append("..")
+
+from core.coordinate import Coordinate
+from core.color import Color
+from pieces.knight import Knight
+from pieces.piece import Piece, PieceType
+
+
+def test_knight_creation():
+    """Test creating a knight."""
+    knight = Knight(Color.BLACK, Coordinate.from_str("g8"))
+
+    assert knight.piece_type == PieceType.KNIGHT
+    assert knight.symbol == "n"  # Black knight
+
+
+def test_knight_center():
+    """Test knight jumps from the center."""
+    knight = Knight(Color.WHITE, Coordinate.from_str("e4"))
+
+    expected = {
+        Coordinate.from_str(name)
+        for name in ("d6", "f6", "g5", "g3", "f2", "d2", "c3", "c5")
+    }
+    assert knight.get_attack_squares({}) == expected
+
+
+def test_knight_jumps_over_pieces():
+    """Test knight ignores blocking pieces and can't capture friendly ones."""
+    knight = Knight(Color.WHITE, Coordinate.from_str("b1"))
+
+    board_state: dict[Coordinate, Piece] = {
+        Coordinate.from_str("b2"): Knight(Color.WHITE, Coordinate.from_str("b2")),
+        Coordinate.from_str("d2"): Knight(Color.WHITE, Coordinate.from_str("d2")),
+        Coordinate.from_str("c3"): Knight(Color.BLACK, Coordinate.from_str("c3")),
+    }
+
+    assert knight.get_attack_squares(board_state) == {
+        Coordinate.from_str("a3"),
+        Coordinate.from_str("c3"),
+        Coordinate.from_str("d2"),
+    }
+    assert knight.get_legal_moves(board_state) == {
+        Coordinate.from_str("a3"),
+        Coordinate.from_str("c3"),
+    }
+
+
+if __name__ == "__main__":
+    test_knight_creation()
+    test_knight_center()
+    test_knight_jumps_over_pieces()
+    print("✅ All knight tests passed!")
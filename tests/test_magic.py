@@ -0,0 +1,109 @@
+"""Tests for magic bitboard sliding attacks."""
+
+from __future__ import annotations
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.append("..")
+
+from core import magic
+from core.bitboard import from_coordinates
+from core.color import Color
+from core.coordinate import Coordinate
+from core.direction import Directions
+from pieces.bishop import Bishop
+from pieces.piece import Piece
+from pieces.queen import Queen
+from pieces.rook import Rook
+
+
+def random_occupancies(count: int, seed: int = 7) -> list[int]:
+    """Random boards of varying density."""
+    rng = random.Random(seed)
+    return [
+        (
+            rng.getrandbits(64) & rng.getrandbits(64) & rng.getrandbits(64)
+            if index % 2
+            else rng.getrandbits(64)
+        )
+        for index in range(count)
+    ]
+
+
+def test_magic_matches_ray_walking():
+    """Test table lookups equal the ray-walking fallback on every square."""
+    for occupied in random_occupancies(40):
+        for square in range(64):
+            assert magic.rook_attacks(square, occupied) == magic.ray_attacks(
+                square, occupied, Directions.ORTHOGONAL
+            )
+            assert magic.bishop_attacks(square, occupied) == magic.ray_attacks(
+                square, occupied, Directions.DIAGONAL
+            )
+
+
+def test_pieces_bitboard_matches_attack_squares():
+    """Test piece bitboard attacks agree with get_attack_squares."""
+    for occupied in random_occupancies(10, seed=11):
+        for coord in Coordinate.all():
+            for piece_class in (Rook, Bishop, Queen):
+                piece = piece_class(Color.WHITE, coord)
+                blockers: dict[Coordinate, Piece] = {
+                    other: piece
+                    for other in Coordinate.all()
+                    if occupied >> other.index & 1
+                }
+                assert piece.get_attack_bitboard(occupied) == from_coordinates(
+                    piece.get_attack_squares(blockers)
+                )
+
+
+def test_find_magic():
+    """Test the generator finds a valid magic (bishops are quick to find)."""
+    rng = random.Random(1)
+    square = Coordinate.from_str("c1").index
+    found = magic.find_magic(square, Directions.DIAGONAL, rng)
+
+    # Every occupancy maps to a slot without a conflicting entry
+    assert magic._fill_table(square, found, Directions.DIAGONAL) is not None
+
+
+def test_table_cache_round_trip():
+    """Test tables are written to and read back from the cache file."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache_path = Path(cache_dir) / "magic.bin"
+
+        built = magic.load_tables(cache_path)
+        assert cache_path.exists()
+
+        cached = magic.load_tables(cache_path)
+        assert cached == built
+
+        # A corrupt or truncated cache is rebuilt instead of crashing
+        for contents in (b"garbage", cache_path.read_bytes()[:-8], b""):
+            cache_path.write_bytes(contents)
+            assert magic.load_tables(cache_path) == built
+            assert magic.load_tables(cache_path) == built
+
+
+def test_table_cache_runs_no_code():
+    """Test a planted pickle in the cache location is never executed."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache_path = Path(cache_dir) / "magic.bin"
+        marker = Path(cache_dir) / "ran"
+        cache_path.write_bytes(
+            b"cos\nsystem\n(S'touch " + str(marker).encode() + b"'\ntR."
+        )
+        assert magic.load_tables(cache_path) == magic.load_tables(None)
+        assert not marker.exists()
+
+
+if __name__ == "__main__":
+    test_magic_matches_ray_walking()
+    test_pieces_bitboard_matches_attack_squares()
+    test_find_magic()
+    test_table_cache_round_trip()
+    test_table_cache_runs_no_code()
+    print("✅ All magic bitboard tests passed!")
@@ -0,0 +1,119 @@
+"""Tests for making and unmaking moves in place."""
+
+from __future__ import annotations
+import sys
+from pathlib import Path
+
+sys.path.append("..")
+
+from core.coordinate import Coordinate
+from commands.move import Move, MoveFlag
+from commands.move_executer import MoveExecuter
+from engine.board import BLACK, KING, PAWN, QUEEN, ROOK, WHITE
+from engine.game_state import CastlingRights, GameState
+from engine.move_generator import generate_legal_moves
+from engine.perft import read_perft_suite
+
+SUITE_PATH = Path(__file__).parent / "perftsuite.epd"
+
+
+def find_move(state: GameState, uci: str) -> Move:
+    return next(move for move in generate_legal_moves(state) if move.uci == uci)
+
+
+def square(name: str) -> int:
+    return Coordinate.from_str(name).index
+
+
+def test_make_unmake_restores_every_position():
+    """Test unmake exactly restores the state after every legal move."""
+    for fen, _ in read_perft_suite(SUITE_PATH):
+        state = GameState.from_fen(fen)
+        executer = MoveExecuter(state)
+        for move in generate_legal_moves(state):
+            before = state.copy()
+            executer.make(move)
+            assert state != before
+            assert executer.unmake() == move
+            assert state == before
+
+
+def test_make_updates_state_in_place():
+    """Test en passant square, clocks and castling rights after moves."""
+    state = GameState.initial()
+    board = state.board
+    executer = MoveExecuter(state)
+
+    executer.make(find_move(state, "e2e4"))
+    assert state.board is board  # Same objects, no copies
+    assert state.en_passant == square("e3")
+    assert state.board.piece_at(square("e4")) == (WHITE, PAWN)
+    assert state.side_to_move == BLACK
+
+    executer.make(find_move(state, "g8f6"))
+    assert state.en_passant is None
+    assert state.halfmove_clock == 1
+    assert state.fullmove_number == 2
+
+    executer.make(find_move(state, "e1e2"))
+    assert (
+        state.castling == CastlingRights.BLACK_KINGSIDE | CastlingRights.BLACK_QUEENSIDE
+    )
+    assert executer.ply == 3
+
+    for _ in range(3):
+        executer.unmake()
+    assert state == GameState.initial()
+
+
+def test_special_moves():
+    """Test castling, en passant and promotion move the right pieces."""
+    state = GameState.from_fen("r3k2r/1P6/8/3pP3/8/8/8/R3K2R w KQkq d6 0 1")
+    executer = MoveExecuter(state)
+
+    executer.make(find_move(state, "e1g1"))
+    assert state.board.piece_at(square("g1")) == (WHITE, KING)
+    assert state.board.piece_at(square("f1")) == (WHITE, ROOK)
+    assert state.board.piece_at(square("h1")) is None
+    executer.unmake()
+
+    executer.make(find_move(state, "e5d6"))
+    assert state.board.piece_at(square("d5")) is None
+    executer.unmake()
+    assert state.board.piece_at(square("d5")) == (BLACK, PAWN)
+
+    executer.make(find_move(state, "b7a8q"))
+    assert state.board.piece_at(square("a8")) == (WHITE, QUEEN)
+    assert not state.castling & CastlingRights.BLACK_QUEENSIDE
+    executer.unmake()
+    assert state.board.piece_at(square("b7")) == (WHITE, PAWN)
+    assert state.board.piece_at(square("a8")) == (BLACK, ROOK)
+
+
+def test_unmake_empty_stack():
+    """Test unmaking with no moves made raises IndexError."""
+    try:
+        MoveExecuter(GameState.initial()).unmake()
+        assert False, "Should have raised IndexError"
+    except IndexError:
+        pass
+
+
+def test_move_packing():
+    """Test moves survive packing into an int."""
+    for move in (
+        Move(12, 28, None, MoveFlag.DOUBLE_PUSH),
+        Move(52, 60, QUEEN),
+        Move(4, 6, None, MoveFlag.CASTLE),
+    ):
+        assert Move.unpack(move.packed) == move
+        assert move.packed < 1 << 17
+
+
+if __name__ == "__main__":
+    test_make_unmake_restores_every_position()
+    test_make_updates_state_in_place()
+    test_special_moves()
+    test_unmake_empty_stack()
+    test_move_packing()
+    print("✅ All move executer tests passed!")
@@ -0,0 +1,207 @@
+"""Tests for legal move generation."""
+
+from __future__ import annotations
+import sys
+
+sys.path.append("..")
+
+from core.coordinate import Coordinate
+from core.color import Color
+from commands.move import MoveFlag
+from engine.board import BLACK, QUEEN, WHITE, Board
+from engine.game_state import CastlingRights, GameState
+from engine.move_generator import generate_legal_moves, in_check, legal_moves_from
+from pieces.bishop import Bishop
+from pieces.king import King
+from pieces.knight import Knight
+from pieces.pawn import Pawn
+from pieces.piece import Piece
+from pieces.queen import Queen
+from pieces.rook import Rook
+
+
+def make_state(
+    pieces: list[Piece],
+    side_to_move: int = WHITE,
+    castling: int = CastlingRights.NONE,
+    en_passant: str | None = None,
+) -> GameState:
+    """Build a position from a list of pieces."""
+    board_state: dict[Coordinate, Piece] = {piece.coordinate: piece for piece in pieces}
+    ep_square = Coordinate.from_str(en_passant).index if en_passant else None
+    return GameState(
+        Board.from_board_state(board_state), side_to_move, castling, ep_square
+    )
+
+
+def piece(piece_class: type[Piece], color: Color, coord: str) -> Piece:
+    return piece_class(color, Coordinate.from_str(coord))
+
+
+def uci_moves(state: GameState) -> set[str]:
+    return {move.uci for move in generate_legal_moves(state)}
+
+
+def test_starting_position():
+    """Test the 20 opening moves."""
+    moves = uci_moves(GameState.initial())
+
+    assert len(moves) == 20
+    assert {"e2e4", "e2e3", "g1f3", "b1a3"} <= moves
+
+
+def test_pinned_piece_stays_on_ray():
+    """Test a pinned rook can only slide along the pin."""
+    state = make_state(
+        [
+            piece(King, Color.WHITE, "e1"),
+            piece(Rook, Color.WHITE, "e4"),
+            piece(Rook, Color.BLACK, "e8"),
+            piece(King, Color.BLACK, "a8"),
+        ]
+    )
+
+    rook_moves = {move.uci for move in legal_moves_from(state, 28)}
+    assert rook_moves == {"e4e2", "e4e3", "e4e5", "e4e6", "e4e7", "e4e8"}
+
+
+def test_pinned_knight_cannot_move():
+    """Test a knight pinned to its king has no moves."""
+    state = make_state(
+        [
+            piece(King, Color.WHITE, "e1"),
+            piece(Knight, Color.WHITE, "d2"),
+            piece(Bishop, Color.BLACK, "a5"),
+            piece(King, Color.BLACK, "h8"),
+        ]
+    )
+
+    assert legal_moves_from(state, Coordinate.from_str("d2").index) == []
+
+
+def test_check_must_be_answered():
+    """Test only blocks, captures of the checker and king moves are allowed."""
+    state = make_state(
+        [
+            piece(King, Color.WHITE, "e1"),
+            piece(Rook, Color.WHITE, "a2"),
+            piece(Bishop, Color.WHITE, "c1"),
+            piece(Queen, Color.BLACK, "e5"),
+            piece(King, Color.BLACK, "h8"),
+        ]
+    )
+
+    assert in_check(state)
+    assert uci_moves(state) == {
+        # King steps off the file
+        "e1d1",
+        "e1d2",
+        "e1f1",
+        "e1f2",
+        # Interpose
+        "a2e2",
+        "c1e3",
+    }
+
+
+def test_double_check_only_king_moves():
+    """Test double check leaves only king moves."""
+    state = make_state(
+        [
+            piece(King, Color.WHITE, "e1"),
+            piece(Queen, Color.WHITE, "a4"),
+            piece(Rook, Color.BLACK, "e8"),
+            piece(Knight, Color.BLACK, "d3"),
+            piece(King, Color.BLACK, "h8"),
+        ]
+    )
+
+    assert all(move.from_square == 4 for move in generate_legal_moves(state))
+
+
+def test_castling():
+    """Test castling rights, blockers and attacked transit squares."""
+    pieces = [
+        piece(King, Color.WHITE, "e1"),
+        piece(Rook, Color.WHITE, "a1"),
+        piece(Rook, Color.WHITE, "h1"),
+        piece(King, Color.BLACK, "e8"),
+    ]
+
+    state = make_state(pieces, castling=CastlingRights.ALL)
+    castles = {
+        move.uci for move in generate_legal_moves(state) if move.flag == MoveFlag.CASTLE
+    }
+    assert castles == {"e1g1", "e1c1"}
+
+    # Without rights: no castling
+    state = make_state(pieces, castling=CastlingRights.NONE)
+    assert "e1g1" not in uci_moves(state)
+
+    # f1 attacked: no kingside castling
+    state = make_state(
+        pieces + [piece(Rook, Color.BLACK, "f8")], castling=CastlingRights.ALL
+    )
+    moves = uci_moves(state)
+    assert "e1g1" not in moves
+    assert "e1c1" in moves
+
+
+def test_en_passant():
+    """Test en passant capture, including the rank-pin edge case."""
+    state = make_state(
+        [
+            piece(King, Color.WHITE, "e1"),
+            piece(Pawn, Color.WHITE, "e5"),
+            piece(Pawn, Color.BLACK, "d5"),
+            piece(King, Color.BLACK, "e8"),
+        ],
+        en_passant="d6",
+    )
+    en_passant = [
+        move for move in generate_legal_moves(state) if move.flag == MoveFlag.EN_PASSANT
+    ]
+    assert [move.uci for move in en_passant] == ["e5d6"]
+
+    # Capturing would expose the king along the rank
+    state = make_state(
+        [
+            piece(King, Color.WHITE, "a5"),
+            piece(Pawn, Color.WHITE, "e5"),
+            piece(Pawn, Color.BLACK, "d5"),
+            piece(Rook, Color.BLACK, "h5"),
+            piece(King, Color.BLACK, "e8"),
+        ],
+        en_passant="d6",
+    )
+    assert "e5d6" not in uci_moves(state)
+
+
+def test_promotion():
+    """Test pawns reaching the last rank promote to each piece."""
+    state = make_state(
+        [
+            piece(King, Color.BLACK, "e8"),
+            piece(Pawn, Color.BLACK, "b2"),
+            piece(Rook, Color.WHITE, "a1"),
+            piece(King, Color.WHITE, "h3"),
+        ],
+        side_to_move=BLACK,
+    )
+
+    pawn_moves = legal_moves_from(state, Coordinate.from_str("b2").index)
+    assert len(pawn_moves) == 8  # Push and capture, four pieces each
+    assert {move.uci for move in pawn_moves} >= {"b2b1q", "b2a1n"}
+    assert any(move.promotion == QUEEN for move in pawn_moves)
+
+
+if __name__ == "__main__":
+    test_starting_position()
+    test_pinned_piece_stays_on_ray()
+    test_pinned_knight_cannot_move()
+    test_check_must_be_answered()
+    test_double_check_only_king_moves()
+    test_castling()
+    test_en_passant()
+    test_promotion()
+    print("✅ All move generator tests passed!")
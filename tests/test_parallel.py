@@ -0,0 +1,64 @@
+"""Tests for the Lazy SMP parallel search."""
+
+from __future__ import annotations
+import sys
+
+sys.path.append("..")
+
+from engine.game_state import GameState
+from engine.move_generator import generate_legal_moves
+from engine.parallel import default_workers, parallel_search
+from engine.search import MATE_SCORE, SearchLimits
+
+
+def test_finds_mate_with_helpers():
+    """Test helpers and the main search agree on a forced mate."""
+    state = GameState.from_fen("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+    result = parallel_search(state, SearchLimits(depth=3), workers=3, table_mb=1)
+    assert result.best_move is not None
+    assert result.best_move.uci == "a1a8"
+    assert result.score == MATE_SCORE - 1
+
+
+def test_merges_node_counts():
+    """Test the reported nodes cover all processes and stay within budget."""
+    state = GameState.initial()
+    result = parallel_search(state, SearchLimits(nodes=3000), workers=2, table_mb=1)
+    assert result.best_move in generate_legal_moves(state)
+    assert 0 < result.nodes <= 3000 + 2 * 1024
+
+
+def test_errors_pass_through():
+    """Test an error in the main search isn't hidden by the shared-memory cleanup."""
+
+    def fail(result):
+        raise RuntimeError("callback failed")
+
+    try:
+        parallel_search(
+            GameState.initial(),
+            SearchLimits(depth=2),
+            workers=2,
+            table_mb=1,
+            on_iteration=fail,
+        )
+        assert False, "Should have raised RuntimeError"
+    except RuntimeError as error:
+        assert str(error) == "callback failed"
+
+
+def test_single_worker():
+    """Test one worker searches in process."""
+    result = parallel_search(
+        GameState.initial(), SearchLimits(depth=2), workers=1, table_mb=1
+    )
+    assert result.depth == 2
+    assert default_workers() >= 1
+
+
+if __name__ == "__main__":
+    test_finds_mate_with_helpers()
+    test_merges_node_counts()
+    test_errors_pass_through()
+    test_single_worker()
+    print("✅ All parallel search tests passed!")
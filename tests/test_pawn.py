@@ -0,0 +1,75 @@
+"""Tests for Pawn piece."""
+
+from __future__ import annotations
+import sys
+
+sys.path.append("..")
+
+from core.coordinate import Coordinate
+from core.color import Color
+from pieces.pawn import Pawn
+from pieces.piece import Piece, PieceType
+
+
+def test_pawn_creation():
+    """Test creating a pawn."""
+    pawn = Pawn(Color.BLACK, Coordinate.from_str("e7"))
+
+    assert pawn.piece_type == PieceType.PAWN
+    assert pawn.symbol == "p"  # Black pawn
+
+
+def test_pawn_attack_squares():
+    """Test pawns attack diagonally forward for their color."""
+    white_pawn = Pawn(Color.WHITE, Coordinate.from_str("e4"))
+    assert white_pawn.get_attack_squares({}) == {
+        Coordinate.from_str("d5"),
+        Coordinate.from_str("f5"),
+    }
+
+    black_pawn = Pawn(Color.BLACK, Coordinate.from_str("a5"))
+    assert black_pawn.get_attack_squares({}) == {Coordinate.from_str("b4")}
+
+
+def test_pawn_pushes():
+    """Test single and double pushes."""
+    pawn = Pawn(Color.WHITE, Coordinate.from_str("e2"))
+    assert pawn.get_legal_moves({}) == {
+        Coordinate.from_str("e3"),
+        Coordinate.from_str("e4"),
+    }
+
+    # Blocked two squares ahead: only the single push
+    board_state: dict[Coordinate, Piece] = {
+        Coordinate.from_str("e4"): Pawn(Color.BLACK, Coordinate.from_str("e4")),
+    }
+    assert pawn.get_legal_moves(board_state) == {Coordinate.from_str("e3")}
+
+    # Blocked directly ahead: no pushes at all
+    board_state = {
+        Coordinate.from_str("e3"): Pawn(Color.BLACK, Coordinate.from_str("e3")),
+    }
+    assert pawn.get_legal_moves(board_state) == set()
+
+
+def test_pawn_captures():
+    """Test pawns capture enemy pieces only."""
+    pawn = Pawn(Color.BLACK, Coordinate.from_str("d5"))
+
+    board_state: dict[Coordinate, Piece] = {
+        Coordinate.from_str("c4"): Pawn(Color.WHITE, Coordinate.from_str("c4")),
+        Coordinate.from_str("e4"): Pawn(Color.BLACK, Coordinate.from_str("e4")),
+    }
+
+    assert pawn.get_legal_moves(board_state) == {
+        Coordinate.from_str("c4"),
+        Coordinate.from_str("d4"),
+    }
+
+
+if __name__ == "__main__":
+    test_pawn_creation()
+    test_pawn_attack_squares()
+    test_pawn_pushes()
+    test_pawn_captures()
+    print("✅ All pawn tests passed!")
@@ -0,0 +1,61 @@
+"""Tests for perft against reference node counts."""
+
+from __future__ import annotations
+import sys
+from pathlib import Path
+
+sys.path.append("..")
+
+from engine.game_state import STARTING_FEN, GameState
+from engine.perft import REFERENCE_POSITIONS, divide, read_perft_suite, run_perft
+
+SUITE_PATH = Path(__file__).parent / "perftsuite.epd"
+
+# Keep the regular test run quick; deeper counts are for `main.py perft --suite`
+MAX_TEST_NODES = 10_000
+
+
+def test_perft_suite():
+    """Test every suite position up to a modest node count."""
+    checked = 0
+    for fen, expected in read_perft_suite(SUITE_PATH):
+        state = GameState.from_fen(fen)
+        for depth, nodes in sorted(expected.items()):
+            if nodes > MAX_TEST_NODES:
+                break
+            assert run_perft(state, depth).nodes == nodes, f"depth {depth}: {fen}"
+            checked += 1
+    assert checked > 20
+
+
+def test_reference_positions_in_suite():
+    """Test the CLI reference positions all have expected counts."""
+    suite_fens = {fen for fen, _ in read_perft_suite(SUITE_PATH)}
+    assert set(REFERENCE_POSITIONS.values()) <= suite_fens
+
+
+def test_divide():
+    """Test the per-move breakdown sums to the total."""
+    counts = divide(GameState.from_fen(STARTING_FEN), 2)
+
+    assert len(counts) == 20
+    assert counts["e2e4"] == 20
+    assert sum(counts.values()) == 400
+
+
+def test_perft_result_timing():
+    """Test timing fields are filled in."""
+    result = run_perft(GameState.initial(), 2, split=True)
+
+    assert result.nodes == 400
+    assert result.seconds >= 0
+    assert result.nodes_per_second >= 0
+    assert len(result.divide) == 20
+
+
+if __name__ == "__main__":
+    test_perft_suite()
+    test_reference_positions_in_suite()
+    test_divide()
+    test_perft_result_timing()
+    print("✅ All perft tests passed!")
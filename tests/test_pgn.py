@@ -0,0 +1,93 @@
+"""Tests for PGN reading and writing."""
+
+from __future__ import annotations
+import io
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.append("..")
+
+from commands.pgn import iter_game_texts, parse_game, read_games, write_games
+
+OPERA_GAME = """[Event "Paris"]
+[Site "Paris FRA"]
+[Date "1858.??.??"]
+[Round "?"]
+[White "Paul Morphy"]
+[Black "Duke Karl / Count Isouard"]
+[Result "1-0"]
+
+1. e4 e5 2. Nf3 d6 3. d4 Bg4 {This is a weak move
+already.} 4. dxe5 Bxf3 5. Qxf3 dxe5 6. Bc4 Nf6 7. Qb3 Qe7 8. Nc3 c6 9. Bg5 b5
+10. Nxb5 cxb5 11. Bxb5+ Nbd7 12. O-O-O Rd8 13. Rxd7 Rxd7 14. Rd1 Qe6
+(14... Qb4 $2 15. Bxd7+ (15. Qxb4) Nxd7) 15. Bxd7+ Nxd7 16. Qb8+ Nxb8 17. Rd8# 1-0
+"""
+
+FROM_POSITION = """[Event "Study"]
+[SetUp "1"]
+[FEN "4k3/8/8/8/8/8/8/R3K3 b Q - 0 40"]
+
+40... Kd7 41. O-O-O+ *
+"""
+
+BROKEN = """[Event "Broken"]
+
+1. e4 e5 2. Ke3 Nc6 *
+"""
+
+
+def test_parse_game():
+    """Test headers, moves, comments, variations and results."""
+    game = parse_game(OPERA_GAME)
+    assert game.error is None
+    assert game.headers["White"] == "Paul Morphy"
+    assert game.result == "1-0"
+    assert len(game.history) == 33
+    assert game.history.san()[-3:] == ["Qb8+", "Nxb8", "Rd8#"]
+
+
+def test_split_games_from_stream():
+    """Test a stream is split into games, including multi-line comments."""
+    stream = io.StringIO(OPERA_GAME + "\n" + FROM_POSITION + "\n" + BROKEN)
+    texts = list(iter_game_texts(stream))
+    assert len(texts) == 3
+    assert texts[0].startswith('[Event "Paris"]')
+
+
+def test_set_up_position_and_errors():
+    """Test FEN starting positions and illegal moves."""
+    study, broken = read_games(io.StringIO(FROM_POSITION + BROKEN))
+    assert study.error is None
+    assert [move.uci for move in study.history] == ["e8d7", "e1c1"]
+
+    assert broken.error is not None and "Ke3" in broken.error
+    assert len(broken.history) == 2
+
+
+def test_write_and_read_back():
+    """Test written PGN reads back to the same games."""
+    games = list(read_games(io.StringIO(OPERA_GAME + "\n" + FROM_POSITION)))
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "games.pgn"
+        with open(path, "w", encoding="utf-8") as file:
+            assert write_games(games, file) == 2
+        again = list(read_games(path))
+
+    for original, copy in zip(games, again):
+        assert copy.history.moves == original.history.moves
+        assert copy.history.start == original.history.start
+        assert copy.headers["Result"] == original.result
+
+    text = games[1].to_pgn()
+    assert '[FEN "4k3/8/8/8/8/8/8/R3K3 b Q - 0 40"]' in text
+    assert "40... Kd7 41. O-O-O+ *" in text
+    assert all(len(line) <= 80 for line in games[0].to_pgn().splitlines())
+
+
+if __name__ == "__main__":
+    test_parse_game()
+    test_split_games_from_stream()
+    test_set_up_position_and_errors()
+    test_write_and_read_back()
+    print("✅ All PGN tests passed!")
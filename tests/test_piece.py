@@ -7,6 +7,8 @@ sys.path.append("..")
 
 from core.coordinate import Coordinate
 from core.color import Color
+from pieces.knight import Knight
+from pieces.pawn import Pawn
 from pieces.piece import Piece, PieceType
 
 
@@ -81,10 +83,23 @@ def test_legal_moves_basic():
     assert Coordinate.from_str("e5") in legal_moves
 
 
+def test_pieces_are_slotted():
+    """Test concrete pieces carry no per-instance __dict__."""
+    for piece_class in (Knight, Pawn):
+        piece = piece_class(Color.WHITE, Coordinate.from_str("b1"))
+        assert not hasattr(piece, "__dict__")
+        try:
+            piece.nickname = "x"
+            assert False, "Should have raised AttributeError"
+        except AttributeError:
+            pass
+
+
 if __name__ == "__main__":
     test_piece_creation()
     test_piece_symbol()
     test_piece_moved()
     test_piece_equality()
     test_legal_moves_basic()
+    test_pieces_are_slotted()
     print("✅ All piece base tests passed!")
@@ -0,0 +1,42 @@
+"""Tests for Polyglot hashing."""
+
+from __future__ import annotations
+import sys
+
+sys.path.append("..")
+
+from commands.move import Move, MoveFlag
+from engine.board import QUEEN
+from engine.game_state import GameState
+from engine.polyglot import polyglot_key, polyglot_move
+
+
+def test_reference_keys():
+    """Test the keys published with the Polyglot book format."""
+    keys: dict[str, int] = {
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1": 0x463B96181691FC9C,
+        "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1": 0x823C9B50FD114196,
+        "rnbqkbnr/ppp1pppp/8/3p4/4P3/8/PPPP1PPP/RNBQKBNR w KQkq d6 0 2": 0x0756B94461C50FB0,
+        "rnbqkbnr/ppp1pppp/8/3pP3/8/8/PPPP1PPP/RNBQKBNR b KQkq - 0 2": 0x662FAFB965DB29D4,
+        "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3": 0x22A48B5A8E47FF78,
+        "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPPKPPP/RNBQ1BNR b kq - 0 3": 0x652A607CA3F242C1,
+        "rnbq1bnr/ppp1pkpp/8/3pPp2/8/8/PPPPKPPP/RNBQ1BNR w - - 0 4": 0x00FDD303C946BDD9,
+        "rnbqkbnr/p1pppppp/8/8/PpP4P/8/1P1PPPP1/RNBQKBNR b KQkq c3 0 3": 0x3C8123EA7B067637,
+        "rnbqkbnr/p1pppppp/8/8/P6P/R1p5/1P1PPPP1/1NBQKBNR b Kkq - 0 4": 0x5C3F9B829B279560,
+    }
+    for fen, key in keys.items():
+        assert polyglot_key(GameState.from_fen(fen)) == key, fen
+
+
+def test_move_encoding():
+    """Test castling is written as king takes rook and promotions by piece."""
+    assert polyglot_move(Move(4, 6, flag=MoveFlag.CASTLE)) == 7 | 4 << 6
+    assert polyglot_move(Move(60, 58, flag=MoveFlag.CASTLE)) == 56 | 60 << 6
+    assert polyglot_move(Move(52, 60, QUEEN)) == 60 | 52 << 6 | 4 << 12
+    assert polyglot_move(Move(12, 28, flag=MoveFlag.DOUBLE_PUSH)) == 28 | 12 << 6
+
+
+if __name__ == "__main__":
+    test_reference_keys()
+    test_move_encoding()
+    print("✅ All polyglot tests passed!")
@@ -0,0 +1,61 @@
+"""Tests for Queen piece."""
+
+from __future__ import annotations
+import sys
+
+sys.path.append("..")
+
+from core.coordinate import Coordinate
+from core.color import Color
+from pieces.bishop import Bishop
+from pieces.queen import Queen
+from pieces.rook import Rook
+from pieces.piece import Piece, PieceType
+
+
+def test_queen_creation():
+    """Test creating a queen."""
+    queen = Queen(Color.WHITE, Coordinate.from_str("d1"))
+
+    assert queen.piece_type == PieceType.QUEEN
+    assert queen.symbol == "Q"  # White queen
+
+
+def test_queen_empty_board():
+    """Test queen covers rook and bishop squares combined."""
+    coord = Coordinate.from_str("d4")
+    queen = Queen(Color.WHITE, coord)
+
+    expected = Rook(Color.WHITE, coord).get_attack_squares({}) | Bishop(
+        Color.WHITE, coord
+    ).get_attack_squares({})
+
+    assert queen.get_attack_squares({}) == expected
+    assert len(expected) == 27
+
+
+def test_queen_blocked_by_pieces():
+    """Test queen rays stop at the first piece."""
+    queen = Queen(Color.WHITE, Coordinate.from_str("d4"))
+
+    board_state: dict[Coordinate, Piece] = {
+        Coordinate.from_str("d6"): Rook(Color.BLACK, Coordinate.from_str("d6")),
+        Coordinate.from_str("f6"): Rook(Color.WHITE, Coordinate.from_str("f6")),
+    }
+
+    attack_squares = queen.get_attack_squares(board_state)
+    assert Coordinate.from_str("d6") in attack_squares
+    assert Coordinate.from_str("d7") not in attack_squares
+    assert Coordinate.from_str("f6") in attack_squares
+    assert Coordinate.from_str("g7") not in attack_squares
+
+    legal_moves = queen.get_legal_moves(board_state)
+    assert Coordinate.from_str("d6") in legal_moves
+    assert Coordinate.from_str("f6") not in legal_moves
+
+
+if __name__ == "__main__":
+    test_queen_creation()
+    test_queen_empty_board()
+    test_queen_blocked_by_pieces()
+    print("✅ All queen tests passed!")
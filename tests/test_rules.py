@@ -0,0 +1,64 @@
+"""Tests for attack maps."""
+
+from __future__ import annotations
+import sys
+from pathlib import Path
+
+sys.path.append("..")
+
+from commands.move_executer import MoveExecuter
+from engine.board import BLACK, KING, WHITE
+from engine.game_state import SQUARE_INDEX, GameState
+from engine.move_generator import attackers_to, generate_legal_moves
+from engine.perft import read_perft_suite
+from engine.rules import attack_map, compute_attack_map, is_attacked, is_check
+
+SUITE_PATH = Path(__file__).parent / "perftsuite.epd"
+
+
+def test_matches_square_by_square_attackers():
+    """Test the map equals asking attackers_to about every square."""
+    for fen, _ in read_perft_suite(SUITE_PATH):
+        board = GameState.from_fen(fen).board
+        for color in (WHITE, BLACK):
+            occupied = board.occupied & ~board.pieces[color ^ 1][KING]
+            expected = 0
+            for square in range(64):
+                if attackers_to(board, square, color, occupied):
+                    expected |= 1 << square
+            assert compute_attack_map(board, color) == expected, fen
+
+
+def test_cached_per_position():
+    """Test maps are cleared by make and restored by unmake."""
+    state = GameState.initial()
+    assert state.attack_maps == (None, None)
+    white_map = attack_map(state, WHITE)
+    assert state.attack_maps == (white_map, None)
+
+    executer = MoveExecuter(state)
+    executer.make(generate_legal_moves(state)[0])
+    assert state.attack_maps == (None, None)
+    attack_map(state, BLACK)
+    executer.unmake()
+    assert state.attack_maps == (white_map, None)
+
+
+def test_queries():
+    """Test square and check queries, including through the king."""
+    state = GameState.from_fen("4k3/8/8/8/8/8/4K3/r7 w - - 0 1")
+    assert is_attacked(state, SQUARE_INDEX["h1"], BLACK)
+    assert not is_attacked(state, SQUARE_INDEX["h2"], BLACK)
+    assert not is_check(state)
+
+    checked = GameState.from_fen("4k3/8/8/8/8/8/8/r3K3 w - - 0 1")
+    assert is_check(checked)
+    # The king can't step away along the rook's line
+    assert is_attacked(checked, SQUARE_INDEX["f1"], BLACK)
+
+
+if __name__ == "__main__":
+    test_matches_square_by_square_attackers()
+    test_cached_per_position()
+    test_queries()
+    print("✅ All attack map tests passed!")
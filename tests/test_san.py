@@ -0,0 +1,82 @@
+"""Tests for Standard Algebraic Notation."""
+
+from __future__ import annotations
+import sys
+
+sys.path.append("..")
+
+from commands.move import Move, MoveFlag
+from commands.san import move_to_san, parse_san
+from engine.board import KNIGHT, QUEEN
+from engine.game_state import SQUARE_INDEX, GameState
+from engine.move_generator import generate_legal_moves
+
+
+def square(name: str) -> int:
+    return SQUARE_INDEX[name]
+
+
+def test_round_trip_every_legal_move():
+    """Test each legal move's SAN parses back to that move."""
+    for fen in (
+        "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+        "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+        "8/8/8/8/k2Pp2Q/8/8/3K4 b - d3 0 1",
+    ):
+        state = GameState.from_fen(fen)
+        moves = generate_legal_moves(state)
+        names = {move_to_san(state, move, moves) for move in moves}
+        assert len(names) == len(moves)
+        for move in moves:
+            assert parse_san(state, move_to_san(state, move)) == move
+
+
+def test_disambiguation():
+    """Test file, rank and full-square disambiguation."""
+    state = GameState.from_fen("4k3/8/8/8/8/1N6/8/1N3N1K w - - 0 1")
+    moves = generate_legal_moves(state)
+    assert move_to_san(state, Move(square("f1"), square("d2")), moves) == "Nfd2"
+    assert move_to_san(state, Move(square("b3"), square("d2")), moves) == "N3d2"
+    assert move_to_san(state, Move(square("b1"), square("d2")), moves) == "Nb1d2"
+    assert move_to_san(state, Move(square("b1"), square("c3")), moves) == "Nc3"
+    assert parse_san(state, "Nb1d2") == Move(square("b1"), square("d2"))
+    assert parse_san(state, "N3d2") == Move(square("b3"), square("d2"))
+
+    try:
+        parse_san(state, "Nd2")
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+
+def test_special_moves():
+    """Test castling, promotion, en passant and mate suffixes."""
+    state = GameState.from_fen("r3k3/1P6/8/3pP3/8/8/8/R3K2R w KQq d6 0 1")
+    assert parse_san(state, "O-O").flag == MoveFlag.CASTLE
+    assert parse_san(state, "0-0-0").to_square == square("c1")
+    assert parse_san(state, "exd6").flag == MoveFlag.EN_PASSANT
+    assert parse_san(state, "bxa8=N").promotion == KNIGHT
+    assert parse_san(state, "b8Q+").promotion == QUEEN
+    assert move_to_san(state, Move(square("b7"), square("a8"), QUEEN)) == "bxa8=Q+"
+
+    mate = GameState.from_fen("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+    assert move_to_san(mate, Move(square("a1"), square("a8"))) == "Ra8#"
+
+
+def test_invalid_san():
+    """Test unreadable and illegal SAN raise ValueError."""
+    state = GameState.initial()
+    for text in ("e5", "Nf4", "Zz9", "O-O", ""):
+        try:
+            parse_san(state, text)
+            assert False, f"Should have raised ValueError: {text}"
+        except ValueError:
+            pass
+
+
+if __name__ == "__main__":
+    test_round_trip_every_legal_move()
+    test_disambiguation()
+    test_special_moves()
+    test_invalid_san()
+    print("✅ All SAN tests passed!")
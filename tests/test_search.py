@@ -0,0 +1,132 @@
+"""Tests for the alpha-beta search."""
+
+from __future__ import annotations
+import sys
+import time
+
+sys.path.append("..")
+
+from engine.game_state import GameState
+from engine.evaluation import evaluate
+from engine.search import DEFAULT_DEPTH, MATE_SCORE, Searcher, SearchLimits, search
+
+
+def test_finds_mate_in_one():
+    """Test a back-rank mate is found and scored as mate."""
+    state = GameState.from_fen("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+    result = search(state, SearchLimits(depth=3))
+    assert result.best_move is not None
+    assert result.best_move.uci == "a1a8"
+    assert result.score == MATE_SCORE - 1
+    assert result.mate_in == 1
+
+
+def test_captures_hanging_queen():
+    """Test free material is taken."""
+    state = GameState.from_fen("4k3/8/8/3q4/8/8/3R4/4K3 w - - 0 1")
+    result = search(state, SearchLimits(depth=2))
+    assert result.best_move is not None
+    assert result.best_move.uci == "d2d5"
+
+
+def test_search_leaves_state_untouched():
+    """Test the searched state is not modified."""
+    state = GameState.initial()
+    before = state.copy()
+    search(state, SearchLimits(depth=3))
+    assert state == before
+    assert state.zobrist_key == before.zobrist_key
+
+
+def test_respects_time_budget():
+    """Test a search returns a legal move close to its movetime."""
+    state = GameState.from_fen(
+        "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+    )
+    start = time.perf_counter()
+    result = search(state, SearchLimits(movetime=0.3))
+    assert time.perf_counter() - start < 1.0
+    assert result.best_move is not None
+    assert result.depth >= 1
+
+
+def test_node_budget_and_iteration_callback():
+    """Test the node limit stops deepening and each iteration is reported."""
+    depths = []
+    result = Searcher().search(
+        GameState.initial(),
+        SearchLimits(nodes=2000),
+        on_iteration=lambda info: depths.append(info.depth),
+    )
+    assert depths == list(range(1, result.depth + 1))
+    assert result.nodes < 2000 + 1024
+
+
+def test_repetition_scores_as_draw():
+    """Test a side that is lost takes a perpetual-style repetition."""
+    state = GameState.from_fen("7k/8/8/8/8/8/8/K7 w - - 0 1")
+    result = search(state, SearchLimits(depth=2), [state.zobrist_key] * 3)
+    assert result.score == 0
+
+
+def test_no_moves():
+    """Test checkmated and stalemated roots have no best move."""
+    mated = GameState.from_fen("R5k1/5ppp/8/8/8/8/8/6K1 b - - 0 1")
+    result = search(mated, SearchLimits(depth=2))
+    assert result.best_move is None
+    assert result.score == -MATE_SCORE
+
+    stalemate = GameState.from_fen("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1")
+    result = search(stalemate, SearchLimits(depth=2))
+    assert result.best_move is None
+    assert result.score == 0
+
+
+def test_depth_zero_and_default_depth():
+    """Test depth 0 is a quiescence score and no limits means a bounded search."""
+    state = GameState.from_fen("4k3/8/8/3q4/8/8/3R4/4K3 w - - 0 1")
+    result = search(state, SearchLimits(depth=0))
+    assert result.depth == 0
+    assert result.best_move is not None
+    # The queen is attacked and defended by nothing: quiescence sees the capture
+    assert result.score > evaluate(state)
+
+    bare_kings = GameState.from_fen("7k/8/8/8/8/8/8/K7 w - - 0 1")
+    assert search(bare_kings, SearchLimits()).depth == DEFAULT_DEPTH
+
+
+def test_stop_before_search():
+    """Test a stop requested before the search starts isn't forgotten."""
+    searcher = Searcher()
+    searcher.stop()
+    started = time.perf_counter()
+    result = searcher.search(GameState.initial(), SearchLimits(movetime=5.0))
+    assert time.perf_counter() - started < 1.0
+    assert result.best_move is not None
+    # The request covered that search only
+    assert searcher.search(GameState.initial(), SearchLimits(depth=2)).depth == 2
+
+
+def test_deadline_before_search():
+    """Test a deadline set before the search starts limits that search only."""
+    searcher = Searcher()
+    searcher.set_deadline(0.2)
+    started = time.perf_counter()
+    result = searcher.search(GameState.initial(), SearchLimits(depth=50))
+    assert time.perf_counter() - started < 1.0
+    assert result.best_move is not None
+    assert searcher.search(GameState.initial(), SearchLimits(depth=3)).depth == 3
+
+
+if __name__ == "__main__":
+    test_finds_mate_in_one()
+    test_captures_hanging_queen()
+    test_search_leaves_state_untouched()
+    test_respects_time_budget()
+    test_node_budget_and_iteration_callback()
+    test_repetition_scores_as_draw()
+    test_no_moves()
+    test_depth_zero_and_default_depth()
+    test_stop_before_search()
+    test_deadline_before_search()
+    print("✅ All search tests passed!")
@@ -0,0 +1,201 @@
+"""Tests for the asyncio game server."""
+
+from __future__ import annotations
+import asyncio
+import json
+import socket
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.append("..")
+
+from engine.search import SearchLimits
+from interface.server import GameServer
+
+STARTING_FEN: str = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+
+class _Client:
+    """Line-delimited JSON client for the tests."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    async def send(self, **request) -> None:
+        self.writer.write(json.dumps(request).encode() + b"\n")
+        await self.writer.drain()
+
+    async def receive(self) -> dict:
+        return json.loads(await self.reader.readline())
+
+    async def ask(self, **request) -> dict:
+        await self.send(**request)
+        return await self.receive()
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+def test_requests():
+    """Test the commands and their errors without a network connection."""
+
+    async def run() -> None:
+        server = GameServer(workers=1, limits=SearchLimits(depth=1))
+        try:
+            created = await server.handle({"id": "a", "cmd": "new"})
+            assert created["ok"] and created["id"] == "a"
+            assert created["fen"] == STARTING_FEN
+            game = created["game"]
+
+            moved = await server.handle({"cmd": "move", "game": game, "move": "e2e4"})
+            assert moved["ok"] and moved["status"] == "ongoing"
+            illegal = await server.handle({"cmd": "move", "game": game, "move": "e2e4"})
+            assert not illegal["ok"] and "Illegal" in illegal["error"]
+
+            reply = await server.handle({"cmd": "go", "game": game})
+            assert reply["ok"] and reply["depth"] == 1
+            state = await server.handle({"cmd": "state", "game": game})
+            assert state["moves"] == ["e2e4", reply["move"]]
+
+            undone = await server.handle({"cmd": "undo", "game": game})
+            assert undone["move"] == reply["move"]
+            assert (await server.handle({"cmd": "go", "game": game, "depth": 0}))[
+                "error"
+            ] == "depth must be a positive number"
+
+            assert (await server.handle({"cmd": "close", "game": game}))["ok"]
+            assert not (await server.handle({"cmd": "state", "game": game}))["ok"]
+            assert not (await server.handle({"cmd": "fly"}))["ok"]
+            assert not (await server.handle({"cmd": "new", "fen": "8/8 w"}))["ok"]
+
+            mated = await server.handle(
+                {"cmd": "new", "fen": "R5k1/5ppp/8/8/8/8/8/6K1 b - - 0 1"}
+            )
+            assert mated["status"] == "checkmate"
+            over = await server.handle({"cmd": "go", "game": mated["game"]})
+            assert over["error"] == "Game is over: checkmate"
+        finally:
+            server.close()
+
+    asyncio.run(run())
+
+
+def test_many_games_over_tcp():
+    """Test pipelined requests on many games share one connection."""
+
+    async def run() -> None:
+        server = GameServer(workers=2, limits=SearchLimits(depth=1), max_games=100)
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        try:
+            client = _Client(*await asyncio.open_connection("127.0.0.1", port))
+            for number in range(40):
+                await client.send(id=number, cmd="new")
+            games = [(await client.receive())["game"] for _ in range(40)]
+
+            # Move and search in every game without waiting for replies
+            for game in games:
+                await client.send(id=f"move {game}", cmd="move", game=game, move="d2d4")
+                await client.send(id=f"go {game}", cmd="go", game=game)
+            replies = {}
+            for _ in range(2 * len(games)):
+                reply = await client.receive()
+                replies[reply["id"]] = reply
+            assert all(reply["ok"] for reply in replies.values())
+            assert all(replies[f"go {game}"]["move"] for game in games)
+
+            # The event loop keeps answering while a search runs
+            await client.send(id="slow", cmd="go", game=games[0], movetime=0.5)
+            assert (await client.ask(id="ping", cmd="ping"))["games"] == 40
+            assert (await client.receive())["id"] == "slow"
+            bad = await client.ask(cmd="new", fen=1)
+            assert not bad["ok"]
+            client.writer.write(b"not json\n")
+            assert not (await client.receive())["ok"]
+            await client.close()
+        finally:
+            listener.close()
+            await listener.wait_closed()
+            server.close()
+
+    asyncio.run(run())
+
+
+def test_every_request_gets_a_reply():
+    """Test impossible positions and unexpected failures are still answered."""
+
+    async def run() -> None:
+        server = GameServer(workers=1, limits=SearchLimits(depth=1))
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        try:
+            client = _Client(*await asyncio.open_connection("127.0.0.1", port))
+            bad = await asyncio.wait_for(
+                client.ask(id=1, cmd="new", fen="P7/8/8/8/8/8/8/K6k w - - 0 1"), 3
+            )
+            assert bad["id"] == 1 and not bad["ok"]
+
+            def broken(game):
+                raise RuntimeError("broken")
+
+            server._position = broken
+            failed = await asyncio.wait_for(client.ask(id=2, cmd="new"), 3)
+            assert failed["id"] == 2 and not failed["ok"]
+            assert "broken" in failed["error"]
+            assert server.sessions == {}  # The failed game wasn't kept
+            await client.close()
+        finally:
+            listener.close()
+            await listener.wait_closed()
+            server.close()
+
+    asyncio.run(run())
+
+
+def test_game_limit():
+    """Test new games are refused once the limit is reached."""
+
+    async def run() -> None:
+        server = GameServer(workers=1, max_games=2)
+        try:
+            for _ in range(2):
+                assert (await server.handle({"cmd": "new"}))["ok"]
+            assert (await server.handle({"cmd": "new"}))["error"] == "Too many games"
+        finally:
+            server.close()
+
+    asyncio.run(run())
+
+
+def test_unix_socket():
+    """Test the server also listens on a Unix socket."""
+    if not hasattr(socket, "AF_UNIX"):
+        return
+
+    async def run() -> None:
+        server = GameServer(workers=1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "chess2.sock"
+            listener = await server.start(path=path)
+            try:
+                client = _Client(*await asyncio.open_unix_connection(str(path)))
+                assert (await client.ask(cmd="ping"))["ok"]
+                await client.close()
+            finally:
+                listener.close()
+                await listener.wait_closed()
+                server.close()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    test_requests()
+    test_many_games_over_tcp()
+    test_every_request_gets_a_reply()
+    test_game_limit()
+    test_unix_socket()
+    print("✅ All server tests passed!")
@@ -0,0 +1,169 @@
+"""Tests for endgame tablebase generation and probing."""
+
+from __future__ import annotations
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.append("..")
+
+from commands.move_executer import MoveExecuter
+from core.bitboard import KING_ATTACKS
+from engine.game_state import GameState
+from engine.move_generator import generate_legal_moves
+from engine.retrograde import generate_tables
+from engine.search import Searcher, SearchLimits
+from engine.tablebase import Tablebase, TablebaseResult
+
+_directory: tempfile.TemporaryDirectory | None = None
+
+
+def _tables() -> Path:
+    """Generate the tables once for the whole module."""
+    global _directory
+    if _directory is None:
+        _directory = tempfile.TemporaryDirectory()
+        generate_tables(_directory.name)
+    return Path(_directory.name)
+
+
+def _best_child(tablebase: Tablebase, state: GameState) -> TablebaseResult:
+    """Minimax over the children's probes, one ply up."""
+    executer = MoveExecuter(state.copy())
+    results: list[TablebaseResult] = []
+    for move in generate_legal_moves(executer.state):
+        executer.make(move)
+        child = tablebase.probe(executer.state)
+        executer.unmake()
+        assert child is not None
+        results.append(TablebaseResult(-child.wdl, child.dtm + 1 if child.wdl else 0))
+    # Win fastest, lose slowest
+    return max(results, key=lambda result: (result.wdl, -result.wdl * result.dtm))
+
+
+def _random_position(rng: random.Random, letter: str) -> GameState | None:
+    """A random legal position with one extra piece, either color strong."""
+    strong_king, weak_king, piece = rng.sample(range(64), 3)
+    if letter == "P" and not 8 <= piece < 56:
+        return None
+    if KING_ATTACKS[strong_king] >> weak_king & 1:
+        return None
+    board: list[str] = ["1"] * 64
+    white_strong: bool = rng.random() < 0.5
+    board[strong_king] = "K" if white_strong else "k"
+    board[weak_king] = "k" if white_strong else "K"
+    board[piece] = letter if white_strong else letter.lower()
+    ranks = ["".join(board[rank * 8 : rank * 8 + 8]) for rank in range(7, -1, -1)]
+    try:
+        return GameState.from_fen(f"{'/'.join(ranks)} {rng.choice('wb')} - - 0 1")
+    except ValueError:
+        return None  # The side not to move is in check
+
+
+def _values(tablebase: Tablebase, name: str) -> list[int]:
+    """Every value of a table, decompressed."""
+    table = tablebase._file(name)
+    raw = b"".join(table.block(number) for number in range(len(table.offsets) - 1))
+    return [value - 256 if value > 127 else value for value in raw]
+
+
+def test_longest_mates():
+    """Test the deepest wins match the known maximum distances to mate."""
+    with Tablebase(_tables()) as tablebase:
+        # Mate in 10, 16 and 28 moves
+        assert max(_values(tablebase, "KQvK")) == 19
+        assert max(_values(tablebase, "KRvK")) == 31
+        assert max(_values(tablebase, "KPvK")) == 55
+
+
+def test_known_positions():
+    """Test textbook results, with either color as the strong side."""
+    with Tablebase(_tables()) as tablebase:
+        # King on the sixth rank in front of its pawn wins whoever moves
+        assert (
+            tablebase.probe_wdl(GameState.from_fen("4k3/8/4K3/4P3/8/8/8/8 w - - 0 1"))
+            == 1
+        )
+        assert (
+            tablebase.probe_wdl(GameState.from_fen("4k3/8/4K3/4P3/8/8/8/8 b - - 0 1"))
+            == -1
+        )
+        # The same ending with colors swapped
+        assert (
+            tablebase.probe_wdl(GameState.from_fen("8/8/8/8/4p3/4k3/8/4K3 b - - 0 1"))
+            == 1
+        )
+        # The defending king blockades the pawn
+        assert (
+            tablebase.probe_wdl(GameState.from_fen("4k3/8/4P3/4K3/8/8/8/8 b - - 0 1"))
+            == 0
+        )
+        assert tablebase.probe(
+            GameState.from_fen("R5k1/8/6K1/8/8/8/8/8 b - - 0 1")
+        ) == (
+            TablebaseResult(-1, 0)  # Already mated
+        )
+        assert tablebase.probe(GameState.from_fen("7k/8/8/8/8/8/8/K6N w - - 0 1")) == (
+            TablebaseResult(0, 0)  # A lone knight can't mate
+        )
+        assert tablebase.probe(GameState.initial()) is None
+
+
+def test_probes_agree_with_children():
+    """Test every probed result follows from its children's results."""
+    rng = random.Random(5)
+    with Tablebase(_tables()) as tablebase:
+        for letter in "QRP":
+            checked = 0
+            while checked < 150:
+                state = _random_position(rng, letter)
+                if state is None:
+                    continue
+                result = tablebase.probe(state)
+                assert result is not None
+                if not generate_legal_moves(state):
+                    continue  # Mate or stalemate, checked above
+                assert result == _best_child(tablebase, state), state.to_fen()
+                checked += 1
+
+
+def test_block_cache_is_bounded():
+    """Test the LRU cache never holds more blocks than allowed."""
+    rng = random.Random(9)
+    with Tablebase(_tables(), cache_blocks=4) as tablebase:
+        for _ in range(200):
+            state = _random_position(rng, "R")
+            if state is not None:
+                tablebase.probe(state)
+            assert len(tablebase._cache) <= 4
+
+
+def test_missing_tables():
+    """Test a directory without tables answers nothing."""
+    with tempfile.TemporaryDirectory() as directory:
+        with Tablebase(directory) as tablebase:
+            assert (
+                tablebase.probe(GameState.from_fen("8/8/8/8/8/8/7k/KR6 w - - 0 1"))
+                is None
+            )
+
+
+def test_search_uses_tablebase():
+    """Test the search plays the fastest mate straight from the tables."""
+    state = GameState.from_fen("8/8/8/8/8/2k5/8/K6R w - - 0 1")
+    with Tablebase(_tables()) as tablebase:
+        expected = tablebase.probe(state)
+        result = Searcher(tablebase=tablebase).search(state, SearchLimits(depth=10))
+        assert result.depth == 1
+        assert result.mate_in == (expected.dtm + 1) // 2
+
+
+if __name__ == "__main__":
+    test_longest_mates()
+    test_known_positions()
+    test_probes_agree_with_children()
+    test_block_cache_is_bounded()
+    test_missing_tables()
+    test_search_uses_tablebase()
+    print("✅ All tablebase tests passed!")
@@ -0,0 +1,128 @@
+"""Tests for the transposition table."""
+
+from __future__ import annotations
+import sys
+
+sys.path.append("..")
+
+from commands.move import Move, MoveFlag
+from engine.board import QUEEN
+from engine.transposition import Bound, TranspositionTable
+
+
+def test_store_and_probe():
+    """Test stored results come back unchanged."""
+    table = TranspositionTable(size_mb=1)
+    move = Move(52, 60, QUEEN)
+
+    assert table.probe(0x1234) is None
+    table.store(0x1234, 7, -250, Bound.LOWER, move)
+
+    entry = table.probe(0x1234)
+    assert entry is not None
+    assert entry.depth == 7
+    assert entry.score == -250
+    assert entry.bound == Bound.LOWER
+    assert entry.move == move
+
+    # Different key mapping to the same bucket is not confused with it
+    assert table.probe(0x1234 + table.bucket_count) is None
+
+
+def test_fixed_size():
+    """Test the table size is set in MB and rounded to a power of two."""
+    table = TranspositionTable(size_mb=1)
+
+    assert table.capacity == 1024 * 1024 // TranspositionTable.ENTRY_BYTES
+    assert table.bucket_count & (table.bucket_count - 1) == 0
+
+    small = TranspositionTable(size_mb=0.01)
+    for key in range(10_000):
+        small.store(key * 7919, 1, key % 100, Bound.EXACT, None)
+    assert small.capacity < 10_000  # Older entries were overwritten, not kept
+
+
+def test_depth_preferred_replacement():
+    """Test deep results survive shallow ones in the same bucket."""
+    table = TranspositionTable(size_mb=0.001)
+    deep, shallow, other = 5, 5 + table.bucket_count, 5 + 2 * table.bucket_count
+
+    table.store(deep, 10, 1, Bound.EXACT, Move(12, 28, None, MoveFlag.DOUBLE_PUSH))
+    table.store(shallow, 2, 2, Bound.EXACT, None)
+    table.store(other, 1, 3, Bound.EXACT, None)
+
+    assert table.probe(deep).depth == 10  # Depth-preferred slot kept
+    assert table.probe(shallow) is None  # Always-replace slot overwritten
+    assert table.probe(other).score == 3
+
+    # One search later the deep entry still beats a much shallower result,
+    # which goes to the always-replace slot in place of the other entry
+    table.new_search()
+    table.store(shallow, 1, 4, Bound.UPPER, None)
+    assert table.probe(deep).depth == 10
+    assert table.probe(shallow).score == 4
+    assert table.probe(other) is None
+
+    # Its age counts against it, so a result a few plies shallower wins
+    table.store(other, 3, 5, Bound.EXACT, None)
+    assert table.probe(deep) is None
+    assert table.probe(other).depth == 3
+    assert table.probe(shallow).score == 4
+
+
+def test_keeps_move_when_restoring_without_one():
+    """Test a fail-low store doesn't erase the known best move."""
+    table = TranspositionTable(size_mb=0.01)
+    move = Move(6, 21)
+
+    table.store(99, 3, 10, Bound.EXACT, move)
+    table.store(99, 4, -5, Bound.UPPER, None)
+
+    assert table.probe(99).move == move
+    assert table.probe(99).depth == 4
+
+
+def test_clear_and_hashfull():
+    """Test usage reporting and clearing."""
+    table = TranspositionTable(size_mb=0.01)
+    assert table.hashfull() == 0
+
+    # Deep results fill the depth-preferred slots, shallow ones the others
+    for key in range(table.bucket_count):
+        table.store(key, 5, 0, Bound.EXACT, None)
+    assert table.hashfull() == 500
+    for key in range(table.bucket_count, 2 * table.bucket_count):
+        table.store(key, 1, 0, Bound.EXACT, None)
+    assert table.hashfull() == 1000
+
+    table.clear()
+    assert table.hashfull() == 0
+    assert table.probe(1) is None
+
+
+def test_external_buffer():
+    """Test the table can live in caller-provided memory."""
+    size = TranspositionTable.size_in_bytes(0.01)
+    buffer = bytearray(size)
+
+    writer = TranspositionTable(size_mb=0.01, buffer=memoryview(buffer))
+    writer.store(42, 3, 17, Bound.EXACT, None)
+
+    reader = TranspositionTable(size_mb=0.01, buffer=memoryview(buffer))
+    assert reader.probe(42).score == 17
+
+    try:
+        TranspositionTable(size_mb=1, buffer=memoryview(buffer))
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+
+if __name__ == "__main__":
+    test_store_and_probe()
+    test_fixed_size()
+    test_depth_preferred_replacement()
+    test_keeps_move_when_restoring_without_one()
+    test_clear_and_hashfull()
+    test_external_buffer()
+    print("✅ All transposition table tests passed!")
@@ -0,0 +1,85 @@
+"""Tests for incremental Zobrist hashing."""
+
+from __future__ import annotations
+import random
+import sys
+from pathlib import Path
+
+sys.path.append("..")
+
+from commands.move import Move
+from commands.move_executer import MoveExecuter
+from engine.game_state import GameState
+from engine.move_generator import generate_legal_moves
+from engine.perft import read_perft_suite
+from engine.zobrist import compute_key
+
+SUITE_PATH = Path(__file__).parent / "perftsuite.epd"
+
+
+def full_key(state: GameState) -> int:
+    return compute_key(
+        state.board, state.side_to_move, state.castling, state.en_passant
+    )
+
+
+def play(state: GameState, executer: MoveExecuter, *ucis: str) -> None:
+    for uci in ucis:
+        move: Move = next(m for m in generate_legal_moves(state) if m.uci == uci)
+        executer.make(move)
+
+
+def test_incremental_key_matches_full_hash():
+    """Test make/unmake keep the key equal to a from-scratch hash."""
+    rng = random.Random(3)
+    for fen, _ in read_perft_suite(SUITE_PATH):
+        state = GameState.from_fen(fen)
+        executer = MoveExecuter(state)
+        keys: list[int] = [state.zobrist_key]
+
+        for _ in range(40):
+            moves = generate_legal_moves(state)
+            if not moves:
+                break
+            executer.make(rng.choice(moves))
+            assert state.zobrist_key == full_key(state)
+            keys.append(state.zobrist_key)
+
+        # Unwinding restores every earlier key
+        while executer.ply:
+            keys.pop()
+            executer.unmake()
+            assert state.zobrist_key == keys[-1]
+
+
+def test_transpositions_share_a_key():
+    """Test different move orders reaching one position hash the same."""
+    first = GameState.initial()
+    play(first, MoveExecuter(first), "g1f3", "g8f6", "b1c3", "b8c6")
+
+    second = GameState.initial()
+    play(second, MoveExecuter(second), "b1c3", "b8c6", "g1f3", "g8f6")
+
+    assert first.zobrist_key == second.zobrist_key
+
+
+def test_key_covers_side_castling_and_en_passant():
+    """Test side to move, castling rights and capturable en passant matter."""
+    base = "r3k2r/8/8/8/3pP3/8/8/R3K2R"
+    white = GameState.from_fen(f"{base} w KQkq - 0 1").zobrist_key
+    black = GameState.from_fen(f"{base} b KQkq - 0 1").zobrist_key
+    no_castling = GameState.from_fen(f"{base} b - - 0 1").zobrist_key
+    en_passant = GameState.from_fen(f"{base} b KQkq e3 0 1").zobrist_key
+
+    assert len({white, black, no_castling, en_passant}) == 4
+
+    # An en passant square nobody can capture on doesn't change the key
+    quiet = GameState.from_fen("4k3/8/8/8/4P3/8/8/4K3 b - e3 0 1").zobrist_key
+    assert quiet == GameState.from_fen("4k3/8/8/8/4P3/8/8/4K3 b - - 0 1").zobrist_key
+
+
+if __name__ == "__main__":
+    test_incremental_key_matches_full_hash()
+    test_transpositions_share_a_key()
+    test_key_covers_side_castling_and_en_passant()
+    print("✅ All zobrist tests passed!")